@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance
+   :platform: Agnostic
+   :synopsis: Timing scripts for the storage, compile and reader paths
+
+Each script can be run on its own, eg. ``python -m examples.performance.section_rendering``
+from the docs folder, and prints a small table of results.
+"""
+
+import time
+
+
+def best_of(function, repeat=3):
+    """best wall clock time of a few calls to function, in seconds"""
+    times = list()
+    for i in range(0, repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.array_cache
+   :platform: Agnostic
+   :synopsis: Open a file from its cached arrays against reading it again
+
+Saves many lines (:py:mod:`examples.performance.mapped_save`) and times
+:py:meth:`pyiges.IGESReader.IGESReader.open_arrays` when it reads the file
+and saves the :py:class:`pyiges.IGESReader.IGESArrayModel` next to it, when
+it maps the saved model, and the SHA-256 of the file that every open pays
+to check the saved model is current.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import best_of, mapped_save
+from pyiges.IGESReader import IGESReader, IGESArrayModel
+
+
+def run(count=1000000):
+    folder = tempfile.mkdtemp()
+    filename = os.path.join(folder, "lines.igs")
+    with contextlib.redirect_stdout(io.StringIO()):
+        mapped_save.scene(count).save(filename)
+    sidecar = filename + IGESArrayModel.Suffix
+
+    print("{} entities, {:,} bytes".format(count, os.path.getsize(filename)))
+    print("{:<28} {:>10}".format("open", "seconds"))
+    with IGESReader(filename) as reader:
+        start = time.perf_counter()
+        reader.open_arrays()
+        print("{:<28} {:>10.3f}".format("read and save", time.perf_counter() - start))
+        print("{:<28} {:>10.3f}".format("cached", best_of(reader.open_arrays)))
+        print("{:<28} {:>10.3f}".format("of which SHA-256",
+                                        best_of(lambda: IGESArrayModel.file_digest(filename))))
+    print("cache {:,} bytes".format(os.path.getsize(sidecar)))
+
+    os.remove(sidecar)
+    os.remove(filename)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.block_splice
+   :platform: Agnostic
+   :synopsis: Add a standard part to many storages, compiled each time or once
+
+Builds a part of splines and lines grouped in a subfigure, then times
+committing it to a number of storages against compiling it once into a
+:py:class:`pyiges.IGESBlock.IGESBlock` and splicing that into them.
+"""
+
+import os
+import sys
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import best_of
+from pyiges.IGESBlock import IGESBlock
+from pyiges.IGESCore import IGEStorage
+from pyiges.IGESGeomLib import IGESGeomLine, IGESGeomPolyline, IGESGroup, IGESPoint
+
+
+def part(count):
+    """generator of the entities of the part, the group comes last"""
+    entities = list()
+    for i in range(0, count):
+        polyline = IGESGeomPolyline()
+        for j in range(0, 20):
+            polyline.AddPoint(IGESPoint(i + j / 20.0, j / 3.0, i / 7.0))
+        line = IGESGeomLine(IGESPoint(i, 0, 0), IGESPoint(i, 5.0, i / 3.0))
+        entities.extend((polyline, line))
+        yield polyline
+        yield line
+    yield IGESGroup("part", *entities)
+
+
+def commit(storages, count):
+    for i in range(0, storages):
+        IGEStorage().commit_many(part(count))
+
+
+def splice(storages, block):
+    for i in range(0, storages):
+        IGEStorage().splice(block)
+
+
+def run(count=2000, storages=20):
+    block = IGESBlock.compile(part(count))
+    print("{} storages of {} entities".format(storages, len(block)))
+    print("{:<28} {:>12}".format("step", "seconds"))
+    for name, step in (("commit every time", lambda: commit(storages, count)),
+                       ("compile the block", lambda: IGESBlock.compile(part(count))),
+                       ("splice the block", lambda: splice(storages, block))):
+        print("{:<28} {:>12.4f}".format(name, best_of(step)))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.compressed_save
+   :platform: Agnostic
+   :synopsis: Wall clock time against bytes written for each compression codec
+
+Saves the scenes of the other performance examples, a large number of
+lines (:py:mod:`examples.performance.mapped_save`) and a large spline
+curve (:py:mod:`examples.performance.parameter_encoder`), plain and with
+every codec of :py:meth:`pyiges.IGESCore.IGEStorage.save` at a fast and a
+small level, and in pyIGES's own compressed layout (:py:mod:`pyiges.IGESCompressed`)
+on its own and with gzip.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import mapped_save, parameter_encoder
+from pyiges.IGESCore import IGEStorage
+
+
+def spline_scene(segments):
+    system = IGEStorage()
+    system.Commit(parameter_encoder.spline(segments))
+    return system
+
+
+def run():
+    folder = tempfile.mkdtemp()
+    print("{:<8} {:<6} {:>6} {:>10} {:>14} {:>8}".format("scene", "codec", "level", "seconds", "bytes", "ratio"))
+    for scene_name, system in (("lines", mapped_save.scene(100000)),
+                               ("spline", spline_scene(20000))):
+        plain = None
+        for codec, suffix, levels, form in ((None, ".igs", (None, ), "fixed"),
+                                            ("gzip", ".igs.gz", (1, 9), "fixed"),
+                                            ("bz2", ".igs.bz2", (1, 9), "fixed"),
+                                            ("lzma", ".igs.xz", (0, 6), "fixed"),
+                                            ("C", ".igs", (None, ), "compressed"),
+                                            ("C+gzip", ".igs.gz", (1, ), "compressed")):
+            for level in levels:
+                filename = os.path.join(folder, scene_name + suffix)
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    system.save(filename, compresslevel=level, form=form)
+                seconds = time.perf_counter() - start
+                size = os.path.getsize(filename)
+                plain = plain or size
+                print("{:<8} {:<6} {:>6} {:>10.3f} {:>14,} {:>8.1f}".format(
+                    scene_name, codec or "none", "" if level is None else level,
+                    seconds, size, plain / size))
+                os.remove(filename)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    run()
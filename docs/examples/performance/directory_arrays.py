@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.directory_arrays
+   :platform: Agnostic
+   :synopsis: Parse the directory section into numpy columns at once
+
+Saves a million lines (:py:mod:`examples.performance.mapped_save`) and times
+:py:meth:`pyiges.IGESReader.IGESReader.read_directory` against reading the
+same entries one by one with
+:py:meth:`pyiges.IGESReader.IGESReader.directory`.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import best_of, mapped_save
+from pyiges.IGESReader import IGESReader
+
+
+def run(count=1000000):
+    folder = tempfile.mkdtemp()
+    filename = os.path.join(folder, "lines.igs")
+    with contextlib.redirect_stdout(io.StringIO()):
+        mapped_save.scene(count).save(filename)
+
+    print("{} entities, {:,} bytes".format(count, os.path.getsize(filename)))
+    print("{:<20} {:>10}".format("directory stage", "seconds"))
+    with IGESReader(filename) as reader:
+        for name, step in (("directory()", lambda: sum(1 for entry in reader.directory())),
+                           ("read_directory()", reader.read_directory)):
+            print("{:<20} {:>10.3f}".format(name, best_of(step)))
+
+    os.remove(filename)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    run()
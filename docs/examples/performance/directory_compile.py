@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.directory_compile
+   :platform: Agnostic
+   :synopsis: Per entity directory compile cost over a mixed scene
+
+Times :py:meth:`pyiges.IGESCore.IGESItemData.CompileDirectory` on a scene
+of mixed entity types, including the drawing, property and view entities
+with their own layouts, against ``legacy_compile_directory``: the if/elif
+chain and ``str.format`` over a 17 item list that CompileDirectory used
+before the directory layouts were registered per entity type. The scene
+repeats a few entities so that building it does not dominate the run.
+"""
+
+import os
+import sys
+import time
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from pyiges.IGESGeomLib import (IGESPoint, IGESGeomLine, IGESGeomArc, IGESGeomPolyline,
+                                IGESGeomTransform, IGESPropertyEntity, IGESViewEntity,
+                                IGESDrawingEntity, IGESRationalBSplineSurface)
+
+
+def legacy_compile_directory(self):
+    items = [self.EntityType.getValue(), self.ParameterDataPointer.data, self.Structure,
+             self.LineFontPattern.getValue(), self.Level, self.View, self.TransfrmMat,
+             self.LabelDispAssoc, str(self.StatusNumber), self.LineWeightNum,
+             self.Color.getValue(), self.ParameterLineCount, self.FormNumber, "", "",
+             self.EntityLabel[:8], self.EntitySubScript]
+
+    if self.EntityType.getValue() == 404:
+        Line1Template = "{p[0]:>8}{p[1]:>8}{p[8]:>56}"
+        Line2Template = "{p[0]:>8}{p[11]:>24}{p[12]:>8}{p[13]:>8}{p[14]:>8}{p[15]:>8}{p[16]:>8}"
+    elif self.EntityType.getValue() == 406:
+        Line1Template = "{p[0]:>8}{p[1]:>8}{p[4]:>24}{p[8]:>32}"
+        Line2Template = "{p[0]:>8}{p[11]:>24}{p[12]:>8}{p[13]:>8}{p[14]:>8}{p[15]:>8}{p[16]:>8}"
+    elif self.EntityType.getValue() == 410:
+        Line1Template = "{p[0]:>8}{p[1]:>8}{p[6]:>40}{p[8]:>16}"
+        Line2Template = "{p[0]:>8}{p[11]:>24}{p[12]:>8}{p[13]:>8}{p[14]:>8}{p[15]:>8}{p[16]:>8}"
+    else:
+        Line1Template = "{p[0]:>8}{p[1]:>8}{p[2]:>8}{p[3]:>8}{p[4]:>8}{p[5]:>8}{p[6]:>8}{p[7]:>8}{p[8]:>8}"
+        Line2Template = "{p[0]:>8}{p[9]:>8}{p[10]:>8}{p[11]:>8}{p[12]:>8}{p[13]:>8}{p[14]:>8}{p[15]:>8}{p[16]:>8}"
+
+    return [Line1Template.format(p = items), Line2Template.format(p = items)]
+
+
+def scene(count):
+    entities = [IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1)),
+                IGESGeomArc(0, IGESPoint(0, 0), IGESPoint(1, 0), IGESPoint(0, 1)),
+                IGESGeomPolyline(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1)),
+                IGESGeomTransform([1, 0, 0, 5, 0, 1, 0, 6, 0, 0, 1, 7], 1),
+                IGESRationalBSplineSurface(IGESPoint(0, 0, 0), IGESPoint(1, 0, 0),
+                                           IGESPoint(0, 1, 0), IGESPoint(1, 1, 0)),
+                IGESPropertyEntity([2, 0.5, 1], 15),
+                IGESViewEntity([1, 1.0, 0, 0, 0, 0, 0, 0]),
+                IGESDrawingEntity([0, 0], 0)]
+    for i, IGESObject in enumerate(entities):
+        IGESObject.ParameterDataPointer.data = 3 * i + 1
+        IGESObject.ParameterLineCount = 3
+    return entities * (count // len(entities))
+
+
+def run(count=1000000):
+    entities = scene(count)
+    print("{} entities".format(len(entities)))
+    print("{:<20} {:>10} {:>14}".format("path", "seconds", "us/entity"))
+    for name, compile in (("legacy", legacy_compile_directory),
+                          ("registered", lambda IGESObject: IGESObject.CompileDirectory())):
+        start = time.perf_counter()
+        for IGESObject in entities:
+            compile(IGESObject)
+        seconds = time.perf_counter() - start
+        print("{:<20} {:>10.3f} {:>14.2f}".format(name, seconds, 1e6 * seconds / len(entities)))
+
+    print("identical output:", all(legacy_compile_directory(IGESObject) == IGESObject.CompileDirectory()
+                                   for IGESObject in entities[:8]))
+
+
+if __name__ == "__main__":
+    run()
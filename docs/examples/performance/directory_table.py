@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.directory_table
+   :platform: Agnostic
+   :synopsis: Render directory sections from entities and from a directory table
+
+Writes the directory section of a mixed scene to os.devnull twice, once
+with :py:class:`pyiges.IGESCore.IGESDirectory` (two formatted lines per
+entity) and once with :py:class:`pyiges.IGESCore.IGESDirectoryTable`, and
+times a bulk edit of the table. The scene repeats a few entities so that
+building it does not dominate the run.
+"""
+
+import io
+import os
+import sys
+import time
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from pyiges.IGESCore import IGESDirectory, IGESDirectoryTable
+from pyiges.IGESGeomLib import (IGESPoint, IGESGeomLine, IGESGeomArc, IGESPropertyEntity,
+                                IGESRationalBSplineSurface)
+
+
+def scene(count):
+    entities = [IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1)),
+                IGESGeomArc(0, IGESPoint(0, 0), IGESPoint(1, 0), IGESPoint(0, 1)),
+                IGESPropertyEntity([2, 0.5, 1], 15),
+                IGESRationalBSplineSurface(IGESPoint(0, 0, 0), IGESPoint(1, 0, 0),
+                                           IGESPoint(0, 1, 0), IGESPoint(1, 1, 0))]
+    for i, IGESObject in enumerate(entities):
+        IGESObject.ParameterDataPointer.data = 3 * i + 1
+        IGESObject.ParameterLineCount = 3
+    return entities * (count // len(entities))
+
+
+def run(counts=(10000, 100000, 1000000)):
+    print("{:>10} {:>12} {:>12} {:>12} {:>12}".format("entries", "lines s", "table add s", "table s", "update s"))
+    for count in counts:
+        entities = scene(count)
+        with open(os.devnull, 'w') as devnull:
+            start = time.perf_counter()
+            directory = IGESDirectory()
+            directory.AddEntities(entities)
+            directory.WriteSection(devnull)
+            lines_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            table = IGESDirectoryTable()
+            table.AddEntities(entities)
+            add_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            table.WriteSection(devnull)
+            table_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table.update(table.select(EntityType=128), Level=5)
+        update_seconds = time.perf_counter() - start
+
+        print("{:>10,} {:>12.3f} {:>12.3f} {:>12.3f} {:>12.3f}".format(
+            count, lines_seconds, add_seconds, table_seconds, update_seconds))
+
+    small = scene(1000)
+    directory, table = IGESDirectory(), IGESDirectoryTable()
+    directory.AddEntities(small)
+    table.AddEntities(small)
+    lines, rendered = io.StringIO(), io.StringIO()
+    directory.WriteSection(lines)
+    table.WriteSection(rendered)
+    print("identical output:", lines.getvalue() == rendered.getvalue())
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.entity_memory
+   :platform: Agnostic
+   :synopsis: Memory used per entity, measured with tracemalloc
+
+Creates many :py:class:`pyiges.IGESGeomLib.IGESGeomLine` entities and
+reports the bytes allocated per entity while they are only built, after they
+are committed to an :py:class:`pyiges.IGESCore.IGEStorage` (entities kept
+alive by the caller as well as the section lines) and when a deferred storage
+has compiled them.
+"""
+
+import os
+import sys
+import tracemalloc
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from pyiges.IGESCore import IGEStorage
+from pyiges.IGESGeomLib import IGESPoint, IGESGeomLine
+
+
+def lines(count):
+    return [IGESGeomLine(IGESPoint(0.5 * i, -5.0, 1.0), IGESPoint(0.5 * i, 5.0, 1.0))
+            for i in range(0, count)]
+
+
+def committed(count, **kwargs):
+    system = IGEStorage(**kwargs)
+    entities = lines(count)
+    for entity in entities:
+        system.Commit(entity)
+    if kwargs.get("deferred"):
+        system.flush()
+    return system, entities
+
+
+def measure(function, count):
+    tracemalloc.start()
+    kept = function(count)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size / count
+
+
+def run(count=20000):
+    print("{} entities".format(count))
+    print("{:<20} {:>14}".format("case", "bytes/entity"))
+    for name, function in (("built", lines),
+                           ("committed", committed),
+                           ("deferred", lambda count: committed(count, deferred=True))):
+        print("{:<20} {:>14,.0f}".format(name, measure(function, count)))
+
+
+if __name__ == "__main__":
+    run()
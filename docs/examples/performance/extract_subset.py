@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.extract_subset
+   :platform: Agnostic
+   :synopsis: Copy a few entities of a large file with pyiges.IGESExtract
+
+Saves a large number of lines (:py:mod:`examples.performance.mapped_save`)
+and times extracting a few of them by directory pointer, which reads only
+those entities, and by entity type, which streams the directory once.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import best_of, mapped_save
+from pyiges.IGESExtract import extract
+
+
+def run(count=200000, chosen=1000):
+    folder = tempfile.mkdtemp()
+    filename = os.path.join(folder, "lines.igs")
+    target = os.path.join(folder, "subset.igs")
+    with contextlib.redirect_stdout(io.StringIO()):
+        mapped_save.scene(count).save(filename)
+    pointers = [2 * i + 1 for i in random.sample(range(0, count), chosen)]
+
+    print("{} entities, {:,} bytes".format(count, os.path.getsize(filename)))
+    print("{:<28} {:>12}".format("step", "seconds"))
+    for name, step in (("extract {} by pointer".format(chosen),
+                        lambda: extract(filename, target, DirectoryPointers=pointers)),
+                       ("extract all by type", lambda: extract(filename, target, EntityTypes={110}))):
+        print("{:<28} {:>12.4f}".format(name, best_of(step)))
+
+    os.remove(target)
+    os.remove(filename)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    run()
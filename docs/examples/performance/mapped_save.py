@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.mapped_save
+   :platform: Agnostic
+   :synopsis: Save a storage through the text file layer and through a memory map
+
+Commits a large scene once and saves it with
+:py:meth:`pyiges.IGESCore.IGEStorage.save` as a text file, and with
+``mapped=True`` with and without fill threads. All files must be the same.
+"""
+
+import filecmp
+import os
+import sys
+import tempfile
+import time
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import best_of
+from pyiges.IGESCore import IGEStorage
+from pyiges.IGESGeomLib import IGESPoint, IGESGeomLine
+
+
+def scene(count, **kwargs):
+    system = IGEStorage(**kwargs)
+    system.commit_many(IGESGeomLine(IGESPoint(0.5 * i, -5.0, 1.0), IGESPoint(0.5 * i, 5.0, i / 7.0))
+                       for i in range(0, count))
+    return system
+
+
+def run(count=200000):
+    folder = tempfile.mkdtemp()
+    print("{} entities".format(count))
+    print("{:<24} {:>10} {:>12}".format("save", "seconds", "MB/s"))
+    for kwargs in ({}, {"directory_table": True}):
+        system = scene(count, **kwargs)
+        reference = os.path.join(folder, "text.igs")
+        for name, save in (("text", lambda filename: system.save(filename)),
+                           ("mapped", lambda filename: system.save(filename, mapped=True)),
+                           ("mapped 4 threads", lambda filename: system.save(filename, mapped=True, threads=4))):
+            filename = os.path.join(folder, name.replace(" ", "_") + ".igs")
+            seconds = best_of(lambda: save(filename))
+            size = os.path.getsize(filename)
+            label = name + (" (table)" if kwargs else "")
+            print("{:<24} {:>10.3f} {:>12.1f}".format(label, seconds, size / seconds / 1e6))
+            if not filecmp.cmp(filename, reference, shallow=False):
+                print("  output differs from the text save")
+            if filename != reference:
+                os.remove(filename)
+        os.remove(reference)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    run()
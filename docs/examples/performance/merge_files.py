@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.merge_files
+   :platform: Agnostic
+   :synopsis: Join many files with pyiges.IGESMerge against copying them
+
+Saves a file of lines (:py:mod:`examples.performance.mapped_save`) and
+times merging copies of it with :py:func:`pyiges.IGESMerge.merge`, next to
+only copying the same bytes into one file.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import best_of, mapped_save
+from pyiges.IGESMerge import merge
+
+
+def concatenate(sources, target):
+    with open(target, 'wb') as output:
+        for source in sources:
+            with open(source, 'rb') as handle:
+                shutil.copyfileobj(handle, output)
+
+
+def run(count=20000, files=10):
+    folder = tempfile.mkdtemp()
+    filename = os.path.join(folder, "lines.igs")
+    target = os.path.join(folder, "merged.igs")
+    with contextlib.redirect_stdout(io.StringIO()):
+        mapped_save.scene(count).save(filename)
+    sources = [filename] * files
+
+    print("{} files of {} entities, {:,} bytes".format(files, count, files * os.path.getsize(filename)))
+    print("{:<28} {:>12}".format("step", "seconds"))
+    for name, step in (("copy the bytes", lambda: concatenate(sources, target)),
+                       ("merge", lambda: merge(sources, target))):
+        print("{:<28} {:>12.4f}".format(name, best_of(step)))
+
+    os.remove(target)
+    os.remove(filename)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    run()
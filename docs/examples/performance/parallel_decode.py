@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.parallel_decode
+   :platform: Agnostic
+   :synopsis: Decode the parameter section in worker processes
+
+Saves many lines (:py:mod:`examples.performance.mapped_save`) and one large
+spline (:py:mod:`examples.performance.parameter_encoder`) and times
+:py:meth:`pyiges.IGESReader.IGESReader.read_parameters` here and in 1, 2
+and all cores worth of worker processes, against streaming every entity.
+Workers only help when there are cores for them, the machine's count is
+printed first.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import best_of, mapped_save, parameter_encoder
+from pyiges.IGESCore import IGEStorage
+from pyiges.IGESReader import IGESReader
+
+
+def stream(reader):
+    return sum(1 for entity in reader)
+
+
+def run(count=200000):
+    cores = os.cpu_count() or 1
+    print("{} cores".format(cores))
+    folder = tempfile.mkdtemp()
+    spline = IGEStorage()
+    spline.Commit(parameter_encoder.spline(20000))
+    print("{:<16} {:<24} {:>10}".format("file", "decode", "seconds"))
+    for name, system in (("lines", mapped_save.scene(count)), ("spline", spline)):
+        filename = os.path.join(folder, name + ".igs")
+        with contextlib.redirect_stdout(io.StringIO()):
+            system.save(filename)
+        with IGESReader(filename) as reader:
+            reader.open_index(persist=False)
+            steps = [("entities()", lambda: stream(reader)),
+                     ("read_parameters()", lambda: reader.read_parameters())]
+            for workers in sorted({1, 2, cores}):
+                steps.append(("read_parameters({})".format(workers),
+                              lambda workers=workers: reader.read_parameters(workers)))
+            for step, function in steps:
+                print("{:<16} {:<24} {:>10.3f}".format(name, step, best_of(function)))
+        os.remove(filename)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    run()
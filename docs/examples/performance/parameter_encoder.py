@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.parameter_encoder
+   :platform: Agnostic
+   :synopsis: Compile a large spline curve with the scalar and batched encoders
+
+Builds an :py:class:`pyiges.IGESGeomLib.IGESSplineCurve` with about one
+million coefficients and compiles its parameter lines with
+:py:func:`pyiges.IGESCompile.IGESUnaligned` (one parameter at a time) and
+:py:func:`pyiges.IGESCompile.IGESUnalignedArray` (batched). Both must give
+the same lines.
+"""
+
+import os
+import random
+import sys
+import time
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+import pyiges.IGESCompile as IGESCompile
+from pyiges.IGESCore import IGESGlobal
+from pyiges.IGESGeomLib import IGESSplineCurve
+
+
+def spline(segments):
+    random.seed(1)
+    curve = IGESSplineCurve(stype=3, h=1, ndim=3)
+    curve.addSegments([float(i) for i in range(0, segments)],
+                      [random.uniform(-10, 10) for i in range(0, 12 * segments)])
+    return curve
+
+
+def run(segments=83334):
+    curve = spline(segments)
+    data = [curve.EntityType.value] + curve.ParameterData
+    IGESGlobalSection = IGESGlobal()
+
+    print("{} parameters".format(len(data)))
+    print("{:<20} {:>10} {:>14}".format("path", "seconds", "params/sec"))
+    results = list()
+    for name, compile in (("scalar", lambda: IGESCompile.IGESUnaligned(data, IGESGlobalSection, 'P', 1)),
+                          ("batched", lambda: IGESCompile.IGESUnalignedArray(data, IGESGlobalSection, 1))):
+        start = time.perf_counter()
+        results.append(compile())
+        seconds = time.perf_counter() - start
+        print("{:<20} {:>10.3f} {:>14,.0f}".format(name, seconds, len(data) / seconds))
+
+    print("identical output:", results[0] == results[1])
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.random_access
+   :platform: Agnostic
+   :synopsis: Read single entities through an index against streaming the file
+
+Saves a large number of lines (:py:mod:`examples.performance.mapped_save`)
+and times building, saving and loading its
+:py:class:`pyiges.IGESReader.IGESIndex`, reading entities at random with
+:py:meth:`pyiges.IGESReader.IGESReader.get_entity`, and streaming the file
+up to the middle entity.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import best_of, mapped_save
+from pyiges.IGESReader import IGESReader, IGESIndex
+
+
+def scan(reader):
+    with open(reader.filename, 'rb') as handle:
+        return IGESIndex._scan(reader, handle)
+
+
+def rebuild(reader, sidecar):
+    if os.path.exists(sidecar):
+        os.remove(sidecar)
+    return reader.open_index()
+
+
+def run(count=200000, lookups=10000):
+    folder = tempfile.mkdtemp()
+    filename = os.path.join(folder, "lines.igs")
+    with contextlib.redirect_stdout(io.StringIO()):
+        mapped_save.scene(count).save(filename)
+    sidecar = filename + IGESIndex.Suffix
+
+    print("{} entities, {:,} bytes".format(count, os.path.getsize(filename)))
+    print("{:<28} {:>12}".format("step", "seconds"))
+    with IGESReader(filename) as reader:
+        for name, step in (("build index", lambda: IGESIndex.build(reader)),
+                           ("build index by scanning", lambda: scan(reader)),
+                           ("open_index (build + save)", lambda: rebuild(reader, sidecar)),
+                           ("open_index (saved)", lambda: reader.open_index())):
+            print("{:<28} {:>12.4f}".format(name, best_of(step)))
+
+        pointers = [2 * random.randrange(0, count) + 1 for i in range(0, lookups)]
+        start = time.perf_counter()
+        for DirectoryPointer in pointers:
+            reader.get_entity(DirectoryPointer)
+        seconds = time.perf_counter() - start
+        print("{:<28} {:>12.6f}".format("get_entity, each", seconds / lookups))
+
+        middle = count  # directory pointer of the middle entity
+        start = time.perf_counter()
+        for entity in reader:
+            if entity.DirectoryPointer >= middle:
+                break
+        print("{:<28} {:>12.4f}".format("stream to the middle", time.perf_counter() - start))
+
+    os.remove(sidecar)
+    os.remove(filename)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    run()
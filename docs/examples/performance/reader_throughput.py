@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.reader_throughput
+   :platform: Agnostic
+   :synopsis: Read throughput of the streaming reader
+
+Reads every entity of the benchmark files (``docs/examples/benchmarks``)
+with :py:class:`pyiges.IGESReader.IGESReader` and prints MB/s for the
+whole corpus and its largest files, then for two generated files that
+are large enough to time on their own: many lines
+(:py:mod:`examples.performance.mapped_save`) and one large spline
+(:py:mod:`examples.performance.parameter_encoder`). The peak memory of a
+second read is traced to show it does not grow with the file.
+"""
+
+import contextlib
+import glob
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import best_of, mapped_save, parameter_encoder
+from pyiges.IGESCore import IGEStorage
+from pyiges.IGESReader import IGESReader
+
+
+def read(filename):
+    count = 0
+    with IGESReader(filename) as reader:
+        for entity in reader:
+            count += 1
+    return count
+
+
+def peak_memory(filename):
+    tracemalloc.start()
+    read(filename)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def report(name, filenames):
+    size = sum(map(os.path.getsize, filenames))
+    entities = sum(map(read, filenames))
+    seconds = best_of(lambda: list(map(read, filenames)))
+    print("{:<24} {:>10,} {:>12,} {:>10.3f} {:>8.1f}".format(name, entities, size, seconds, size / seconds / 1e6))
+
+
+def run():
+    corpus = sorted(glob.glob(os.path.join(HERE, '..', 'benchmarks', '*', '*.igs')))
+    print("{:<24} {:>10} {:>12} {:>10} {:>8}".format("file", "entities", "bytes", "seconds", "MB/s"))
+    report("benchmarks ({} files)".format(len(corpus)), corpus)
+    for filename in sorted(corpus, key=os.path.getsize)[-3:]:
+        report(os.path.basename(filename), [filename])
+
+    folder = tempfile.mkdtemp()
+    spline = IGEStorage()
+    spline.Commit(parameter_encoder.spline(20000))
+    generated = list()
+    for name, system in (("lines 100k", mapped_save.scene(100000)), ("spline 20k", spline)):
+        filename = os.path.join(folder, name.replace(" ", "_") + ".igs")
+        with contextlib.redirect_stdout(io.StringIO()):
+            system.save(filename)
+        report(name, [filename])
+        generated.append(filename)
+
+    print("peak traced memory while reading")
+    for filename in generated + corpus[-1:]:
+        print("{:<24} {:>12,} bytes of {:>12,}".format(os.path.basename(filename), peak_memory(filename),
+                                                     os.path.getsize(filename)))
+        if filename in generated:
+            os.remove(filename)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.real_encoder
+   :platform: Agnostic
+   :synopsis: Throughput of the real number encoder in floats per second
+
+Compares the decimal.Decimal(item).normalize() conversion that pyIGES used to
+do on every real with the two formats of
+:py:class:`pyiges.IGESCompile.IGESParameterEncoder`.
+"""
+
+import decimal
+import os
+import random
+import sys
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from pyiges.IGESCompile import IGESParameterEncoder
+from examples.performance import best_of
+
+
+def decimal_normalize(values):
+    context = decimal.Context(prec=8)
+    return ["{}".format(context.normalize(decimal.Decimal(item))) for item in values]
+
+
+def run(count=200000):
+    random.seed(1)
+    values = [random.uniform(-1000, 1000) * 10 ** random.randint(-8, 2) for i in range(0, count)]
+
+    encoders = [("decimal normalize (old)", decimal_normalize)]
+    for real_format in IGESParameterEncoder.RealFormats:
+        encode = IGESParameterEncoder(real_format, 15).encode
+        encoders.append((real_format, lambda values, encode=encode: list(map(encode, values))))
+
+    print("{:<24} {:>14}".format("encoder", "floats/sec"))
+    for name, function in encoders:
+        seconds = best_of(lambda: function(values))
+        print("{:<24} {:>14,.0f}".format(name, count / seconds))
+
+
+if __name__ == "__main__":
+    run()
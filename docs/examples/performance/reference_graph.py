@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.reference_graph
+   :platform: Agnostic
+   :synopsis: Build the reference graph of a model and walk it
+
+Commits composite curves of lines, each one in a subfigure with its own
+instance, with and without ``references=True`` to time keeping the
+:py:class:`pyiges.IGESGraph.IGESReferenceGraph` while writing. The graph is
+then built from the saved file (streamed and from its arrays), and the
+dependencies of one instance and the dependents of one line are timed
+against the size of the model: they only depend on the size of the answer.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from examples.performance import best_of
+from pyiges.IGESCore import IGEStorage
+from pyiges.IGESGeomLib import (IGESPoint, IGESGeomLine, IGESGeomCompositeCurve, IGESGroup,
+                                IGESSingularSubfigureInstance)
+from pyiges.IGESGraph import IGESReferenceGraph
+from pyiges.IGESReader import IGESReader
+
+
+def entities(parts, lines=20):
+    """lines, their composite curve, a subfigure of it and an instance, for every part"""
+    for part in range(0, parts):
+        segments = list()
+        for i in range(0, lines):
+            segments.append(IGESGeomLine(IGESPoint(i, part, 0), IGESPoint(i + 1, part, 0)))
+            yield segments[-1]
+        composite = IGESGeomCompositeCurve(*segments)
+        yield composite
+        group = IGESGroup("part", composite)
+        yield group
+        yield IGESSingularSubfigureInstance(group, (0, 0, part))
+
+
+def commit(parts, references):
+    system = IGEStorage(references=references)
+    system.commit_many(entities(parts))
+    return system
+
+
+def run(parts=10000):
+    print("{} parts, {} entities".format(parts, 23 * parts))
+    print("{:<32} {:>10}".format("step", "seconds"))
+    for references in (False, True):
+        print("{:<32} {:>10.3f}".format("commit, references={}".format(references),
+                                        best_of(lambda: commit(parts, references))))
+
+    system = commit(parts, True)
+    folder = tempfile.mkdtemp()
+    filename = os.path.join(folder, "parts.igs")
+    with contextlib.redirect_stdout(io.StringIO()):
+        system.save(filename)
+    with IGESReader(filename) as reader:
+        print("{:<32} {:>10.3f}".format("from_reader", best_of(lambda: IGESReferenceGraph.from_reader(reader))))
+        model = reader.open_arrays(persist=False)
+        print("{:<32} {:>10.3f}".format("from_arrays", best_of(lambda: IGESReferenceGraph.from_arrays(model))))
+    os.remove(filename)
+    os.rmdir(folder)
+
+    graph = system.reference_graph()
+    start = time.perf_counter()
+    graph.referenced_by(1)
+    print("{:<32} {:>10.3f}".format("reverse rows, once", time.perf_counter() - start))
+    last = 2 * len(graph) - 1  # the last instance
+    for name, walk in (("dependencies of an instance", lambda: graph.dependencies(last)),
+                       ("dependents of a line", lambda: graph.dependents(1))):
+        found = len(walk())
+        print("{:<32} {:>10.6f}  {} entities".format(name, best_of(walk), found))
+
+
+if __name__ == "__main__":
+    run()
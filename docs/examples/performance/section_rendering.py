@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.section_rendering
+   :platform: Agnostic
+   :synopsis: Show that writing a section scales linearly with its line count
+
+Renders a parameter section of 10k to 10M lines with
+:py:func:`pyiges.IGESCompile.write_lines` into a buffered file. The lines are
+generated on the fly so memory use does not grow with the line count, only
+the rendering is timed. The time per line should stay flat as the section
+grows.
+"""
+
+import itertools
+import os
+import sys
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+import pyiges.IGESCompile as IGESCompile
+from examples.performance import best_of
+
+LINE = "{:<64}{:>8}".format("106,2,200,0,0,10,0.1,0.33333333,10,0.2,0.66666667,10,0.3,1,", 7)
+
+
+def render(count):
+    with open(os.devnull, 'w') as stream:
+        IGESCompile.write_lines(stream, itertools.repeat(LINE, count), "P")
+
+
+def run(sizes=(10000, 100000, 1000000, 10000000)):
+    print("{:>10} {:>10} {:>10}".format("lines", "seconds", "ns/line"))
+    for count in sizes:
+        seconds = best_of(lambda: render(count), repeat=1 if count > 1000000 else 3)
+        print("{:>10} {:>10.3f} {:>10.1f}".format(count, seconds, seconds * 1e9 / count))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: examples.performance.subfigure_instance
+   :platform: Agnostic
+   :synopsis: Copies of a repeated part against subfigure instances of it
+
+Places a part, a blade of a few hundred lines, around an axis a number of
+times. Once every line of every copy is committed with its placement
+applied, once the part is committed as a subfigure definition (308) and
+placed with :py:func:`pyiges.IGESGeomLib.instance`, which writes a
+transform (124) and a singular subfigure instance (408) per placement.
+"""
+
+import math
+import os
+import sys
+import time
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', '..'))        # docs, for examples.performance
+sys.path.append(os.path.join(HERE, '..', '..', '..'))  # source tree, for pyiges
+
+from pyiges.IGESCore import IGEStorage
+from pyiges.IGESGeomLib import IGESPoint, IGESGeomLine, IGESGroup, instance
+
+
+def blade(lines=300):
+    return [((10.0 + 0.1 * i, 0.0, 0.01 * i), (10.0 + 0.1 * i, 1.0, 0.01 * i + 0.5))
+            for i in range(0, lines)]
+
+
+def placements(count):
+    """rotations about z, as 4x3 [R^T ; T] matrices"""
+    for k in range(0, count):
+        c, s = math.cos(2 * math.pi * k / count), math.sin(2 * math.pi * k / count)
+        yield [[c, s, 0], [-s, c, 0], [0, 0, 1], [0, 0, 0]]
+
+
+def copied(part, count):
+    system = IGEStorage()
+    for placement in placements(count):
+        (c, s, _), _, _, _ = placement
+        system.commit_many(IGESGeomLine(IGESPoint(c * x0 - s * y0, s * x0 + c * y0, z0),
+                                        IGESPoint(c * x1 - s * y1, s * x1 + c * y1, z1))
+                           for (x0, y0, z0), (x1, y1, z1) in part)
+    return system
+
+
+def instanced(part, count):
+    system = IGEStorage()
+    lines = [IGESGeomLine(IGESPoint(*start), IGESPoint(*end)) for start, end in part]
+    for line in lines:
+        line.StatusNumber.Subordinate.setPhysicallyDependent()
+    system.commit_many(lines)
+    definition = IGESGroup("blade", *lines)
+    system.Commit(definition)
+    system.commit_many(instance(definition, placements(count)))
+    return system
+
+
+def run(counts=(10, 100, 1000)):
+    part = blade()
+    print("{:>8} {:<10} {:>10} {:>14}".format("copies", "scene", "seconds", "bytes"))
+    for count in counts:
+        for name, build in (("copied", copied), ("instanced", instanced)):
+            start = time.perf_counter()
+            size = len(str(build(part, count)))
+            seconds = time.perf_counter() - start
+            print("{:>8} {:<10} {:>10.3f} {:>14,}".format(count, name, seconds, size))
+
+
+if __name__ == "__main__":
+    run()
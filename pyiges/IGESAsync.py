@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESAsync
+   :platform: Agnostic, Windows
+   :synopsis: asyncio front end of IGEStorage
+
+.. requires asyncio, collections, concurrent.futures, functools
+
+.. Created on Sun Oct 18 10:05:37 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import functools
+
+from pyiges.IGESCore import IGEStorage, IGESItemData
+from pyiges.IGESOptions import IGESPointer
+
+
+class AsyncIGEStorage:
+    """IGES Storage for asyncio programs
+
+    Entities are committed from coroutines, for example while they come out
+    of an async generator that awaits solver results. Each entity gets its
+    directory pointer on the event loop as soon as it is committed, so a
+    later entity can refer to it. The entities are collected in chunks that
+    are compiled and added to the storage on a single worker thread, in
+    order, while the loop carries on. When max_pending chunks are waiting
+    commit waits for the oldest one, so a fast producer can not build up an
+    unbounded queue. Saving runs on the same thread.
+
+    A deferred storage, or one with workers, only registers the committed
+    entities, so they are committed on the loop and compiled by save.
+
+    :param storage: storage to fill, a new IGEStorage by default. Entities
+        must not be committed to it directly while the adapter is in use
+    :type storage: :py:class:`~pyiges.IGESCore.IGEStorage`
+
+    :param int chunk_size: entities compiled together
+    :param int max_pending: chunks compiling or waiting before commit waits
+
+    Other attributes, eg. GlobalSection, are the ones of the storage.
+    """
+    def __init__(self, storage=None, chunk_size=256, max_pending=4):
+        self.storage = IGEStorage() if storage is None else storage
+        self._chunk_size = chunk_size
+        self._max_pending = max_pending
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(1)
+        self._pending = collections.deque()
+        self._chunk = list()
+        self._DirectoryPointer = None
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name == 'storage':
+            raise AttributeError(name)
+        return getattr(self.storage, name)
+
+    async def commit(self, IGESObjects):
+        """Commit an entity, or every entity of an iterable or async iterable
+        in order
+
+        :return: number of entities committed
+        """
+        if isinstance(IGESObjects, IGESItemData):
+            IGESObjects = [IGESObjects]
+
+        committed = 0
+        if hasattr(IGESObjects, '__aiter__'):
+            async for IGESObject in IGESObjects:
+                await self._add(IGESObject)
+                committed += 1
+        else:
+            for IGESObject in IGESObjects:
+                await self._add(IGESObject)
+                committed += 1
+        return committed
+
+    async def _add(self, IGESObject):
+        if self.storage._deferred or self.storage._workers:
+            self.storage.Commit(IGESObject)
+            return
+
+        if self._DirectoryPointer is None:
+            self._DirectoryPointer = self.storage.DirectorySection._linecount
+        if self.storage._Deduplicable(IGESObject):
+            known = self.storage._Deduplicate(IGESObject, self._DirectoryPointer)
+            if known is not None:
+                IGESObject.DirectoryDataPointer = IGESPointer(known)
+                return
+        IGESObject.DirectoryDataPointer = IGESPointer(self._DirectoryPointer)
+        self._DirectoryPointer += 2
+
+        self._chunk.append(IGESObject)
+        if len(self._chunk) >= self._chunk_size:
+            await self._submit()
+
+    async def _submit(self):
+        """send the current chunk to the worker thread, waiting for the oldest
+        chunks while too many are pending"""
+        chunk, self._chunk = self._chunk, list()
+        if chunk:
+            loop = asyncio.get_running_loop()
+            self._pending.append(loop.run_in_executor(self._executor, self.storage._CommitChunk, chunk))
+        while len(self._pending) > self._max_pending:
+            await self._pending.popleft()
+        await asyncio.sleep(0)  # let other tasks run between chunks of a plain iterable
+
+    async def drain(self):
+        """wait until every committed entity is in the storage"""
+        await self._submit()
+        while self._pending:
+            await self._pending.popleft()
+
+    async def save_async(self, filename = 'IGESFile.igs', **kwargs):
+        """Save once every committed entity is compiled, without blocking the
+        event loop. Takes the arguments of IGEStorage.save"""
+        await self.drain()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, functools.partial(self.storage.save, filename, **kwargs))
+
+    def close(self):
+        """stop the worker thread, pending chunks are finished first"""
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                await self.drain()
+        finally:
+            self.close()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESBlock
+   :platform: Agnostic, Windows
+   :synopsis: Entities compiled once and added to many storages
+
+A block is a set of entities (a standard part, say) compiled as if they
+were the only entities of a file, so their directory pointers are 1, 3,
+5 ... and their parameter lines start at 1. Adding the block to a storage
+with :py:meth:`pyiges.IGESCore.IGEStorage.splice` moves those pointers to
+where the block lands. The parameter lines of the entities without
+pointers among their parameters, back pointer lists included, are copied,
+only their directory pointer changes. The entities with pointers keep their encoded parameters and the
+positions of the pointers among them (the relocations), the pointers are
+moved and the encoded parameters laid out on lines again.
+
+The entities of a block may refer to each other but not to entities
+outside it, and the pointers among their parameters have to be known,
+an entity type or form without a layout is refused.
+
+.. requires copy
+
+.. Created on Sun Oct 18 21:48:19 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+import copy
+
+import pyiges.IGESCompile as IGESCompile
+from pyiges.IGESCompressed import split_parameters
+from pyiges.IGESCore import DirectoryFields, IGESDirectoryTable, IGEStorage
+from pyiges.IGESGraph import pointer_positions
+
+# positions in a row of DirectoryFields of the pointers, and of the pointers when negative
+_PointerColumns = tuple(map(DirectoryFields.index, IGESDirectoryTable.PointerFields))
+_NegatedPointerColumns = tuple(map(DirectoryFields.index, IGESDirectoryTable.NegatedPointerFields))
+_ParameterDataPointer = DirectoryFields.index('ParameterDataPointer')
+_ParameterLineCount = DirectoryFields.index('ParameterLineCount')
+
+
+class IGESBlock:
+    """Compiled entities with pointers relative to the block, see compile
+
+    Attributes:
+        rows: DirectoryFields values of each entity
+        ParameterLines: data columns of the parameter lines of each entity,
+            padded to the directory pointer column
+        relocations: (encoded parameters, positions of the pointers among
+            them, positions of the negated pointers) of the entities with
+            pointers in their parameters, by entity index
+        references: directory pointers each entity refers to
+        delimiters: parameter and record delimiters of the parameters
+    """
+    def __init__(self, rows, ParameterLines, relocations, references, delimiters):
+        self.rows = rows
+        self.ParameterLines = ParameterLines
+        self.relocations = relocations
+        self.references = references
+        self.delimiters = delimiters
+
+    def __len__(self):
+        return len(self.rows)
+
+    @classmethod
+    def compile(cls, IGESObjects, GlobalSection=None):
+        """Compile entities into a block. The entities are committed to a
+        storage of their own, so afterwards they hold the pointers of the
+        block and not of any storage the block is spliced into
+
+        :param IGESObjects: entities in file order, as for IGEStorage.commit_many
+        :param GlobalSection: :py:class:`~pyiges.IGESCore.IGESGlobal` with the
+            delimiters and real format to compile with, the default is that
+            of a new storage
+        :raises ValueError: when an entity refers to one outside the block,
+            or the pointers among its parameters are not known (see
+            :py:func:`~pyiges.IGESGraph.pointer_positions`)
+        """
+        storage = IGEStorage(directory_table=True, references=True)
+        if GlobalSection is not None:
+            storage.GlobalSection = copy.deepcopy(GlobalSection)
+        GlobalSection = storage.GlobalSection
+        entities = list()
+
+        def taken():  # committed as they come, a generator may refer to the entities before
+            for IGESObject in IGESObjects:
+                entities.append(IGESObject)
+                yield IGESObject
+        storage.commit_many(taken())
+
+        graph = storage.reference_graph()
+        dangling = graph.dangling()
+        if dangling:
+            raise ValueError("Entities refer to entities outside the block", dangling)
+
+        table = storage.DirectorySection
+        rows = list(zip(*(table.columns[field] for field in table.Fields)))
+        lines = iter(storage.ParameterSection._data)
+        ParameterLines = list()
+        relocations = dict()
+        for i, IGESObject in enumerate(entities):
+            data = [line[:GlobalSection.LineLength] for line in
+                    (next(lines) for count in range(0, IGESObject.ParameterLineCount))]
+            ParameterLines.append(data)
+            Parameters = IGESObject.GetParameters()
+            try:
+                positions, negated = pointer_positions(Parameters[0], Parameters[1:], IGESObject.FormNumber)
+            except ValueError as error:
+                raise ValueError("Can not relocate the pointers of entity", 2 * i + 1, Parameters[0]) from error
+            if positions or negated:
+                text = "".join(line[:GlobalSection.LineLength - 1] for line in data)
+                relocations[i] = (split_parameters(text, GlobalSection.ParameterDelimiterCharacter,
+                                                   GlobalSection.RecordDelimiter),
+                                  [position + 1 for position in positions], [position + 1 for position in negated])
+        references = [graph.references(2 * i + 1) for i in range(0, len(graph))]
+        return cls(rows, ParameterLines, relocations, references,
+                   (GlobalSection.ParameterDelimiterCharacter, GlobalSection.RecordDelimiter))
+
+    def place(self, DirectoryBase, ParameterPointer, GlobalSection):
+        """directory rows and parameter lines of the block with its entities
+        at directory pointers DirectoryBase + 1, + 3 ... and its parameter
+        lines from ParameterPointer
+
+        :raises ValueError: when GlobalSection has other delimiters than the block
+        """
+        if (GlobalSection.ParameterDelimiterCharacter, GlobalSection.RecordDelimiter) != self.delimiters:
+            raise ValueError("The block was compiled with other delimiters", self.delimiters)
+        rows, lines = list(), list()
+        for i, (row, data) in enumerate(zip(self.rows, self.ParameterLines)):
+            DirectoryPointer = DirectoryBase + 2 * i + 1
+            if i in self.relocations:
+                Parameters, positions, negated = self.relocations[i]
+                Parameters = list(Parameters)
+                for position in positions:
+                    Parameters[position] = str(int(Parameters[position]) + DirectoryBase)
+                for position in negated:
+                    Parameters[position] = str(int(Parameters[position]) - DirectoryBase)
+                data, ParameterLineCount = IGESCompile.IGESPackParameters(Parameters, GlobalSection,
+                                                                          DirectoryPointer)
+            else:
+                pointer = "%7d" % DirectoryPointer
+                data, ParameterLineCount = [line + pointer for line in data], len(data)
+
+            row = list(row)
+            for column in _PointerColumns:
+                if row[column] > 0:
+                    row[column] += DirectoryBase
+            for column in _NegatedPointerColumns:
+                if row[column] < 0:
+                    row[column] -= DirectoryBase
+            row[_ParameterDataPointer] = ParameterPointer if ParameterLineCount else 0
+            row[_ParameterLineCount] = ParameterLineCount
+            rows.append(tuple(row))
+            lines.extend(data)
+            ParameterPointer += ParameterLineCount
+        return rows, lines
@@ -6,7 +6,7 @@
    :platform: Agnostic, Windows
    :synopsis: Main GUI program
 
-.. requires decimal
+.. requires bisect, itertools, numbers
 
 .. Created on Fri Mar 29 14:58:02 2013
 .. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
@@ -15,14 +15,39 @@
 """
 
 
-import decimal
+import bisect
+import itertools
+import numbers
 
-this_context = decimal.BasicContext
-this_context.prec = 8
-decimal.setcontext(this_context)
 
+def record_template(section):
+    """format string for one record of a section, the leading newline
+    separates it from the record before it"""
+    return "\n%-72s" + section + "%7d"
 
-def format_line(data, section):
+
+def iter_records(data, section, start=1):
+    """render data lines as 80 column records in a single pass, the section
+    letter and sequence number are added as each line is rendered
+
+    :param data: lines of the section, any iterable
+    :type data: iterable of strings
+
+    :param section: letter for the corresponding IGES section
+    :type section: string
+
+    :param int start: sequence number of the first line
+    """
+    return map(record_template(section).__mod__, zip(data, itertools.count(start)))
+
+
+def write_lines(stream, data, section):
+    """render data lines straight into a (buffered) file handle without
+    building the section as a string, see iter_records"""
+    stream.writelines(iter_records(data, section))
+
+
+def format_line(data, section, start=1):
     """concatinate data chuncks and add section marker and line counter
 
     :param data: list of values
@@ -31,25 +56,164 @@ def format_line(data, section):
     :param section: letter for the corresponding IGES section
     :type section: string
 
+    :param int start: sequence number of the first line
     """
-    out = ""
+    return "".join(iter_records(data, section, start))
+
+
+class IGESParameterEncoder:
+    """Convert parameter values into IGES strings, eg. 5 -> '5',
+    0.5 -> '0.5', 'PERSON' -> '6HPERSON'.
+
+    Values are converted through a table keyed on the exact type, types that
+    are not in the table (numpy scalars, bool, ...) are looked up once by
+    their numeric kind and then added to the table.
+
+    :param real_format: "significance" rounds reals to significance digits,
+        "shortest" writes the shortest string that reads back as the same double
+    :type real_format: string
+
+    :param significance: significant digits for the "significance" format,
+        normally IGESGlobal.DPSignificance
+    :type significance: int
+    """
+    RealFormats = ("significance", "shortest")
+
+    def __init__(self, real_format="significance", significance=15):
+        if real_format == "significance":
+            self.real_template = "%.{}G".format(int(significance))
+            self.real = self._significance_real(self.real_template)
+        elif real_format == "shortest":
+            self.real_template = "%r"
+            self.real = self._shortest_real
+        else:
+            raise ValueError("Unknown real format", real_format, self.RealFormats)
+
+        self.encoders = {str: self.string,
+                         int: self.integer,
+                         float: self.real}
+
+    def encode(self, item):
+        try:
+            return self.encoders[type(item)](item)
+        except KeyError:
+            return self._resolve(type(item))(item)
 
-    for i in range(0, len(data)):
-        new_data = "{:<72}".format(data[i])
-        new_section = "{:7}".format(i + 1)
-        out += "\n" + new_data + section + new_section
-        #old: out = "{}{}{:<72}{}{:7}".format(out, "\n", data[i], section, i + 1)
+    def encode_many(self, data):
+        """encode a whole run of parameters, gives the same strings as
+        calling encode on each item.
 
-    return out
+        Runs of plain ints and floats (including numpy arrays, which are
+        converted with tolist) are formatted by a single % operation so the
+        per item work is left to the C formatting code.
+        """
+        if hasattr(data, 'ravel'):
+            data = data.ravel().tolist()
+
+        types = set(map(type, data))
+        if not types or not types <= {int, float}:
+            return list(map(self.encode, data))
+
+        template = {int: "%d", float: self.real_template}
+        if len(types) == 1:
+            template = (template[type(data[0])] + "\n") * len(data)
+        else:
+            template = "\n".join(map(template.__getitem__, map(type, data))) + "\n"
+        Parameters = template % tuple(data)
+        if self.real_template == "%r":
+            Parameters = Parameters.upper()
+        Parameters = Parameters.split("\n")
+        Parameters.pop()
+
+        if float in types:
+            # integers and the reals that came out without a decimal point
+            point = self.point
+            for i in [i for i, Parameter in enumerate(Parameters) if "." not in Parameter]:
+                if type(data[i]) is float:
+                    Parameter = Parameters[i]
+                    if Parameter.isdigit():
+                        Parameters[i] = Parameter + "."
+                    else:
+                        Parameters[i] = point(Parameter)
+        return Parameters
+
+    def _resolve(self, itemType):
+        if issubclass(itemType, float):
+            encoder = self.real
+        elif issubclass(itemType, (bool, numbers.Integral)):
+            encoder = self._convert(int, self.integer)
+        elif issubclass(itemType, numbers.Real):
+            encoder = self._convert(float, self.real)
+        elif issubclass(itemType, str):
+            encoder = self.string
+        else:
+            raise NotImplementedError("Unable to convert type ", str(itemType))
+
+        self.encoders[itemType] = encoder
+        return encoder
+
+    @staticmethod
+    def _convert(cast, encoder):
+        return lambda item: encoder(cast(item))
+
+    @staticmethod
+    def string(item):
+        return "{}H{}".format(len(item), item)
+
+    integer = staticmethod(str)
+
+    @staticmethod
+    def point(Parameter):
+        """make sure a formatted real has a decimal point, eg. 1 -> 1.
+        and 1E-07 -> 1.E-07, so it is not read back as an integer"""
+        if "." in Parameter:
+            return Parameter
+        elif "E" in Parameter:
+            return Parameter.replace("E", ".E")
+        elif Parameter[-1].isdigit():
+            return Parameter + "."
+        raise ValueError("IGES can not represent real value", Parameter)
+
+    def _significance_real(self, template):
+        to_string = template.__mod__
+        point = self.point
+        return lambda item: point(to_string(item))
+
+    def _shortest_real(self, item):
+        return self.point(repr(float(item)).upper())
+
+
+_encoders = dict()
+
+
+def get_encoder(IGESGlobal):
+    """parameter encoder matching the real number settings of IGESGlobal"""
+    key = (IGESGlobal.RealFormat, IGESGlobal.DPSignificance)
+    try:
+        return _encoders[key]
+    except KeyError:
+        _encoders[key] = IGESParameterEncoder(*key)
+        return _encoders[key]
 
 
 def IGESUnaligned(data, IGESGlobal, section, DirectoryPointer=0):
     """split data into chuncks of correct length for file output
-    Step 1, Convert data
-    Step 2, Check line length is less then IGESGlobal.linelength
-    Step 2a, Add parameter to line
-    Step 2b, Add line to LineStore
-    Step 4, return LineStore sting
+    Step 1, Convert data (see IGESParameterEncoder)
+    Step 2, Lay out the strings on lines (see IGESWrapParameters)
+    """
+    if len(data) == 0:
+        raise ValueError("Parameter data is 0 length")
+
+    return IGESWrapParameters(list(map(get_encoder(IGESGlobal).encode, data)),
+                              IGESGlobal, section, DirectoryPointer)
+
+
+def IGESWrapParameters(Parameters, IGESGlobal, section, DirectoryPointer=0):
+    """lay out encoded parameters on lines for file output
+    Step 1, Check line length is less then IGESGlobal.linelength
+    Step 1a, Add parameter to line
+    Step 1b, Add line to LineStore
+    Step 2, return LineStore sting
     """
 
     if section == "P":
@@ -59,24 +223,8 @@ def IGESUnaligned(data, IGESGlobal, section, DirectoryPointer=0):
 
     lines = [""]
 
-    if len(data) == 0:
-        raise ValueError("Parameter data is 0 length")
-
-    for item in data:
+    for Parameter in Parameters:
         nline = len(lines) - 1
-        itemType = type(item)
-        if itemType is str:
-            Parameter = "{}H{}".format(len(item), item)
-        elif itemType is int:
-            Parameter = "{}".format(item)
-        elif itemType is float:
-            Parameter = "{}".format(decimal.Decimal(item).normalize())
-            # Parameter = "{}".format(numpy.around(item, 5))
-        elif 'numpy.float64' in str(itemType):
-            Parameter = "{}".format(decimal.Decimal(item).normalize())
-            # Parameter = "{}".format(numpy.around(item, 5))
-        else:
-            raise NotImplementedError("Unable to convert type ", str(itemType))
 
         current_line_length = len(lines[nline])
         # See if we can fit this parameter on the line
@@ -109,3 +257,106 @@ def IGESUnaligned(data, IGESGlobal, section, DirectoryPointer=0):
             lines[i] = "{:<{}}{:>7}".format(lines[i], IGESGlobal.LineLength, DirectoryPointer)
 
     return lines, len(lines)
+
+
+def _pack_parameters(Parameters, LineLength, ParameterDelimiter, RecordDelimiter, template):
+    """lay out encoded parameters on lines the same way IGESUnaligned does.
+
+    The parameters are joined once and each line is cut out of that string,
+    the line breaks come from a binary search on the running total of the
+    parameter widths. A line holds at most LineLength // 2 parameters which
+    bounds the search. template formats one line, eg. "%-65s      7"
+    """
+    text = ParameterDelimiter.join(Parameters) + RecordDelimiter
+    widths = list(itertools.chain((0, ), itertools.accumulate(map((1).__add__, map(len, Parameters)))))
+
+    bisect_right = bisect.bisect_right
+    ends = list()
+    append = ends.append
+    first, last, span = 0, len(Parameters), LineLength // 2 + 1
+    while first < last:
+        limit = first + span
+        if limit > last:
+            limit = last
+        end = bisect_right(widths, widths[first] + LineLength, first + 1, limit + 1) - 1
+        if end == first:
+            end = first + 1
+        append(widths[end])
+        first = end
+
+    starts = [0]
+    starts.extend(ends[:-1])
+    return list(map(template.__mod__, map(text.__getitem__, map(slice, starts, ends))))
+
+
+def IGESUnalignedArray(data, IGESGlobal, DirectoryPointer=0):
+    """Batched version of IGESUnaligned for the parameter section, used for
+    entities with large blocks of numbers (polyline vertices, spline
+    coefficients, control nets).
+
+    All parameters are encoded in one go (see IGESParameterEncoder.encode_many)
+    and packed into lines from their running widths, the lines are identical
+    to IGESUnaligned(data, IGESGlobal, 'P', DirectoryPointer).
+
+    :param data: parameters, a list or a numpy array
+    :type data: list or numpy.ndarray
+    """
+    if len(data) == 0:
+        raise ValueError("Parameter data is 0 length")
+
+    return IGESPackParameters(get_encoder(IGESGlobal).encode_many(data), IGESGlobal, DirectoryPointer)
+
+
+def IGESPackParameters(Parameters, IGESGlobal, DirectoryPointer=0):
+    """parameter section lines of encoded parameters, the same lines as
+    IGESWrapParameters(Parameters, IGESGlobal, 'P', DirectoryPointer)
+
+    :param Parameters: encoded parameters, eg. ['110', '0.', '3HABC']
+    :type Parameters: list of strings
+    """
+    LineLength = IGESGlobal.LineLength - 2
+
+    if 2 * max(map(len, Parameters)) + 1 >= LineLength:
+        # Some parameter may have to be split over lines, leave that to IGESWrapParameters
+        return IGESWrapParameters(Parameters, IGESGlobal, 'P', DirectoryPointer)
+
+    lines = _pack_parameters(Parameters, LineLength,
+                             IGESGlobal.ParameterDelimiterCharacter, IGESGlobal.RecordDelimiter,
+                             "%-{}s{:>7}".format(IGESGlobal.LineLength, DirectoryPointer))
+    return lines, len(lines)
+
+
+def IGESUnalignedMany(datas, IGESGlobal, DirectoryPointers):
+    """IGESUnalignedArray for many entities at once, the parameters of all of
+    them are encoded together and then packed into each entity's lines.
+
+    :param datas: parameter list of each entity
+    :type datas: list of lists
+
+    :param DirectoryPointers: directory pointer of each entity
+    :type DirectoryPointers: list of int
+
+    :return: (lines, line count) for each entity
+    """
+    LineLength = IGESGlobal.LineLength - 2
+    Parameters = get_encoder(IGESGlobal).encode_many(list(itertools.chain.from_iterable(datas)))
+    line_template = "%-{}s{{:>7}}".format(IGESGlobal.LineLength)
+
+    compiled = list()
+    first = 0
+    for data, DirectoryPointer in zip(datas, DirectoryPointers):
+        if len(data) == 0:
+            raise ValueError("Parameter data is 0 length")
+
+        last = first + len(data)
+        if 2 * max(map(len, Parameters[first:last])) + 1 >= LineLength:
+            lines, count = IGESUnaligned(data, IGESGlobal, 'P', DirectoryPointer)
+        else:
+            lines = _pack_parameters(Parameters[first:last], LineLength,
+                                     IGESGlobal.ParameterDelimiterCharacter, IGESGlobal.RecordDelimiter,
+                                     line_template.format(DirectoryPointer))
+            count = len(lines)
+        compiled.append((lines, count))
+        first = last
+
+    return compiled
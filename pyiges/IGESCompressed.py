@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESCompressed
+   :platform: Agnostic, Windows
+   :synopsis: pyIGES's compressed layout of IGES files and converter to and from the fixed form
+
+The compressed form written here is pyIGES's own packing of a fixed form
+file and not the compressed ASCII form of the specification. It is meant
+for storing and moving files between pyIGES programs; expand or convert
+it back to the fixed form for any other reader. So that no reader takes
+it for an IGES file, it starts with the line Marker and the start records
+are not flagged C in column 73. As written here:
+
+* the first line is Marker
+* start records are the fixed 80 column S records
+* global records are the fixed 80 column G records
+* each entity is one data record, a line of its directory fields without
+  the parameter data pointer and line count, separated by the parameter
+  delimiter and closed by the record delimiter, followed by its parameter
+  data. Fields and parameters are not padded and have no sequence numbers
+* the terminate record is copied from the fixed form, so its counts are
+  the record counts of the fixed form
+
+Entities keep their order so directory pointers (2 * entity + 1) in the
+parameter data are the same in both forms. Expanding lays the parameters
+out as pyIGES does, so a file written by pyIGES comes back byte for byte.
+
+Files in the compressed ASCII form of the specification (start records
+flagged C) are not read, expand refuses them.
+
+:py:meth:`pyiges.IGESCore.IGEStorage.write` writes this form from its
+compiled sections with compress_sections, the fixed form records are not
+laid out first.
+
+.. requires itertools, operator, tempfile
+
+.. Created on Sun Oct 18 14:12:08 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+import itertools
+import operator
+import tempfile
+
+import pyiges.IGESCompile as IGESCompile
+
+# first line of a file in the compressed form, see the module documentation
+Marker = "PYIGES COMPRESSED 1"
+
+# Directory fields kept in a data record, as (record, field) of the fixed
+# form: all but the repeated entity type, parameter data pointer and line count
+_DataFields = ((0, 0), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8),
+               (1, 1), (1, 2), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8))
+
+# the kept fields out of the data columns of both directory records
+_DataSlices = operator.itemgetter(*(slice(72 * line + 8 * field, 72 * line + 8 * field + 8)
+                                    for line, field in _DataFields))
+
+
+class _Delimiters:
+    """delimiters of a file and the line length IGESCompile lays parameters out with"""
+    LineLength = 65
+
+    def __init__(self, ParameterDelimiterCharacter=",", RecordDelimiter=";"):
+        self.ParameterDelimiterCharacter = ParameterDelimiterCharacter
+        self.RecordDelimiter = RecordDelimiter
+
+    @classmethod
+    def from_global(cls, text):
+        """delimiters from the start of the global section data, the first
+        two parameters are 1H<delimiter> or empty for the defaults"""
+        delimiters = cls()
+        if text.startswith("1H"):
+            delimiters.ParameterDelimiterCharacter = text[2]
+            text = text[3:]
+        if text[:1] == delimiters.ParameterDelimiterCharacter and text[1:3] == "1H":
+            delimiters.RecordDelimiter = text[3]
+        return delimiters
+
+
+def split_parameters(text, ParameterDelimiter=",", RecordDelimiter=";"):
+    """encoded parameters of parameter data text, up to the record delimiter.
+    Hollerith strings may hold either delimiter
+
+    :return: parameters, eg. ['110', '0.', '3HA,B']
+    """
+    end = text.find(RecordDelimiter)
+    if "H" not in text[:end]:
+        if end < 0:
+            raise ValueError("Parameter data has no record delimiter", text)
+        return [Parameter.strip() for Parameter in text[:end].split(ParameterDelimiter)]
+
+    # split on the delimiter and glue the pieces of strings that hold it back together
+    pieces = text.split(ParameterDelimiter)
+    Parameters = list()
+    i = 0
+    while i < len(pieces):
+        piece = pieces[i].lstrip(" ")
+        digits = 0
+        while digits < len(piece) and piece[digits].isdigit():
+            digits += 1
+        if digits and piece[digits:digits + 1] == "H":
+            end = digits + 1 + int(piece[:digits])
+            while len(piece) < end and i + 1 < len(pieces):
+                i += 1
+                piece += ParameterDelimiter + pieces[i]
+            Parameters.append(piece[:end])
+            rest = piece[end:]
+            if RecordDelimiter in rest:
+                return Parameters
+        else:
+            end = piece.find(RecordDelimiter)
+            if end >= 0:
+                Parameters.append(piece[:end].strip())
+                return Parameters
+            Parameters.append(piece.strip())
+        i += 1
+    raise ValueError("Parameter data has no record delimiter", text)
+
+
+def _records(lines):
+    """records of a file without their line ends"""
+    return (line.rstrip("\r\n") for line in lines)
+
+
+def _data_record(fields, parameters, delimiters):
+    """data record of an entity
+
+    :param fields: data columns of its two directory records, 144 columns
+    :param parameters: data columns of its parameter lines, everything before
+        the directory pointer. That is columns 1 to 65 of a record, or more
+        where IGESWrapParameters split a string longer than a line (it
+        writes into column 65 and the first line of a split can run on)
+    """
+    ParameterDelimiter, RecordDelimiter = delimiters.ParameterDelimiterCharacter, delimiters.RecordDelimiter
+    if ParameterDelimiter in fields or RecordDelimiter in fields:
+        raise ValueError("Directory field holds a delimiter, can not compress", fields)
+    text = "".join(parameters)
+    if "H" in text:  # strings may hold blanks and go on over lines, split the parameters out
+        text = ParameterDelimiter.join(split_parameters(text, ParameterDelimiter, RecordDelimiter)) + RecordDelimiter
+    else:
+        text = "".join(map(str.rstrip, parameters))
+    return ParameterDelimiter.join(map(str.strip, _DataSlices(fields))) + RecordDelimiter + text + "\n"
+
+
+def compress(lines, stream):
+    """Write the compressed form of a fixed form file to stream
+
+    :param lines: records of the fixed form file, eg. an open file
+    :type lines: iterable of strings
+
+    :param stream: text stream for the compressed form
+    """
+    records = _records(lines)
+    directory = list()
+    delimiters = _Delimiters()
+    pending, parameters = None, list()
+
+    entity = 0
+    for record in records:
+        section = record[-8:-7]
+        if section == "P":  # the data columns run up to the directory pointer, see _data_record
+            if record[-15:-8] != pending:
+                if pending is not None:
+                    stream.write(_data_record(directory[entity], parameters, delimiters))
+                    entity += 1
+                pending, parameters = record[-15:-8], list()
+                if int(pending) != 2 * entity + 1:
+                    raise ValueError("Parameter data is not in directory order", int(pending))
+            parameters.append(record[:-15])
+        elif section == "D":
+            directory.append(record[:72] + next(records)[:72])
+        elif section == "S":
+            if record[73:80] == "      1":
+                stream.write(Marker + "\n")
+            stream.write(record + "\n")
+        elif section == "G":
+            if not directory and record[73:80] == "      1":
+                delimiters = _Delimiters.from_global(record[:72])
+            stream.write(record + "\n")
+        elif section == "T":
+            if pending is not None:
+                stream.write(_data_record(directory[entity], parameters, delimiters))
+            stream.write(record + "\n")
+
+
+def compress_sections(StartText, GlobalText, DirectoryLines, ParameterLines, TerminateRecord, stream):
+    """Write the compressed form of compiled sections to stream, the
+    same as compress of the fixed form file they make but without laying
+    out its directory and parameter records
+
+    :param StartText: start section records, as str of the section gives them
+    :param GlobalText: global section records, as str of the section gives them
+    :param DirectoryLines: data columns of the two directory records of
+        each entity in turn, as :py:class:`~pyiges.IGESCore.IGESDirectory`
+        holds them
+    :param ParameterLines: parameter lines in directory order, their data
+        columns and directory pointer, as
+        :py:class:`~pyiges.IGESCore.IGESParameter` holds them
+    :param TerminateRecord: the terminate record
+    """
+    stream.write(Marker + "\n")
+    stream.write(StartText + "\n")
+    GlobalText = GlobalText.lstrip("\n")
+    stream.write(GlobalText + "\n")
+    delimiters = _Delimiters.from_global(GlobalText[:72])
+    lines, DirectoryLines = iter(ParameterLines), iter(DirectoryLines)
+    fields = map(operator.add, DirectoryLines, DirectoryLines)  # both records of an entry, 72 columns each
+    stream.writelines(_data_record(entry, [line[:-7] for line in itertools.islice(lines, int(entry[96:104]))],
+                                   delimiters) for entry in fields)
+    stream.write(TerminateRecord.lstrip("\n") + "\n")
+
+
+def expand(lines, stream):
+    """Write the fixed form of a compressed file to stream, laid out as
+    IGEStorage.write lays it out. The directory section is written as the
+    data records are read and the parameter lines are kept in a temporary
+    file until it is complete
+
+    :param lines: lines of the compressed form file, eg. an open file
+    :type lines: iterable of strings
+
+    :param stream: text stream for the fixed form
+    :raises ValueError: when the lines do not start with Marker
+    """
+    records = _records(lines)
+    delimiters = _Delimiters()
+    line = "%8s" * 9
+
+    record = next(records, "")
+    if record != Marker:
+        if record[72:73] == "C":
+            raise ValueError("The compressed ASCII form of the specification is not read, only pyIGES's own")
+        raise ValueError("Not a pyIGES compressed file", record)
+    record = next(records, "")
+    separator = ""
+    while record[72:73] == "S" and len(record) == 80:
+        stream.write(separator + record)
+        separator = "\n"
+        record = next(records, "")
+    if record[72:73] == "G" and len(record) == 80:
+        delimiters = _Delimiters.from_global(record[:72])
+    while record[72:73] == "G" and len(record) == 80:
+        stream.write("\n" + record)
+        record = next(records, "")
+
+    DirectoryPointer, ParameterPointer = 1, 1
+    with tempfile.TemporaryFile(mode='w+', newline='\n') as parameter_section:
+        for following in records:
+            fields, text = record.split(delimiters.RecordDelimiter, 1)
+            fields = fields.split(delimiters.ParameterDelimiterCharacter)
+            if len(fields) != len(_DataFields):
+                raise ValueError("Data record does not have {} directory fields".format(len(_DataFields)), record)
+
+            Parameters = split_parameters(text, delimiters.ParameterDelimiterCharacter, delimiters.RecordDelimiter)
+            ParameterLines, ParameterLineCount = IGESCompile.IGESPackParameters(Parameters, delimiters, DirectoryPointer)
+            parameter_section.writelines(IGESCompile.iter_records(ParameterLines, "P", ParameterPointer))
+
+            stream.write(IGESCompile.format_line(
+                [line % (fields[0], ParameterPointer, *fields[1:8]),
+                 line % (fields[0], fields[8], fields[9], ParameterLineCount, *fields[10:])],
+                "D", DirectoryPointer))
+            DirectoryPointer += 2
+            ParameterPointer += ParameterLineCount
+            record = following
+
+        parameter_section.seek(0)
+        for line in parameter_section:
+            stream.write(line)
+
+    stream.write("\n" + record)  # the terminate record
+
+
+def is_compressed(filename):
+    """True when the first line of filename is Marker"""
+    with open(filename) as myFile:
+        return myFile.readline().rstrip("\r\n") == Marker
+
+
+def convert(source, target):
+    """Convert the IGES file source to the other form, fixed to compressed
+    or compressed to fixed, and write it to target
+
+    :return: form written, "compressed" or "fixed"
+    """
+    compressed = is_compressed(source)
+    with open(source) as sourceFile, open(target, 'w', newline='\n') as targetFile:
+        if compressed:
+            expand(sourceFile, targetFile)
+        else:
+            compress(sourceFile, targetFile)
+    return "fixed" if compressed else "compressed"
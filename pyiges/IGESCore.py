@@ -13,6 +13,21 @@
 
 """
 
+import array
+import bz2
+import collections
+import concurrent.futures
+import functools
+import gzip
+import hashlib
+import io
+import itertools
+import lzma
+import mmap
+import numbers
+import operator
+import os
+import tempfile
 
 from pyiges.IGESOptions import (IGESModelUnits,
                                 IGESEntityTypeNumber,
@@ -23,6 +38,8 @@ from pyiges.IGESOptions import (IGESModelUnits,
                                 IGESDateTime)
 
 import pyiges.IGESCompile as IGESCompile
+import pyiges.IGESCompressed as IGESCompressed
+from pyiges.IGESGraph import IGESReferenceGraph
 
 
 class IGESectionFunctions:
@@ -40,12 +57,157 @@ class IGESectionFunctions:
         self._linecount = self._linecount + len(lines)
         self._data.extend(lines)
 
+    def WriteSection(self, stream):
+        """write the section records to stream one line at a time, the output
+        is the same as str() of the section but no section string is built"""
+        IGESCompile.write_lines(stream, self._data, self.LetterCode)
+
+    def RecordBlocks(self, chunk_size=4096):
+        """split the section into blocks of up to chunk_size records, yields
+        (first, count, render) where render() gives records first + 1 to
+        first + count as WriteSection writes them. The lines are read in
+        order so spooled sections work as well"""
+        lines = iter(self._data)
+        first = 0
+        while True:
+            block = list(itertools.islice(lines, chunk_size))
+            if not block:
+                return
+            yield first, len(block), functools.partial(IGESCompile.format_line, block, self.LetterCode, first + 1)
+            first += len(block)
+
+
+class IGESSpool:
+    """Line store kept in a temporary file rather than in memory.
+
+    Stands in for the list held in IGESectionFunctions._data when the storage
+    is created with spool=True, lines are appended as entities are committed
+    and read back one at a time when the section is written.
+    """
+    def __init__(self):
+        self._file = tempfile.TemporaryFile(mode='w+', newline='\n')
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        self._file.seek(0)
+        for line in self._file:
+            yield line[:-1]
+        self._file.seek(0, io.SEEK_END)
+
+    def extend(self, lines):
+        self._file.seek(0, io.SEEK_END)
+        for line in lines:
+            self._file.write(line)
+            self._file.write("\n")
+            self._length += 1
+
+    def close(self):
+        self._file.close()
+
 
 class IGESParameterEntry:
     def __init__(self):
         pass
 
 
+# Directory entry fields in record order, item 1 (the entity type) starts
+# both records and two reserved fields come before the label on the second
+DirectoryFields = ('EntityType', 'ParameterDataPointer', 'Structure', 'LineFontPattern', 'Level',
+                   'View', 'TransfrmMat', 'LabelDispAssoc', 'StatusNumber', 'LineWeightNum', 'Color',
+                   'ParameterLineCount', 'FormNumber', 'EntityLabel', 'EntitySubScript')
+
+# Precompiled directory layouts by entity type, see register_directory_layout
+_DirectoryLines = dict()
+_DirectoryRecords = dict()
+
+
+def _directory_layout(blank):
+    """% templates of the two lines of a directory entry leaving the blank
+    fields empty, and of both records with their sequence numbers"""
+    def field(name):
+        if name in blank:
+            return "%8.0s"  # takes the value but writes nothing
+        return "%08d" if name == "StatusNumber" else "%8s"
+
+    Line1 = "".join(map(field, DirectoryFields[:9]))
+    Line2 = field('EntityType') + "".join(map(field, DirectoryFields[9:13])) + " " * 16 + \
+            "".join(map(field, DirectoryFields[13:]))
+    return (Line1, Line2), "\n" + Line1 + "D%7d\n" + Line2 + "D%7d"
+
+
+def register_directory_layout(EntityType, blank=()):
+    """Register the directory entry layout of an entity type, entities of
+    that type write the named DirectoryFields as blanks. The templates are
+    made once here and used by IGESItemData.CompileDirectory and
+    IGESDirectoryTable for every entry of the type.
+
+    :param int EntityType: entity type number
+    :param blank: names from DirectoryFields that the entity type does not use
+    """
+    unknown = set(blank) - set(DirectoryFields)
+    if unknown:
+        raise ValueError("Unknown directory fields", sorted(unknown))
+    _DirectoryLines[EntityType], _DirectoryRecords[EntityType] = _directory_layout(frozenset(blank))
+
+
+_DirectoryDefaultLines, _DirectoryDefaultRecords = _directory_layout(frozenset())
+
+register_directory_layout(404, blank=('Structure', 'LineFontPattern', 'Level', 'View', 'TransfrmMat',   # Drawing Entity
+                                      'LabelDispAssoc', 'LineWeightNum', 'Color'))
+register_directory_layout(406, blank=('Structure', 'LineFontPattern', 'View', 'TransfrmMat',            # Property Entity
+                                      'LabelDispAssoc', 'LineWeightNum', 'Color'))
+register_directory_layout(410, blank=('Structure', 'LineFontPattern', 'Level', 'View',                  # View Entity
+                                      'LabelDispAssoc', 'LineWeightNum', 'Color'))
+
+
+def _dedup_value(item):
+    """a parameter as the plain int, float or str it is encoded as, see
+    :py:class:`pyiges.IGESCompile.IGESParameterEncoder`"""
+    if type(item) in (int, float, str):
+        return item
+    if isinstance(item, float):
+        return float(item)
+    if isinstance(item, (bool, numbers.Integral)):
+        return int(item)
+    if isinstance(item, numbers.Real):
+        return float(item)
+    return item
+
+
+# every change of parameter data takes the next number, see IGESParameterList
+_ParameterVersions = itertools.count(1)
+
+
+class IGESParameterList(list):
+    """Parameter data of an entity, a list that takes a new version number
+    each time it is changed so a deferred storage can tell which entities
+    to compile again without keeping a copy of their parameters
+    (see IGESItemData.IsDirty)"""
+    __slots__ = ('version',)
+
+    def __init__(self, *args):
+        list.__init__(self, *args)
+        self.version = next(_ParameterVersions)
+
+
+def _changes(name):
+    method = getattr(list, name)
+
+    def change(self, *args):
+        self.version = next(_ParameterVersions)
+        return method(self, *args)
+    change.__name__ = name
+    return change
+
+
+for _name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend', 'insert', 'pop',
+              'remove', 'clear', 'sort', 'reverse'):
+    setattr(IGESParameterList, _name, _changes(_name))
+
+
 class IGESItemData:
     """IGES Item Data
 
@@ -55,7 +217,18 @@ class IGESItemData:
     3) Update ParameterLineCount
     4) get ParameterDataPointer
     5) compile directory data (which relies on ParameterLineCount and ParameterDataPointer)
+
+    Entities use __slots__ so a model of millions of entities does not need a
+    dictionary for each one, subclasses list their own extra attributes.
+    The compiled lines are released once the storage has written them.
     """
+    __slots__ = ('DirectoryDataPointer', 'ParameterDataPointer', 'ParameterLineCount',
+                 '_ParameterData',
+                 'EntityType', 'Structure', 'LineFontPattern', 'Level', 'View', 'TransfrmMat',
+                 'LabelDispAssoc', 'StatusNumber', 'LineWeightNum', 'Color', 'FormNumber',
+                 'EntityLabel', 'EntitySubScript', 'add_extended_data',
+                 'CompiledDirectory', 'CompiledParameter', 'CompiledState')
+
     def __init__(self):
         #Pointers and data that needs updating
         self.DirectoryDataPointer = IGESPointer()       # Pointer,           First line of Directory Data
@@ -82,62 +255,75 @@ class IGESItemData:
 
         self.add_extended_data = False                   # Some items seem to needs this whilst other do not
 
-        #Compiled items
-        self.CompiledDirectory = list()
-        self.CompiledParameter = list()
+        #Compiled items, empty until compiled and again once written
+        self.CompiledDirectory = ()
+        self.CompiledParameter = ()
+        self.CompiledState = None                       # _State() when CompiledParameter was made
+
+    @property
+    def ParameterData(self):
+        """the parameters after the entity type, an IGESParameterList"""
+        return self._ParameterData
+
+    @ParameterData.setter
+    def ParameterData(self, data):
+        self._ParameterData = IGESParameterList(data)
 
     def AddParameters(self, data):
         try:
+            if hasattr(data, 'ravel'):  # numpy array, store plain python numbers
+                data = data.ravel().tolist()
             self.ParameterData.extend(list(data))
         except Exception as inst:
             raise TypeError(inst)
 
     def CompileDirectory(self):
-        items = [self.EntityType.getValue(),             # Item 1
-                 self.ParameterDataPointer.data,         # Item 2
-                 self.Structure,                         # Item 3
-                 self.LineFontPattern.getValue(),        # Item 4
-                 self.Level,                             # Item 5
-                 self.View,                              # Item 6
-                 self.TransfrmMat,                       # Item 7
-                 self.LabelDispAssoc,                    # Item 8
-                 str(self.StatusNumber),                 # Item 9
-                 self.LineWeightNum,                     # Item 12
-                 self.Color.getValue(),                  # Item 13
-                 self.ParameterLineCount,                # Item 14
-                 self.FormNumber,                        # Item 15
-                 "", "",                                 # Item 16, 17 Reserved
-                 self.EntityLabel[:8],                   # Item 18
-                 self.EntitySubScript]                   # Item 19
-
-        # some entity types require that some values are left out
-        if self.EntityType.getValue() == 404: # Drawing Entity
-            Line1Template = "{p[0]:>8}{p[1]:>8}{p[8]:>56}"
-            Line2Template = "{p[0]:>8}{p[11]:>24}{p[12]:>8}{p[13]:>8}{p[14]:>8}{p[15]:>8}{p[16]:>8}"
-        elif self.EntityType.getValue() == 406: # Property Entity
-            Line1Template = "{p[0]:>8}{p[1]:>8}{p[4]:>24}{p[8]:>32}"
-            Line2Template = "{p[0]:>8}{p[11]:>24}{p[12]:>8}{p[13]:>8}{p[14]:>8}{p[15]:>8}{p[16]:>8}"
-        elif self.EntityType.getValue() == 410: # View Entity
-            Line1Template = "{p[0]:>8}{p[1]:>8}{p[6]:>40}{p[8]:>16}"
-            Line2Template = "{p[0]:>8}{p[11]:>24}{p[12]:>8}{p[13]:>8}{p[14]:>8}{p[15]:>8}{p[16]:>8}"
-        else:
-            Line1Template = "{p[0]:>8}{p[1]:>8}{p[2]:>8}{p[3]:>8}{p[4]:>8}{p[5]:>8}{p[6]:>8}{p[7]:>8}{p[8]:>8}"
-            Line2Template = "{p[0]:>8}{p[9]:>8}{p[10]:>8}{p[11]:>8}{p[12]:>8}{p[13]:>8}{p[14]:>8}{p[15]:>8}{p[16]:>8}"
-
-        self.CompiledDirectory = [Line1Template.format(p = items)]
-        self.CompiledDirectory.append(Line2Template.format(p = items))
-
+        """the two directory lines, in the layout registered for the entity
+        type (see register_directory_layout)"""
+        EntityType = self.EntityType.value
+        Line1, Line2 = _DirectoryLines.get(EntityType, _DirectoryDefaultLines)
+        self.CompiledDirectory = [Line1 % (EntityType,                          # Item 1
+                                           self.ParameterDataPointer.data,      # Item 2
+                                           self.Structure,                      # Item 3
+                                           self.LineFontPattern.value,          # Item 4
+                                           self.Level,                          # Item 5
+                                           self.View,                           # Item 6
+                                           self.TransfrmMat,                    # Item 7
+                                           self.LabelDispAssoc,                 # Item 8
+                                           self.StatusNumber.word),             # Item 9
+                                  Line2 % (EntityType,                          # Item 11
+                                           self.LineWeightNum,                  # Item 12
+                                           self.Color.value,                    # Item 13
+                                           self.ParameterLineCount,             # Item 14
+                                           self.FormNumber,                     # Item 15, 16, 17 Reserved
+                                           self.EntityLabel[:8],                # Item 18
+                                           self.EntitySubScript)]               # Item 19
         return self.CompiledDirectory
 
-    def CompileParameters(self, IGESGlobal):
-        #IGESGlobal is required because we need IGESGlobal.ParameterDelimiterCharacter
+    def GetParameters(self):
+        """entity type number followed by the parameter data, as written to the parameter section"""
         cdata = [self.EntityType.value]
-        cdata.extend(self.ParameterData[:])
+        cdata.extend(self.ParameterData)
 
         if self.add_extended_data:
             cdata.extend([0, 0])
 
-        self.CompiledParameter, self.ParameterLineCount = IGESCompile.IGESUnaligned(cdata, IGESGlobal, 'P', self.DirectoryDataPointer.data)
+        return cdata
+
+    def _State(self):
+        """what GetParameters depends on: the version of the parameter data,
+        the entity type and whether the extended data is added"""
+        return self._ParameterData.version, self.EntityType.value, self.add_extended_data
+
+    def IsDirty(self):
+        """True when the parameters changed since the parameter lines were
+        compiled, through ParameterData (see IGESParameterList), the
+        methods that add to it or the entity type"""
+        return self.CompiledState != self._State()
+
+    def CompileParameters(self, IGESGlobal):
+        #IGESGlobal is required because we need IGESGlobal.ParameterDelimiterCharacter
+        self.CompiledParameter, self.ParameterLineCount = IGESCompile.IGESUnalignedArray(self.GetParameters(), IGESGlobal, self.DirectoryDataPointer.data)
         return self.CompiledParameter
 
 
@@ -154,8 +340,6 @@ class IGEStart(IGESectionFunctions):
         "|............BEWARE: UNITS WILL NOT BE CORRECT AT ALL.................."]
 
     def __str__(self):
-        out = ""
-
         if isinstance(self.Prolog, str):
             self.Prolog = self._string_to_lists(self.Prolog)
         elif isinstance(self.Prolog, list):
@@ -165,15 +349,11 @@ class IGEStart(IGESectionFunctions):
                     for sub_element in prolog_element:
                         temp_list.extend(self._string_to_lists(sub_element))
                 else:
-                    temp_list.extend(self._string_to_lists(sub_element))
+                    temp_list.extend(self._string_to_lists(prolog_element))
             self.Prolog = temp_list
 
-        for i, line in enumerate(self.Prolog):
-            next = "{0:72}S{1:7}\n".format(line, i + 1)
-            out += next
-            self._linecount += 1
-        self._linecount -= 1
-        return out.rstrip()
+        self._linecount += len(self.Prolog) - 1
+        return IGESCompile.format_line(self.Prolog, self.LetterCode).lstrip("\n")
 
     def _string_to_lists(self, string, length=72):
         chunks = len(string)
@@ -195,7 +375,7 @@ class IGESGlobal(IGESDateTime, IGESModelUnits, IGESectionFunctions):
         self.SPMagnitude = int(19)                          # 8, Integer
         self.SPSignificance = int(3)                        # 9, Integer
         self.DPMagnitude = int(38)                          # 10, Integer
-        self.DPSignificance = int(6)                        # 11, Integer
+        self.DPSignificance = int(15)                       # 11, Integer
         self.ProductIdentificationForReceiver = "IGESFile"  # 12, String
         self.ModelSpaceScale = float(1)                     # 13, Real
         self.Units = IGESModelUnits()                       # 14 = Integer, 15 = Flag
@@ -211,6 +391,10 @@ class IGESGlobal(IGESDateTime, IGESModelUnits, IGESectionFunctions):
         self.DateTimeCreated = str(IGESDateTime())          # 25, String
         self.AppProtocol = "0"                              # 26, String
 
+        # How reals are written, "significance" rounds to DPSignificance
+        # digits and "shortest" writes the exact shortest round trip value
+        self.RealFormat = "significance"
+
     def GetItems(self):
         return [self.ParameterDelimiterCharacter, self.RecordDelimiter,
          self.ProductIdentificationFromSender, self.FileName, self.NativeSystemID,
@@ -234,6 +418,171 @@ class IGESDirectory(IGESectionFunctions):
     def __init__(self):
         IGESectionFunctions.__init__(self)
 
+    def AddEntities(self, IGESObjects):
+        """compile the directory entries of entities that have their pointers
+        and line counts, add the lines and release them from the entities"""
+        for IGESObject in IGESObjects:
+            IGESObject.CompileDirectory()
+        self.AddLines(list(itertools.chain.from_iterable(
+            IGESObject.CompiledDirectory for IGESObject in IGESObjects)))
+        for IGESObject in IGESObjects:
+            IGESObject.CompiledDirectory = ()
+
+    def iter_lines(self):
+        """the data columns of the two directory records of each entry"""
+        return iter(self._data)
+
+    def AddRows(self, rows):
+        """add directory entries given as their DirectoryFields values, in
+        the layout registered for each entity type"""
+        lines = list()
+        for row in rows:
+            Line1, Line2 = _DirectoryLines.get(row[0], _DirectoryDefaultLines)
+            lines.append(Line1 % row[:9])
+            lines.append(Line2 % ((row[0], ) + row[9:]))
+        self.AddLines(lines)
+
+
+class IGESDirectoryTable(IGESDirectory):
+    """Directory section kept as a table with a column for each directory
+    field instead of two lines for each entity. Integer fields are
+    array('i') columns, the status number is the packed status word and
+    the label and subscript are lists of strings. Row i is the entity with
+    directory pointer 2 * i + 1.
+
+    The records are rendered in chunks, one % format for all the entries of
+    a chunk using the layouts of register_directory_layout. The columns can be edited in bulk without the entities, eg.
+    ``table.update(table.select(EntityType=128), Level=5)``
+    """
+    Fields = DirectoryFields
+    TextFields = ('EntityLabel', 'EntitySubScript')
+
+    # Fields holding a directory pointer, and the ones where a negative
+    # value is a pointer and a positive value a number
+    PointerFields = ('View', 'TransfrmMat', 'LabelDispAssoc')
+    NegatedPointerFields = ('Structure', 'LineFontPattern', 'Level', 'Color')
+
+    _getters = (operator.attrgetter('EntityType.value'), operator.attrgetter('ParameterDataPointer.data'),
+                operator.attrgetter('Structure'), operator.attrgetter('LineFontPattern.value'),
+                operator.attrgetter('Level'), operator.attrgetter('View'),
+                operator.attrgetter('TransfrmMat'), operator.attrgetter('LabelDispAssoc'),
+                operator.attrgetter('StatusNumber.word'), operator.attrgetter('LineWeightNum'),
+                operator.attrgetter('Color.value'), operator.attrgetter('ParameterLineCount'),
+                operator.attrgetter('FormNumber'), lambda IGESObject: IGESObject.EntityLabel[:8],
+                operator.attrgetter('EntitySubScript'))
+
+    def __init__(self):
+        IGESDirectory.__init__(self)
+        self.columns = dict((field, list() if field in self.TextFields else array.array('i'))
+                            for field in self.Fields)
+
+    def __len__(self):
+        return len(self.columns['EntityType'])
+
+    def AddEntities(self, IGESObjects):
+        """add the directory fields of entities that have their pointers and
+        line counts"""
+        for field, getter in zip(self.Fields, self._getters):
+            values = map(getter, IGESObjects)
+            self.columns[field].extend(values if field in self.TextFields else map(int, values))
+        self._linecount += 2 * len(IGESObjects)
+
+    def AddRows(self, rows):
+        """add directory entries given as their DirectoryFields values"""
+        rows = list(rows)
+        for field, column in zip(self.Fields, zip(*rows)):
+            self.columns[field].extend(column if field in self.TextFields else map(int, column))
+        self._linecount += 2 * len(rows)
+
+    def iter_lines(self, chunk_size=4096):
+        """the data columns of the two directory records of each entry,
+        rendered a chunk at a time as render does"""
+        for first in range(0, len(self), chunk_size):
+            columns = [self.columns[field][first:first + chunk_size] for field in self.Fields]
+            EntityType = columns[0]
+            template = "".join(map("".join, map(_DirectoryLines.get, EntityType,
+                                                itertools.repeat(_DirectoryDefaultLines))))
+            text = template % tuple(itertools.chain.from_iterable(zip(*columns[:9], EntityType, *columns[9:])))
+            yield from (text[start:start + 72] for start in range(0, len(text), 72))
+
+    def AddLines(self, lines):
+        """add directory entries given as the data columns of their two
+        records, as IGESDirectory keeps them. Blank numbers are read as 0
+
+        :raises ValueError: when there is not a second line to every first
+            one, or a number field is not a number
+        """
+        if len(lines) % 2:
+            raise ValueError("A directory entry is two lines", len(lines))
+        rows = list()
+        for Line1, Line2 in zip(lines[0::2], lines[1::2]):
+            fields = [Line1[i:i + 8] for i in range(0, 72, 8)] + [Line2[i:i + 8] for i in range(8, 40, 8)]
+            rows.append(tuple(int(field) if field.strip() else 0 for field in fields) +
+                        (Line2[56:64].strip(), Line2[64:72].strip()))
+        self.AddRows(rows)
+
+    def select(self, **conditions):
+        """rows where every named field has the given value, eg. select(EntityType=128)"""
+        rows = range(0, len(self))
+        for field, value in conditions.items():
+            column = self.columns[field]
+            if isinstance(rows, range):
+                rows = list(itertools.compress(rows, map(operator.eq, column, itertools.repeat(value))))
+            else:
+                rows = [row for row in rows if column[row] == value]
+        return rows
+
+    def update(self, rows=None, **values):
+        """set fields to a value for the given rows, or all rows when rows is None"""
+        for field, value in values.items():
+            column = self.columns[field]
+            if rows is None:
+                column[:] = ([value] if field in self.TextFields else array.array('i', [int(value)])) * len(column)
+            else:
+                if field not in self.TextFields:
+                    value = int(value)
+                for row in rows:
+                    column[row] = value
+
+    def renumber(self, function):
+        """change every directory pointer held in the table to function(pointer),
+        for example after entities were moved or the directory was rebased"""
+        for field in self.PointerFields:
+            column = self.columns[field]
+            column[:] = array.array('i', [function(value) if value > 0 else value for value in column])
+        for field in self.NegatedPointerFields:
+            column = self.columns[field]
+            column[:] = array.array('i', [-function(-value) if value < 0 else value for value in column])
+
+    def shift_parameters(self, offset):
+        """add offset to every parameter data pointer"""
+        column = self.columns['ParameterDataPointer']
+        column[:] = array.array('i', map(offset.__add__, column))
+
+    def render(self, first=0, last=None):
+        """D records of rows first to last as one string, every record
+        starting with a new line like :py:func:`pyiges.IGESCompile.write_lines`"""
+        last = len(self) if last is None else last
+        columns = [self.columns[field][first:last] for field in self.Fields]
+        EntityType = columns[0]
+        template = "".join(map(_DirectoryRecords.get, EntityType,
+                               itertools.repeat(_DirectoryDefaultRecords)))
+        return template % tuple(itertools.chain.from_iterable(zip(
+            *columns[:9], itertools.count(2 * first + 1, 2),
+            EntityType, *columns[9:], itertools.count(2 * first + 2, 2))))
+
+    def WriteSection(self, stream, chunk_size=4096):
+        for first in range(0, len(self), chunk_size):
+            stream.write(self.render(first, first + chunk_size))
+
+    def RecordBlocks(self, chunk_size=4096):
+        for first in range(0, len(self), chunk_size):
+            last = min(first + chunk_size, len(self))
+            yield 2 * first, 2 * (last - first), functools.partial(self.render, first, last)
+
+    def __str__(self):
+        return self.render().rstrip()
+
 
 class IGESParameter(IGESectionFunctions):
     LetterCode = "P"
@@ -252,35 +601,480 @@ class IGESTerminate:
                                             "T", 1)
 
 
+def _balanced_chunks(sizes, count):
+    """split a list of item sizes into at most count runs of about the same
+    total size, returned as (first, last) index pairs"""
+    total = sum(sizes)
+    chunks = list()
+    first = 0
+    running = 0
+    for i, size in enumerate(sizes):
+        running += size
+        if running * count >= total * (len(chunks) + 1):
+            chunks.append((first, i + 1))
+            first = i + 1
+    if first < len(sizes):
+        chunks.append((first, len(sizes)))
+    return chunks
+
+
+# Compression codecs of IGEStorage.save, name: (file suffix, opener). The
+# opener takes a file name or binary stream and the level, None for the
+# default level of the codec
+_Compressions = {
+    "gzip": (".gz", lambda target, level: gzip.open(target, 'wb', 9 if level is None else level)),
+    "bz2": (".bz2", lambda target, level: bz2.open(target, 'wb', 9 if level is None else level)),
+    "lzma": (".xz", lambda target, level: lzma.open(target, 'wb', preset=level)),
+    }
+
+
+def _compression_from_suffix(filename):
+    """name of the codec for the suffix of filename, or None"""
+    for name, (suffix, opener) in _Compressions.items():
+        if os.fspath(filename).lower().endswith(suffix):
+            return name
+    return None
+
+
 class IGEStorage(IGESTerminate):
-    """IGES Storage"""
-    def __init__(self):  # Wrap core functions
+    """IGES Storage
+
+    :param spool: keep the directory and parameter lines in temporary files
+        instead of memory, for models with millions of parameter lines
+    :type spool: bool
+
+    :param workers: compile parameter lines in this many processes. Committed
+        entities only get their directory pointer and are compiled together
+        when the file is written (or flush is called), so on Windows the
+        program needs the usual ``if __name__ == "__main__":`` guard
+    :type workers: int
+
+    :param deferred: only give committed entities their directory pointer and
+        compile them when the file is written, so entities can still be
+        changed after Commit. A later write only compiles the parameter lines
+        of the entities that changed and reuses the lines of the others
+    :type deferred: bool
+
+    :param directory_table: keep the directory section as a
+        :py:class:`IGESDirectoryTable`, the storage then holds the directory
+        fields as integer columns that are rendered in bulk and can be edited
+        through DirectorySection after Commit
+    :type directory_table: bool
+
+    :param dedup: commit an entity only once when the same entity (type, form,
+        directory attributes and parameters) is committed again, Commit then
+        returns the directory pointer of the first one. Physically dependent
+        entities belong to one parent and are always committed. True
+        remembers the last 65536 distinct entities, a number sets how many
+    :type dedup: bool or int
+
+    :param references: build the :py:class:`~pyiges.IGESGraph.IGESReferenceGraph`
+        of the entities as they are added to the directory, see reference_graph
+    :type references: bool
+    """
+    DedupEntries = 65536
+
+    def __init__(self, spool=False, workers=None, deferred=False, directory_table=False,
+                 dedup=False, references=False):  # Wrap core functions
         self.StartSection = IGEStart()
-        self.DirectorySection = IGESDirectory()
-        self.ParameterSection = IGESParameter()
         self.GlobalSection = IGESGlobal()
 
+        self._spool = spool
+        self._directory_table = directory_table
+        self._references = references
+        self._NewSections()
+
+        self._workers = workers
+        self._pending = list()
+
+        self._deferred = deferred
+        self._entities = list()
+        self._compiled_settings = None
+
+        if dedup and deferred:
+            raise ValueError("dedup can not be used with deferred, entities may change after Commit")
+        self._dedup = self.DedupEntries if dedup is True else int(dedup)
+        self._digests = collections.OrderedDict()
+        self._dedup_counts = collections.Counter()
+
+    def _NewSections(self):
+        """start empty directory and parameter sections"""
+        self.DirectorySection = IGESDirectoryTable() if self._directory_table else IGESDirectory()
+        self.ParameterSection = IGESParameter()
+
+        if self._spool:
+            if not self._directory_table:
+                self.DirectorySection._data = IGESSpool()
+            self.ParameterSection._data = IGESSpool()
+
+        self._graph = IGESReferenceGraph() if self._references else None
+
     def Commit(self, IGESObject):
+        """Add an entity to the storage, returns its directory pointer"""
+        if self._Deduplicable(IGESObject):
+            known = self._Deduplicate(IGESObject, self.DirectorySection._linecount + 2 * len(self._pending))
+            if known is not None:
+                IGESObject.DirectoryDataPointer = IGESPointer(known)
+                return IGESObject.DirectoryDataPointer
+
+        self._Commit(IGESObject)
+        return IGESObject.DirectoryDataPointer
+
+    def _Commit(self, IGESObject):
+        if self._deferred:
+            IGESObject.DirectoryDataPointer = IGESPointer(2 * len(self._entities) + 1)
+            self._entities.append(IGESObject)
+            return
+
+        if self._workers:
+            IGESObject.DirectoryDataPointer = IGESPointer(self.DirectorySection._linecount + 2 * len(self._pending))
+            self._pending.append(IGESObject)
+            return
 
         IGESObject.DirectoryDataPointer = self.DirectorySection.getNewPointer()
         IGESObject.CompileParameters(self.GlobalSection)
         IGESObject.ParameterDataPointer = self.ParameterSection.getNewPointer()
-        IGESObject.CompileDirectory()
 
         self.ParameterSection.AddLines(IGESObject.CompiledParameter)
-        self.DirectorySection.AddLines(IGESObject.CompiledDirectory)
+        self.DirectorySection.AddEntities([IGESObject])
+        IGESObject.CompiledParameter = ()
+        if self._graph is not None:
+            self._graph.add_entity(IGESObject)
+
+    def commit_many(self, IGESObjects, chunk_size=1024):
+        """Commit every entity of an iterable, gives the same file as calling
+        Commit on each one but with less work per entity.
+
+        The iterable is consumed in chunks so generators never have to be
+        turned into lists. Each entity gets its directory pointer as soon as
+        it is taken from the iterable, so an entity created later by a
+        generator can refer to one that came before it. The chunk is then
+        compiled, its parameter pointers come from a running total of the
+        parameter line counts and the lines are added to the sections in one
+        go. The parameters of a whole chunk are encoded together, see
+        :py:func:`pyiges.IGESCompile.IGESUnalignedMany`.
+
+        :param IGESObjects: entities to commit, in file order
+        :type IGESObjects: iterable of :py:class:`~pyiges.IGESCore.IGESItemData`
+
+        :return: number of entities committed
+        """
+        IGESObjects = iter(IGESObjects)
+        committed = 0
+
+        if self._deferred or self._workers or self._dedup:
+            for IGESObject in IGESObjects:
+                self.Commit(IGESObject)
+                committed += 1
+            return committed
+
+        while True:
+            chunk = list()
+            DirectoryPointer = self.DirectorySection._linecount
+            for IGESObject in itertools.islice(IGESObjects, chunk_size):
+                IGESObject.DirectoryDataPointer = IGESPointer(DirectoryPointer)
+                DirectoryPointer += 2
+                chunk.append(IGESObject)
+
+            if not chunk:
+                return committed
+
+            self._CommitChunk(chunk)
+            committed += len(chunk)
+
+    def _Deduplicable(self, IGESObject):
+        """True when the dedup mode is on and IGESObject may be shared with an
+        identical entity. A physically dependent entity belongs to its one
+        parent, it is never shared"""
+        return bool(self._dedup) and not IGESObject.StatusNumber.Subordinate.value & 1
+
+    def _Deduplicate(self, IGESObject, DirectoryPointer):
+        """directory pointer of an identical entity committed before, or None
+        after remembering IGESObject as the entity at DirectoryPointer. Only
+        a digest of each entity is kept, for the last self._dedup entities.
+        The values are taken as what they are written as (see _dedup_value),
+        so numpy.float64(1.0) is the same as 1.0 but not as 1"""
+        key = hashlib.blake2b(repr((
+            tuple(map(int, (IGESObject.Structure, IGESObject.LineFontPattern.value, IGESObject.Level,
+                            IGESObject.View, IGESObject.TransfrmMat, IGESObject.LabelDispAssoc,
+                            IGESObject.StatusNumber.word, IGESObject.LineWeightNum, IGESObject.Color.value,
+                            IGESObject.FormNumber))),
+            IGESObject.EntityLabel, IGESObject.EntitySubScript,
+            tuple(map(_dedup_value, IGESObject.GetParameters())))).encode(), digest_size=16).digest()
+
+        known = self._digests.get(key)
+        if known is not None:
+            self._digests.move_to_end(key)
+            self._dedup_counts['hits'] += 1
+            return known
+
+        self._digests[key] = DirectoryPointer
+        self._dedup_counts['misses'] += 1
+        if len(self._digests) > self._dedup:
+            self._digests.popitem(last=False)
+            self._dedup_counts['evicted'] += 1
+        return None
+
+    def dedup_stats(self):
+        """hits, misses, evicted and remembered entities of the dedup mode"""
+        return {'hits': self._dedup_counts['hits'],
+                'misses': self._dedup_counts['misses'],
+                'evicted': self._dedup_counts['evicted'],
+                'entries': len(self._digests)}
+
+    def _CommitChunk(self, IGESObjects):
+        """compile and add entities that already have the next directory
+        pointers, in order"""
+        self._AddCompiled(IGESObjects, IGESCompile.IGESUnalignedMany(
+            [IGESObject.GetParameters() for IGESObject in IGESObjects],
+            self.GlobalSection,
+            [IGESObject.DirectoryDataPointer.data for IGESObject in IGESObjects]))
+
+    def _AddCompiled(self, IGESObjects, compiled):
+        """store the compiled parameters of entities that already have their
+        directory pointers and add them to the sections"""
+        for IGESObject, (CompiledParameter, ParameterLineCount) in zip(IGESObjects, compiled):
+            IGESObject.CompiledParameter = CompiledParameter
+            IGESObject.ParameterLineCount = ParameterLineCount
+        self._AddEntities(IGESObjects)
+        for IGESObject in IGESObjects:
+            IGESObject.CompiledParameter = ()
+
+    def _AddEntities(self, IGESObjects):
+        """give compiled entities parameter pointers from a running total of
+        the line counts and add them to the sections"""
+        ParameterPointers = itertools.accumulate(
+            itertools.chain((self.ParameterSection._linecount, ),
+                            (IGESObject.ParameterLineCount for IGESObject in IGESObjects)))
+        for IGESObject, ParameterPointer in zip(IGESObjects, ParameterPointers):
+            IGESObject.ParameterDataPointer = IGESPointer(ParameterPointer)
+
+        self.ParameterSection.AddLines(list(itertools.chain.from_iterable(
+            IGESObject.CompiledParameter for IGESObject in IGESObjects)))
+        self.DirectorySection.AddEntities(IGESObjects)
+        if self._graph is not None:
+            for IGESObject in IGESObjects:
+                self._graph.add_entity(IGESObject)
+
+    def _CompileMany(self, datas, DirectoryPointers, chunk_size=1024):
+        """compile the parameters of many entities, in the process pool when
+        the storage has workers"""
+        if not self._workers:
+            return list(itertools.chain.from_iterable(
+                IGESCompile.IGESUnalignedMany(datas[first:first + chunk_size], self.GlobalSection,
+                                              DirectoryPointers[first:first + chunk_size])
+                for first in range(0, len(datas), chunk_size)))
+
+        chunks = _balanced_chunks([len(data) for data in datas], 4 * self._workers)
+        with concurrent.futures.ProcessPoolExecutor(self._workers) as executor:
+            compiled = executor.map(IGESCompile.IGESUnalignedMany,
+                                    [datas[first:last] for first, last in chunks],
+                                    itertools.repeat(self.GlobalSection),
+                                    [DirectoryPointers[first:last] for first, last in chunks])
+            return list(itertools.chain.from_iterable(compiled))
+
+    def flush(self):
+        """Compile the entities committed since the last flush when the storage
+        has workers. The parameters are split into chunks of about the same
+        size that are compiled in a process pool, the parameter pointers and
+        directory entries are then done in order in this process.
+
+        A deferred storage compiles the parameters of the entities that are
+        dirty, which is all of them when the global delimiters or real format
+        changed, and then rebuilds the directory and parameter sections."""
+        if self._deferred:
+            self._CompileDeferred()
+            return
+
+        pending, self._pending = self._pending, list()
+        if not pending:
+            return
+
+        self._AddCompiled(pending, self._CompileMany(
+            [IGESObject.GetParameters() for IGESObject in pending],
+            [IGESObject.DirectoryDataPointer.data for IGESObject in pending]))
+
+    def splice(self, block):
+        """Add the entities of a :py:class:`~pyiges.IGESBlock.IGESBlock` after
+        the entities committed so far. The lines of the block are copied with
+        their pointers moved to where the block lands, the parameters are
+        not encoded again.
+
+        :return: directory pointer (IGESPointer) of each entity of the block
+        """
+        if self._deferred:
+            raise ValueError("A block can not be spliced into a deferred storage")
+        self.flush()
+        DirectoryBase = self.DirectorySection._linecount - 1
+        rows, lines = block.place(DirectoryBase, self.ParameterSection._linecount, self.GlobalSection)
+        self.ParameterSection.AddLines(lines)
+        self.DirectorySection.AddRows(rows)
+        if self._graph is not None:
+            for DirectoryPointers in block.references:
+                self._graph.append([DirectoryPointer + DirectoryBase for DirectoryPointer in DirectoryPointers])
+        return [IGESPointer(DirectoryBase + 2 * i + 1) for i in range(0, len(rows))]
+
+    def reference_graph(self):
+        """:py:class:`~pyiges.IGESGraph.IGESReferenceGraph` of the entities
+        committed so far, the storage is flushed first so it has them all"""
+        if not self._references:
+            raise ValueError("The storage was made without references=True")
+        self.flush()
+        return self._graph
+
+    def _CompileDeferred(self, chunk_size=1024):
+        settings = (self.GlobalSection.ParameterDelimiterCharacter, self.GlobalSection.RecordDelimiter,
+                    self.GlobalSection.RealFormat, self.GlobalSection.DPSignificance)
+        recompile = settings != self._compiled_settings
+
+        dirty = [IGESObject for IGESObject in self._entities if recompile or IGESObject.IsDirty()]
+        states = [IGESObject._State() for IGESObject in dirty]
+        datas = [IGESObject.GetParameters() for IGESObject in dirty]
+
+        compiled = self._CompileMany(datas, [IGESObject.DirectoryDataPointer.data for IGESObject in dirty])
+        for IGESObject, state, (CompiledParameter, ParameterLineCount) in zip(dirty, states, compiled):
+            IGESObject.CompiledParameter = CompiledParameter
+            IGESObject.ParameterLineCount = ParameterLineCount
+            IGESObject.CompiledState = state
+        self._compiled_settings = settings
+
+        # parameter pointers move when an entity changes length, so the
+        # sections are always rebuilt from the lines kept by the entities
+        for section in (self.DirectorySection, self.ParameterSection):
+            if isinstance(section._data, IGESSpool):
+                section._data.close()
+        self._NewSections()
+        for first in range(0, len(self._entities), chunk_size):
+            self._AddEntities(self._entities[first:first + chunk_size])
+
+    Forms = ("fixed", "compressed")
+
+    def write(self, stream, form="fixed"):
+        """Write the whole file to a text stream. Sections are written in order
+        and the stream is never seeked so pipes and sockets work as well
+
+        :param form: "fixed" for 80 column records, "compressed" for
+            pyIGES's own compressed layout, which only pyIGES reads (see
+            :py:mod:`pyiges.IGESCompressed`)
+        :type form: str
+        """
+        if form not in self.Forms:
+            raise ValueError("Unknown form", form, self.Forms)
+        self.flush()
+        if form == "compressed":
+            StartText, GlobalText = str(self.StartSection), str(self.GlobalSection)
+            IGESCompressed.compress_sections(StartText, GlobalText, self.DirectorySection.iter_lines(),
+                                             self.ParameterSection._data, self.IGESTerminate(), stream)
+            return
+        stream.write(str(self.StartSection))
+        stream.write(str(self.GlobalSection))
+        self.DirectorySection.WriteSection(stream)
+        self.ParameterSection.WriteSection(stream)
+        stream.write(str("\n"))
+        stream.write(str(self.IGESTerminate()))
+
+    def write_mapped(self, filename, threads=None, chunk_size=4096):
+        """Write the whole file to filename through a memory map. Every record
+        is 80 columns and a new line, so once the sections are compiled the
+        file size and the offset of every record are known. The file is made
+        that size and mapped, then blocks of directory and parameter records
+        are rendered and copied straight into their place in the map.
+
+        :param threads: fill the blocks from this many threads. The rendering
+            holds the GIL on CPython, so this mostly overlaps the page faults
+            of the map with the rendering
+        :type threads: int
+
+        :param int chunk_size: records in a block
+        """
+        self.flush()
+        head = (str(self.StartSection) + str(self.GlobalSection)).encode('ascii')
+        tail = ("\n" + self.IGESTerminate()).encode('ascii')
+        DirectoryOffset = len(head)
+        ParameterOffset = DirectoryOffset + 81 * (self.DirectorySection._linecount - 1)
+        size = ParameterOffset + 81 * (self.ParameterSection._linecount - 1) + len(tail)
+
+        with open(filename, 'w+b') as myFile:
+            myFile.truncate(size)
+            with mmap.mmap(myFile.fileno(), size) as mapped:
+                mapped[:DirectoryOffset] = head
+                mapped[size - len(tail):] = tail
+
+                def fill(offset, count, render):
+                    block = render().encode('ascii')
+                    if len(block) != 81 * count:
+                        raise ValueError("Records are not 80 columns, can not write mapped", offset)
+                    mapped[offset:offset + len(block)] = block
+
+                blocks = ((offset + 81 * first, count, render)
+                          for offset, section in ((DirectoryOffset, self.DirectorySection),
+                                                  (ParameterOffset, self.ParameterSection))
+                          for first, count, render in section.RecordBlocks(chunk_size))
+                if not threads:
+                    for block in blocks:
+                        fill(*block)
+                else:
+                    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+                        running = collections.deque()
+                        for block in blocks:
+                            if len(running) >= 2 * threads:  # keep spooled sections streaming
+                                running.popleft().result()
+                            running.append(executor.submit(fill, *block))
+                        for future in running:
+                            future.result()
+                mapped.flush()
+
+    def save(self, filename = 'IGESFile.igs', mapped=False, threads=None,
+             compression=None, compresslevel=None, form="fixed"):
+        """Save to filename, which may also be an open text or binary stream
+        (for example a pipe), a stream is flushed but not closed.
+        With mapped the file is written by write_mapped using threads.
+        form is the one of write, only the fixed form can be mapped.
+
+        :param compression: compress while writing, "gzip", "bz2" or "lzma".
+            For a file name the default comes from the suffix (.gz, .bz2 or
+            .xz), a binary stream gets the compressed bytes
+        :type compression: str
+
+        :param int compresslevel: level of the codec, 1 (fast) to 9 (small)
+        :raises ValueError: for arguments that do not go together, before
+            anything is written; errors while writing are printed
+        """
+        if compression is None and not hasattr(filename, 'write'):
+            compression = _compression_from_suffix(filename)
+        if compression is not None and compression not in _Compressions:
+            raise ValueError("Unknown compression", compression, sorted(_Compressions))
+        if form not in self.Forms:
+            raise ValueError("Unknown form", form, self.Forms)
+        if mapped and compression is not None:
+            raise ValueError("A mapped save can not be compressed", compression)
+        if mapped and form != "fixed":
+            raise ValueError("A mapped save can only be of the fixed form", form)
+        if compression is not None and isinstance(filename, io.TextIOBase):
+            raise ValueError("A compressed save needs a file name or binary stream")
 
-    def save(self, filename = 'IGESFile.igs'):
         try:
-            myFile = open(filename, 'w')
-            #myFile.write(str(self))
-            myFile.write(str(self.StartSection))
-            myFile.write(str(self.GlobalSection))
-            myFile.write(str(self.DirectorySection))
-            myFile.write(str(self.ParameterSection))
-            myFile.write(str("\n"))
-            myFile.write(str(self.IGESTerminate()))
-            myFile.close()
+            if mapped:
+                self.write_mapped(filename, threads)
+            elif compression is not None:
+                with _Compressions[compression][1](filename, compresslevel) as compressed:
+                    myFile = io.TextIOWrapper(compressed, encoding='ascii', newline='\n')
+                    self.write(myFile, form)
+                    myFile.flush()
+                    myFile.detach()
+                if hasattr(filename, 'flush'):
+                    filename.flush()
+            elif not hasattr(filename, 'write'):
+                with open(filename, 'w') as myFile:
+                    self.write(myFile, form)
+            elif isinstance(filename, (io.RawIOBase, io.BufferedIOBase)):
+                myFile = io.TextIOWrapper(filename, encoding='ascii', newline='\n')
+                self.write(myFile, form)
+                myFile.flush()
+                myFile.detach()
+            else:
+                self.write(filename, form)
+                filename.flush()
             print("Successfuly wrote:", filename)
         except Exception as e:
             import traceback
@@ -288,6 +1082,7 @@ class IGEStorage(IGESTerminate):
             print("File write error", e, tb)
 
     def __str__(self):
+        self.flush()
         out = str(self.StartSection)
         out += str(self.GlobalSection)
         out += str(self.DirectorySection)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESExtract
+   :platform: Agnostic, Windows
+   :synopsis: Copy some of the entities of an IGES file into a new file
+
+Entities are chosen from the directory by type, form and level or by
+directory pointer, together with everything they refer to (see
+:py:mod:`pyiges.IGESGraph`). The chosen entities are copied in their order
+in the source file. Their directory pointers, parameter pointers and the
+pointers in their directory fields, parameters and back pointer lists are
+renumbered as each entity is written, an entity whose pointers are not
+known is refused. Only the chosen entities are held, as pointers; each one
+is read from the source by its offset when it is needed.
+
+.. requires functools, shutil, tempfile
+
+.. Created on Sun Oct 18 20:48:05 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+import functools
+import shutil
+import tempfile
+
+import pyiges.IGESCompile as IGESCompile
+from pyiges.IGESCompressed import split_parameters
+from pyiges.IGESGraph import NegativePointerFields, PositivePointerFields, pointer_positions, record_references
+from pyiges.IGESReader import IGESReader, _int, decode_parameters
+
+# the fields of the two directory records, by position
+FirstFields = ('EntityType', 'ParameterDataPointer', 'Structure', 'LineFontPattern', 'Level', 'View',
+               'TransfrmMat', 'LabelDispAssoc', 'StatusNumber')
+SecondFields = ('EntityType', 'LineWeightNum', 'Color', 'ParameterLineCount', 'FormNumber', 'Reserved',
+                'Reserved', 'EntityLabel', 'EntitySubScript')
+
+
+def select(reader, EntityTypes=None, FormNumbers=None, Levels=None, DirectoryPointers=()):
+    """directory pointers of the entries that match all the given conditions,
+    and DirectoryPointers. The directory is streamed, only the chosen
+    pointers are kept
+
+    :param reader: :py:class:`~pyiges.IGESReader.IGESReader` of the source
+    :param EntityTypes: entity type numbers, None for any
+    :param FormNumbers: form numbers, None for any
+    :param Levels: levels, None for any
+    :param DirectoryPointers: entries chosen whatever their type, form and level
+    """
+    chosen = set(DirectoryPointers)
+    if EntityTypes is None and FormNumbers is None and Levels is None:
+        return chosen
+    for entry in reader.directory():
+        if (EntityTypes is None or entry.EntityType in EntityTypes) and \
+                (FormNumbers is None or entry.FormNumber in FormNumbers) and \
+                (Levels is None or entry.Level in Levels):
+            chosen.add(entry.DirectoryPointer)
+    return chosen
+
+
+def closure(reader, DirectoryPointers):
+    """the entities and everything they refer to, directly or through other
+    entities, read one entity at a time. The associativities and properties
+    in back pointer lists are followed too. References to no entity are left
+    out, they are written as 0
+
+    :raises IndexError: when one of DirectoryPointers is not an entry of the file
+    """
+    found = set()
+    stack = [reader.get_entity(DirectoryPointer) for DirectoryPointer in set(DirectoryPointers)]
+    found.update(record.DirectoryPointer for record in stack)
+    while stack:
+        for DirectoryPointer in record_references(stack.pop()):
+            if DirectoryPointer not in found:
+                try:
+                    record = reader.get_entity(DirectoryPointer)
+                except IndexError:  # dangling
+                    continue
+                found.add(DirectoryPointer)
+                stack.append(record)
+    return found
+
+
+def _renumbered(value, renumber):
+    """a directory pointer after renumbering, pointers to entities that are
+    not copied become 0"""
+    return renumber.get(value, 0)
+
+
+@functools.lru_cache()
+def _pointer_positions(names):
+    """(position, sign) of the fields of a directory record that are pointers
+    when their value has that sign"""
+    return tuple((position, -1 if name in NegativePointerFields else 1) for position, name in enumerate(names)
+                 if name in NegativePointerFields or name in PositivePointerFields)
+
+
+def relocate_record(record, names, renumber, values):
+    """a directory record (columns 1 to 72) with the fields in values
+    replaced and the pointer fields renumbered, the other columns are copied
+
+    :param names: names of the fields of the record, FirstFields or SecondFields
+    :param renumber: new directory pointer of each old one, anything with a
+        get method, pointers it does not have become 0
+    """
+    record = record[:72].ljust(72)
+    fields = [record[i:i + 8] for i in range(0, 72, 8)]
+    for position, sign in _pointer_positions(names):
+        field = fields[position]
+        if field.isspace() or field.endswith(" 0"):  # most fields are blank or 0, no pointer
+            continue
+        try:
+            value = sign * int(field)
+        except ValueError:  # not a number, not a pointer
+            continue
+        if value > 0:
+            fields[position] = "%8d" % (sign * _renumbered(value, renumber))
+    for name, value in values.items():
+        fields[names.index(name)] = "%8d" % value
+    return "".join(fields)
+
+
+def relocate_parameters(text, renumber, ParameterDelimiter=",", RecordDelimiter=";", FormNumber=0):
+    """encoded parameters of an entity with the pointers among them renumbered
+    (see relocate_record), every other parameter is copied as it was written
+
+    :raises ValueError: when the pointers among the parameters are not known,
+        see :py:func:`~pyiges.IGESGraph.pointer_positions`
+    """
+    Parameters = split_parameters(text, ParameterDelimiter, RecordDelimiter)
+    values = decode_parameters(Parameters)
+    positions, negated = pointer_positions(values[0], values[1:], FormNumber)
+    for position in positions:
+        Parameters[position + 1] = str(_renumbered(int(values[position + 1]), renumber))
+    for position in negated:
+        Parameters[position + 1] = str(-_renumbered(-int(values[position + 1]), renumber))
+    return Parameters
+
+
+def write_subset(reader, DirectoryPointers, stream):
+    """Write the entities of reader with these directory pointers to stream
+    as a new file, laid out as IGEStorage.write lays it out. The start and
+    global sections are copied. The directory section is written as the
+    entities are read and the parameter lines are kept in a temporary file
+    until it is complete
+
+    :return: dict of the new directory pointer of each copied entity
+    :raises ValueError: when the pointers among the parameters of an entity
+        are not known (see relocate_parameters)
+    """
+    renumber = {old: 2 * i + 1 for i, old in enumerate(sorted(DirectoryPointers))}
+
+    separator = ""
+    for section in ("S", "G"):
+        for number, text in reader.records(section):
+            stream.write(separator + IGESCompile.record_template(section)[1:] % (text, number))
+            separator = "\n"
+    counts = {section: sum(1 for record in reader.records(section)) for section in ("S", "G")}
+
+    ParameterPointer = 1
+    with tempfile.TemporaryFile(mode='w+', newline='\n') as parameter_section:
+        for old, new in sorted(renumber.items()):
+            first, second, text = reader.entry_text(old)
+            if text is None:
+                ParameterLines, ParameterLineCount, pointer = [], 0, 0
+            else:
+                try:
+                    Parameters = relocate_parameters(text, renumber, reader.ParameterDelimiter,
+                                                     reader.RecordDelimiter, _int(second[32:40]))
+                except ValueError as error:
+                    raise ValueError("Can not renumber the pointers of entity", reader.filename, old,
+                                     _int(first[:8])) from error
+                ParameterLines, ParameterLineCount = IGESCompile.IGESPackParameters(Parameters, reader.GlobalSection,
+                                                                                    new)
+                pointer = ParameterPointer
+            parameter_section.writelines(IGESCompile.iter_records(ParameterLines, "P", ParameterPointer))
+            stream.write(IGESCompile.format_line(
+                [relocate_record(first.decode('latin-1'), FirstFields, renumber, {'ParameterDataPointer': pointer}),
+                 relocate_record(second.decode('latin-1'), SecondFields, renumber,
+                                 {'ParameterLineCount': ParameterLineCount})],
+                "D", new))
+            ParameterPointer += ParameterLineCount
+
+        parameter_section.seek(0)
+        shutil.copyfileobj(parameter_section, stream)
+
+    stream.write("\nS{:7}G{:7}D{:7}P{:7}{:>41}{:7}".format(counts["S"], counts["G"], 2 * len(renumber),
+                                                            ParameterPointer - 1, "T", 1))
+    return renumber
+
+
+def extract(source, target, EntityTypes=None, FormNumbers=None, Levels=None, DirectoryPointers=(),
+            dependencies=True):
+    """Copy the entities of the IGES file source that match all the given
+    conditions (see select), with everything they refer to, to a new IGES
+    file target
+
+    :param source: fixed form IGES file
+    :param target: file name, or a text stream
+    :param bool dependencies: copy what the chosen entities refer to, without
+        it references to entities that are not chosen become 0
+    :return: dict of the new directory pointer of each copied entity
+    """
+    with IGESReader(source) as reader:
+        chosen = select(reader, EntityTypes, FormNumbers, Levels, DirectoryPointers)
+        if dependencies:
+            chosen = closure(reader, chosen)
+        if hasattr(target, 'write'):
+            return write_subset(reader, chosen, target)
+        with open(target, 'w', newline='\n', encoding='latin-1') as stream:
+            return write_subset(reader, chosen, stream)
@@ -70,6 +70,8 @@ class IGESGeomPoint(IGESItemData):
     :param node: position of point as IGESPoint or list
     :type geometry: :py:class:`~pyiges.IGESGeomLib.IGESPoint` or [x, y, z]
     """
+    __slots__ = ('ParameterLC', )
+
     def __init__(self, node):
         IGESItemData.__init__(self)
         self.EntityType.setPoint()
@@ -95,6 +97,8 @@ class IGESExtrude(IGESItemData):
     :param endpoint: end point of extrusion
     :type endpoint: :py:class:`~pyiges.IGESGeomLib.IGESPoint`
     """
+    __slots__ = ()
+
     def __init__(self, IGESObject, endpoint):
         IGESItemData.__init__(self)
         self.EntityType.setTabulatedCylinder()
@@ -134,6 +138,8 @@ class IGESRevolve(IGESItemData):  # 120
     :param terminate_angle: starting angle of roation in _radians_, default is two pi
     :type terminate_angle: int or float
     """
+    __slots__ = ()
+
     def __init__(self, profile, center_line, start_angle = 0, terminate_angle = pi * 2):
         IGESItemData.__init__(self)
         self.EntityType.setRevolvedSurface()
@@ -154,6 +160,8 @@ class IGESGeomLine(IGESItemData):
     :param endpoint: send of line
     :type endpoint: :py:class:`~pyiges.IGESGeomLib.IGESPoint`
     """
+    __slots__ = ()
+
     def __init__(self, startpoint, endpoint):
         IGESItemData.__init__(self)
         self.EntityType.setLine()
@@ -178,6 +186,8 @@ class IGESGeomArc(IGESItemData):  # Wrapper of iges geometry
     :param endpoint: end point of arc, z value is ignored
     :type endpoint: :py:class:`~pyiges.IGESGeomLib.IGESPoint`
     """
+    __slots__ = ('ParameterLC', )
+
     def __init__(self, z, node, startpoint, endpoint):
         IGESItemData.__init__(self)
         self.LineFontPattern.setSolid()
@@ -199,6 +209,8 @@ class IGESGeomCircle(IGESItemData):
     :param radius: Radius of the circle to be drawn either
     :type radius: int or float
     """
+    __slots__ = ('ParameterLC', )
+
     def __init__(self, node, radius):
         if type(radius) is not IGESPoint:
             radius = IGESPoint(node.x + radius, node.y, node.z)
@@ -223,6 +235,8 @@ class IGESGeomTorus(IGESItemData):
     :param vector: normal vector through center point (axis of rotation)
     :type vector: :py:class:`~pyiges.IGESGeomLib.IGESVector`
     """
+    __slots__ = ('ParameterLC', )
+
     def __init__(self, r1, r2, node, vector):
         IGESItemData.__init__(self)
         self.LineFontPattern.setSolid()
@@ -245,6 +259,8 @@ class IGESGeomSphere(IGESItemData):
     :param node: center point
     :type node: :py:class:`~pyiges.IGESGeomLib.IGESPoint`
     """
+    __slots__ = ('ParameterLC', )
+
     def __init__(self, radius, node):
         IGESItemData.__init__(self)
         self.LineFontPattern.setSolid()
@@ -260,6 +276,8 @@ class IGESGeomPolyline(IGESItemData):
     """IGES Simple Closed Planar Curve Entity (Type 106, Form 63)
        Page 86
        123"""
+    __slots__ = ('pointcount', )
+
     def __init__(self, *IGESPoints):
         IGESItemData.__init__(self)
         self.LineFontPattern.setSolid()
@@ -288,6 +306,8 @@ class IGESGeomCompositeCurve(IGESItemData):
     :param args: List of geometry objects for grouping
     :type args: :py:class:`~pyiges.IGESGeomLib.IGESItemData`
     """
+    __slots__ = ('object_count', )
+
     def __init__(self, *args):
         IGESItemData.__init__(self)
         self.EntityType.setCompositeCurve()
@@ -306,6 +326,8 @@ class IGESGeomCompositeCurve(IGESItemData):
 
 
 class IGESGeomPlane(IGESItemData):
+    __slots__ = ('coefficients', )
+
     def __init__(self, bounding_profile):
         IGESItemData.__init__(self)
         self.EntityType.setPlane()
@@ -321,6 +343,8 @@ class IGESGeomPlane(IGESItemData):
 
 
 class IGESCurveOnParametricSurface(IGESItemData):  # Page 193
+    __slots__ = ('crtn', )
+
     def __init__(self, IGESSurfaceS, IGESSurfaceB, IGESSurfaceC, pref):
         IGESItemData.__init__(self)
         self.EntityType.setCurveOnParaSurface()
@@ -336,6 +360,8 @@ class IGESCurveOnParametricSurface(IGESItemData):  # Page 193
 
 class IGESTrimmedParaSurface(IGESItemData):
     # 4.34 TRIMMED (PARAMETRIC) SURFACE ENTITY (TYPE 144)
+    __slots__ = ('N1', 'count_boundaries')
+
     def __init__(self, trimmed_surface, outer_boundary_surface, *inner_boudary_surface):
         IGESItemData.__init__(self)
         self.EntityType.setTrimmedParaSurface()
@@ -370,16 +396,18 @@ class IGESTrimmedParaSurface(IGESItemData):
 class IGESGeomTransform(IGESItemData):
     """ Transform / Move Geometry"""
 
+    __slots__ = ()
+
     def __init__(self, transform_matrix, formNumber=0):
         IGESItemData.__init__(self)
         self.EntityType.setTransformMatrix()
         self.FormNumber = formNumber
 
         if self.FormNumber == 0:
-            if len(transform_matrix) == 9:
+            if len(transform_matrix) in (9, 12):
                 self.AddParameters(transform_matrix)
             else:
-                raise TypeError("for form 0 a transform matrix is 9 numbers")
+                raise TypeError("for form 0 a transform matrix is 9 or 12 numbers")
         else:
             if len(transform_matrix) == 12:
                 self.AddParameters(transform_matrix)
@@ -390,6 +418,8 @@ class IGESGeomTransform(IGESItemData):
 class IGESDrawingEntity(IGESItemData):
     """DrawingEntity"""
 
+    __slots__ = ()
+
     def __init__(self, parameters, formNumber=0):
         IGESItemData.__init__(self)
         self.EntityType.setDrawingEntity()
@@ -400,6 +430,8 @@ class IGESDrawingEntity(IGESItemData):
 class IGESViewEntity(IGESItemData):
     """ViewEntity"""
 
+    __slots__ = ()
+
     def __init__(self, parameters):
         IGESItemData.__init__(self)
         self.EntityType.setViewEntity()
@@ -409,6 +441,8 @@ class IGESViewEntity(IGESItemData):
 class IGESPropertyEntity(IGESItemData):
     """PropertyEntity"""
 
+    __slots__ = ()
+
     def __init__(self, parameters, formNumber=0):
         IGESItemData.__init__(self)
         self.EntityType.setPropertyEntity()
@@ -436,6 +470,8 @@ class IGESCircularArray(IGESItemData): # 414
     :param delta_angle: angle across which the objects are distributed
     :type delta_angle: int or float
     """
+    __slots__ = ()
+
     def __init__(self, geometry, number, center,
                  radius, start_angle, delta_angle):
         IGESItemData.__init__(self)
@@ -451,9 +487,22 @@ class IGESCircularArray(IGESItemData): # 414
 
 
 class IGESGroup(IGESItemData):
+    """IGES Subfigure Definition (Type 308, Form 0). A named group of entities
+    that can be placed many times, see :py:func:`~pyiges.IGESGeomLib.instance`
+
+    :param name: name of the subfigure
+    :type name: string
+
+    :param IGESObjects: committed entities of the subfigure, which only show
+        through the instances when they are physically dependent
+        (StatusNumber.Subordinate.setPhysicallyDependent())
+    :type IGESObjects: :py:class:`~pyiges.IGESCore.IGESItemData`
+    """
+    __slots__ = ('entities_count', )
+
     def __init__(self, name, *IGESObjects):
         IGESItemData.__init__(self)
-        self.EntityType.setSubfigureInstance()
+        self.EntityType.setSubfigureDefinition()
 
         self.FormNumber = 0
         self.StatusNumber.EntityUseFlag.setDefinition()
@@ -462,7 +511,7 @@ class IGESGroup(IGESItemData):
         self.AddParameters([0])
         self.AddParameters([name])
         self.entities_count = 0
-        self.AddParameters(self.entities_count)
+        self.AddParameters([self.entities_count])
 
         for IGESObject in IGESObjects:
             self.AddObject(IGESObject)
@@ -474,7 +523,85 @@ class IGESGroup(IGESItemData):
             self.ParameterData[2] = self.entities_count
 
 
+class IGESSingularSubfigureInstance(IGESItemData):
+    """IGES Singular Subfigure Instance (Type 408, Form 0). Places a subfigure
+    definition, scaled then translated, and then moved by the transform the
+    directory entry points to (TransfrmMat)
+
+    :param definition: subfigure definition to place
+    :type definition: :py:class:`~pyiges.IGESGeomLib.IGESGroup`
+
+    :param translation: translation of the instance
+    :type translation: :py:class:`~pyiges.IGESGeomLib.IGESPoint` or [x, y, z]
+
+    :param scale: scale of the instance
+    :type scale: int or float
+    """
+    __slots__ = ()
+
+    def __init__(self, definition, translation=(0, 0, 0), scale=1.0):
+        IGESItemData.__init__(self)
+        self.EntityType.setSingularSubfigureInstance()
+        self.FormNumber = 0
+
+        self.AddParameters([definition.DirectoryDataPointer.data])
+        self.AddParameters(translation)
+        self.AddParameters([scale])
+
+
+def _placement(transform):
+    """rotation rows and translation of a placement as the 12 numbers of a
+    transform matrix, R11 R12 R13 T1 R21 .. T3"""
+    if hasattr(transform, 'tolist'):
+        transform = transform.tolist()
+    transform = list(transform)
+
+    if len(transform) == 12:    # flat, in transform matrix order
+        return transform
+    if len(transform) == 3 and all(len(row) == 4 for row in transform):    # [R | T]
+        return [value for row in transform for value in row]
+    if len(transform) == 4 and all(len(row) == 3 for row in transform):    # [R^T ; T]
+        rotation, translation = transform[:3], transform[3]
+        return [value for i in range(0, 3)
+                for value in (rotation[0][i], rotation[1][i], rotation[2][i], translation[i])]
+    raise TypeError("a placement is 12 numbers, a 3x4 [R | T] or a 4x3 [R^T ; T] matrix", transform)
+
+
+def instance(definition, transforms):
+    """Place a subfigure definition once for every transform. Yields the
+    entities to commit, in order: an IGESGeomTransform (124) holding the
+    placement when it rotates, then the IGESSingularSubfigureInstance (408)
+    that refers to it. A placement that only translates is the translation
+    of the instance and needs no transform. Use
+    it as ``system.commit_many(instance(definition, transforms))``, or call
+    Commit on each entity before taking the next one.
+
+    :param definition: committed subfigure definition
+    :type definition: :py:class:`~pyiges.IGESGeomLib.IGESGroup`
+
+    :param transforms: placements, each 12 numbers in transform matrix order,
+        a 3x4 matrix [R | T] (x' = R x + T) or a 4x3 matrix [R^T ; T]
+        (x' = x A[:3] + A[3], as row vectors)
+    :type transforms: numpy array shaped (N, 12), (N, 3, 4) or (N, 4, 3) or nested lists
+    """
+    if hasattr(transforms, 'tolist'):
+        transforms = transforms.tolist()
+
+    for transform in transforms:
+        matrix = _placement(transform)
+        if matrix[0:3] == [1, 0, 0] and matrix[4:7] == [0, 1, 0] and matrix[8:11] == [0, 0, 1]:
+            yield IGESSingularSubfigureInstance(definition, [matrix[3], matrix[7], matrix[11]])
+        else:
+            transform = IGESGeomTransform(matrix, 0)
+            yield transform
+            placed = IGESSingularSubfigureInstance(definition)
+            placed.TransfrmMat = transform.DirectoryDataPointer.data
+            yield placed
+
+
 class IGESRationalBSplineSurface(IGESItemData):
+    __slots__ = ()
+
     def __init__(self, node1, node2, node3, node4):
         IGESItemData.__init__(self)
         self.LineFontPattern.setSolid()
@@ -528,6 +655,8 @@ class IGESSplineCurve(IGESItemData):
 
     :param int ndim: Number  of  dimensions: 2=planar, 3=nonplanar
     """
+    __slots__ = ('_stype', '_h', '_ndim', '_n', '_breakpoints', '_polynomials', '_nextBreakpointInsert')
+
     def __init__(self, stype, h, ndim):
         IGESItemData.__init__(self)
         self.EntityType.setLinearPath3D() # 112
@@ -559,8 +688,35 @@ class IGESSplineCurve(IGESItemData):
         self._nextBreakpointInsert += 1
         self.ParameterData.extend(polynominal)
 
+    def addSegments(self, breakpoints, polynominals):
+        """add many segments at once, the same as calling addSegment for every
+        breakpoint but without moving the polynominal data for each one
+
+        :param breakpoints: break point of each segment
+        :type breakpoints: list or numpy array of int or float
+
+        :param polynominals: 12 parameters for every segment
+        :type polynominals: flat list, or numpy array shaped (segments, 12)
+        """
+        if hasattr(breakpoints, 'ravel'):
+            breakpoints = breakpoints.ravel().tolist()
+        if hasattr(polynominals, 'ravel'):
+            polynominals = polynominals.ravel().tolist()
+
+        breakpoints = list(breakpoints)
+        polynominals = list(polynominals)
+        if len(polynominals) != 12 * len(breakpoints):
+            raise Exception("Invalid data for polynominal")
+
+        self.ParameterData[IGESSplineCurve.N_INDEX] += len(breakpoints)
+        self.ParameterData[self._nextBreakpointInsert:self._nextBreakpointInsert] = breakpoints
+        self._nextBreakpointInsert += len(breakpoints)
+        self.ParameterData.extend(polynominals)
+
 
 class IGESGeneralNoteEntity(IGESItemData):
+    __slots__ = ()
+
     def __init__(self, parameters, formNumber=0):
         IGESItemData.__init__(self)
         self.EntityType.setGeneralNoteEntity() # 212
@@ -611,6 +767,8 @@ class IGESGeneralNoteEntity(IGESItemData):
 #===============================================================================
 
 class IGESTestSplineSurf(IGESItemData):
+    __slots__ = ('FromNumber', )
+
     def __init__(self):
         IGESItemData.__init__(self)
         self.EntityType.setSplineSurface()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESGraph
+   :platform: Agnostic, Windows
+   :synopsis: Which entities point at which
+
+Entities point at other entities by directory pointer, in their parameters
+(the curves of a composite curve, the surface of a trimmed surface, the
+definition of a subfigure instance ...), in the back pointer lists of
+associativities and properties after those, and in their directory entry
+(the transform, view, label display, and the structure, line font, level
+and color when those are negative). Where the pointers are among the
+parameters depends on the entity type and form, see ParameterLayouts. The graph keeps these references as
+compressed rows over entity indices, entity i being the one with directory
+pointer 2 * i + 1, so a model of millions of entities needs two integer
+arrays.
+
+.. requires array
+
+.. Created on Sun Oct 18 20:20:37 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+import array
+
+
+def _count(value):
+    """a count read from the parameters, 0 when it is defaulted"""
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class _Fixed:
+    """layout of an entity type with a set number of parameters"""
+    __slots__ = ('layout',)
+
+    def __init__(self, count, pointers=(), negated=()):
+        self.layout = (count, tuple(pointers), tuple(negated))
+
+    def __call__(self, P, FormNumber):
+        return self.layout
+
+
+def _by_form(**layouts):
+    """layout that depends on the form number, forms not given have no layout"""
+    def layout(P, FormNumber):
+        found = layouts.get("form%d" % FormNumber)
+        return None if found is None else found(P, FormNumber)
+    return layout
+
+
+def _copious(P, FormNumber):
+    """copious data, tuples of N points after the interpretation flag"""
+    width = {1: 2, 2: 3, 3: 6}.get(_count(P[0]))
+    return None if width is None else (2 + (P[0] == 1) + width * _count(P[1]), (), ())
+
+
+def _boundary(P, FormNumber):
+    """boundary, for each curve its model space curve and parameter space curves"""
+    count, pointers = 4, [2]
+    for curve in range(0, _count(P[3])):
+        curves = _count(P[count + 2])
+        pointers.append(count)
+        pointers.extend(range(count + 3, count + 3 + curves))
+        count += 3 + curves
+    return count, pointers, ()
+
+
+def _drawing(P, FormNumber):
+    """drawing, views with their origin (and rotation in form 1), then annotations"""
+    width = 3 + FormNumber
+    views = 1 + width * _count(P[0])
+    annotations = _count(P[views])
+    return (views + 1 + annotations, list(range(1, views, width)) + list(range(views + 1, views + 1 + annotations)),
+            ())
+
+
+def _group(first, counted=1):
+    """associativity with counted counts and the pointers they count from first"""
+    def layout(P, FormNumber):
+        count = first + sum(_count(P[i]) for i in range(0, counted))
+        return count, range(first, count), ()
+    return layout
+
+
+def _views_visible(P, FormNumber):
+    """associativity form 4, views with their line font, color and weight, then entities"""
+    views = 2 + 5 * _count(P[0])
+    count = views + _count(P[1])
+    return (count, [i for i in range(2, views) if (i - 2) % 5 in (0, 2)] + list(range(views, count)),
+            range(5, views, 5))
+
+
+def _label_display(P, FormNumber):
+    """associativity form 5, view, leader and label of each placement"""
+    count = 1 + 7 * _count(P[0])
+    return count, [i for i in range(1, count) if (i - 1) % 7 in (0, 4, 6)], ()
+
+
+def _note(P, FormNumber):
+    """general note, the font of each string is a pointer when negative"""
+    count = 1 + 12 * _count(P[0])
+    return count, (), range(4, count, 12)
+
+
+# parameter layout by entity type: a function of the parameters (without the
+# entity type) and the form number giving (number of parameters of the entity
+# itself, positions of the directory pointers, positions of the directory
+# pointers when negative), or None for a form it does not lay out. The back
+# pointer lists that may follow the parameters of the entity itself are found
+# from the number of them. Add to it with register_parameter_layout
+ParameterLayouts = {
+    100: _Fixed(7),                                                     # circular arc
+    102: _group(1),                                                     # composite curve, its curves
+    104: _Fixed(11),                                                    # conic arc
+    106: _copious,                                                      # copious data
+    108: _Fixed(9, [4]),                                                # plane, its bounding curve
+    110: _Fixed(6),                                                     # line
+    112: lambda P, FormNumber: (4 + 13 * (_count(P[3]) + 1), (), ()),   # parametric spline curve
+    114: lambda P, FormNumber: (6 + _count(P[2]) + _count(P[3]) + 48 * (_count(P[2]) + 1) * (_count(P[3]) + 1),
+                                (), ()),                                # parametric spline surface
+    116: _Fixed(4, [3]),                                                # point, its display symbol
+    118: _Fixed(4, [0, 1]),                                             # ruled surface, both curves
+    120: _Fixed(4, [0, 1]),                                             # surface of revolution, axis and generatrix
+    122: _Fixed(4, [0]),                                                # tabulated cylinder, directrix
+    124: _Fixed(12),                                                    # transformation matrix
+    125: _Fixed(6, [5]),                                                # flash, its defining entity
+    126: lambda P, FormNumber: (13 + _count(P[0]) + _count(P[1]) + 4 * (_count(P[0]) + 1), (), ()),  # B-spline curve
+    128: lambda P, FormNumber: (17 + _count(P[0]) + _count(P[2]) + _count(P[1]) + _count(P[3])
+                                + 4 * (_count(P[0]) + 1) * (_count(P[1]) + 1), (), ()),  # B-spline surface
+    130: _Fixed(14, [0, 2]),                                            # offset curve, base curve and distance function
+    140: _Fixed(5, [4]),                                                # offset surface, its surface
+    141: _boundary,                                                     # boundary
+    142: _Fixed(5, [1, 2, 3]),                                          # curve on surface, surface and both curves
+    143: lambda P, FormNumber: (3 + _count(P[2]), [1] + list(range(3, 3 + _count(P[2]))), ()),  # bounded surface
+    144: lambda P, FormNumber: (4 + _count(P[2]), [0, 3] + list(range(4, 4 + _count(P[2]))), ()),  # trimmed surface
+    158: _Fixed(4),                                                     # sphere
+    160: _Fixed(8),                                                     # torus
+    190: _by_form(form0=_Fixed(2, [0, 1]), form1=_Fixed(3, [0, 1, 2])),  # plane surface
+    192: _by_form(form0=_Fixed(3, [0, 1]), form1=_Fixed(4, [0, 1, 3])),  # cylindrical surface
+    194: _by_form(form0=_Fixed(4, [0, 1]), form1=_Fixed(5, [0, 1, 4])),  # conical surface
+    196: _by_form(form0=_Fixed(2, [0]), form1=_Fixed(4, [0, 2, 3])),  # spherical surface
+    198: _by_form(form0=_Fixed(4, [0, 1]), form1=_Fixed(5, [0, 1, 4])),  # toroidal surface
+    212: _note,                                                         # general note, text fonts
+    308: lambda P, FormNumber: (3 + _count(P[2]), range(3, 3 + _count(P[2])), ()),  # subfigure definition
+    402: _by_form(form1=_group(1), form7=_group(1), form14=_group(1), form15=_group(1),  # groups
+                  form3=_group(2, 2),                                   # views visible, views and entities
+                  form4=_views_visible, form5=_label_display,
+                  form9=_group(2, 2),                                   # single parent, parent and children
+                  form12=lambda P, FormNumber: (1 + 2 * _count(P[0]), range(2, 1 + 2 * _count(P[0]), 2), ()),
+                  form16=lambda P, FormNumber: (3 + _count(P[1]), range(2, 3 + _count(P[1])), ())),  # planar
+    404: _by_form(form0=_drawing, form1=_drawing),                      # drawing, views and annotations
+    406: lambda P, FormNumber: (1 + _count(P[0]), (), ()),              # property, its values
+    408: _Fixed(5, [0]),                                                # singular subfigure instance, its definition
+    410: _by_form(form0=_Fixed(8, range(2, 8))),                        # view, its clipping planes
+    414: lambda P, FormNumber: (9 if not _count(P[8]) else 10 + _count(P[8]), [0], ()),  # circular array
+}
+
+# directory fields that are pointers when they are negative, and when they are positive
+NegativePointerFields = ('Structure', 'LineFontPattern', 'Level', 'Color')
+PositivePointerFields = ('View', 'TransfrmMat', 'LabelDispAssoc')
+
+
+def register_parameter_layout(EntityType, layout):
+    """Lay out the parameters of another entity type, or replace a layout
+    (see ParameterLayouts)"""
+    ParameterLayouts[EntityType] = layout
+
+
+def plain_parameter_count(EntityType):
+    """number of parameters of an entity type that has a set number of them
+    and no pointers among them, None for any other. An entity of the type
+    with no more parameters than that has no pointers in them"""
+    layout = ParameterLayouts.get(EntityType)
+    if isinstance(layout, _Fixed) and not layout.layout[1] and not layout.layout[2]:
+        return layout.layout[0]
+    return None
+
+
+def _is_pointer(value, sign=1):
+    return isinstance(value, (int, float)) and sign * value > 0
+
+
+def _layout(EntityType, Parameters, FormNumber):
+    """(number, positions of pointers, positions of negated pointers) of the
+    parameters of the entity itself, None when the type or form has no layout"""
+    layout = ParameterLayouts.get(EntityType)
+    if layout is None:
+        return None
+    try:
+        found = layout(Parameters, FormNumber)
+    except IndexError:  # too few parameters to hold the counts
+        return len(Parameters), [], []
+    if found is None:
+        return None
+    count, pointers, negated = found
+    return (count, [position for position in pointers if position < len(Parameters) and
+                    _is_pointer(Parameters[position])],
+            [position for position in negated if position < len(Parameters) and
+             _is_pointer(Parameters[position], -1)])
+
+
+def back_pointers(Parameters, count):
+    """positions of the pointers in the back pointer lists (associativities,
+    then properties, each after its length) that follow the count parameters
+    of the entity itself
+
+    :raises ValueError: when the parameters after those are not such lists
+    """
+    positions, start = [], count
+    for group in range(0, 2):
+        if start >= len(Parameters):
+            break
+        length = Parameters[start]
+        if length is None:
+            length = 0
+        if not isinstance(length, (int, float)) or length < 0 or length != int(length) or \
+                start + 1 + length > len(Parameters):
+            raise ValueError("The parameters after those of the entity are not back pointer lists", count)
+        positions.extend(position for position in range(start + 1, start + 1 + int(length))
+                         if _is_pointer(Parameters[position]))
+        start += 1 + int(length)
+    if start < len(Parameters):
+        raise ValueError("The parameters after the back pointer lists are not known", count)
+    return positions
+
+
+def pointer_positions(EntityType, Parameters, FormNumber=0):
+    """positions of the directory pointers in the parameters of an entity,
+    its own and those of its back pointer lists, and of the pointers held
+    negated. Parameters that are not numbers of the sign of a pointer
+    (defaults) are left out. This is what relocating an entity needs, so
+    it fails rather than miss a pointer
+
+    :param Parameters: parameters without the entity type, reals and None
+        (defaults) are taken as they are read
+    :raises ValueError: when the type or form has no layout
+        (see ParameterLayouts), or the parameters are more than the layout
+        and its back pointer lists
+    """
+    Parameters = list(Parameters)
+    found = _layout(EntityType, Parameters, FormNumber)
+    if found is None:
+        raise ValueError("No parameter layout for entity type", EntityType, FormNumber)
+    count, positions, negated = found
+    return positions + back_pointers(Parameters, count), negated
+
+
+def parameter_references(EntityType, Parameters, FormNumber=0):
+    """directory pointers in the parameters of an entity as far as they are
+    known: none for a type or form without layout and none from back
+    pointer lists that are not laid out as such (see pointer_positions)"""
+    Parameters = list(Parameters)
+    found = _layout(EntityType, Parameters, FormNumber)
+    if found is None:
+        return []
+    count, positions, negated = found
+    try:
+        positions = positions + back_pointers(Parameters, count)
+    except ValueError:
+        pass
+    return [int(Parameters[position]) for position in positions] + [-int(Parameters[position])
+                                                                     for position in negated]
+
+
+def references(EntityType, Parameters, Structure=0, LineFontPattern=0, Level=0, View=0, TransfrmMat=0,
+               LabelDispAssoc=0, Color=0, FormNumber=0):
+    """directory pointers an entity refers to, from its directory fields
+    (see NegativePointerFields and PositivePointerFields) and its
+    parameters (see parameter_references)"""
+    found = [-value for value in (Structure, LineFontPattern, Level, Color) if value < 0]
+    found.extend(value for value in (View, TransfrmMat, LabelDispAssoc) if value > 0)
+    found.extend(parameter_references(EntityType, Parameters, FormNumber))
+    return found
+
+
+def record_references(record):
+    """directory pointers an :py:class:`~pyiges.IGESReader.IGESEntityRecord` refers to"""
+    return references(record.EntityType, record.Parameters, record.Structure, record.LineFontPattern,
+                      record.Level, record.View, record.TransfrmMat, record.LabelDispAssoc, record.Color,
+                      record.FormNumber)
+
+
+class IGESReferenceGraph:
+    """References between the entities of a model as compressed rows: the
+    entities referred to by entity i are targets[offsets[i]:offsets[i + 1]],
+    as entity indices. Entities are appended in directory order, a
+    reference may be to an entity appended later.
+
+    The rows of who refers to each entity are made the first time they
+    are asked for. Walking either way visits each entity of the answer once
+    and looks at its references once.
+    """
+    def __init__(self):
+        self.offsets = array.array('q', [0])
+        self.targets = array.array('q')
+        self._reverse = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def append(self, DirectoryPointers):
+        """add the next entity, referring to these directory pointers"""
+        self.targets.extend((DirectoryPointer - 1) // 2 if DirectoryPointer % 2 else -1
+                            for DirectoryPointer in DirectoryPointers)
+        self.offsets.append(len(self.targets))
+        self._reverse = None
+
+    def add_entity(self, IGESObject):
+        """add the next entity, an :py:class:`~pyiges.IGESCore.IGESItemData`"""
+        self.append(references(IGESObject.EntityType.value, IGESObject.ParameterData,
+                               IGESObject.Structure, IGESObject.LineFontPattern.value, IGESObject.Level,
+                               IGESObject.View, IGESObject.TransfrmMat, IGESObject.LabelDispAssoc,
+                               IGESObject.Color.value, IGESObject.FormNumber))
+
+    def add_record(self, record):
+        """add the next entity, an :py:class:`~pyiges.IGESReader.IGESEntityRecord`"""
+        self.append(record_references(record))
+
+    @classmethod
+    def from_reader(cls, reader):
+        """graph of the entities of an :py:class:`~pyiges.IGESReader.IGESReader`,
+        streamed once. Entities without parameter lines get no references"""
+        graph = cls()
+        for record in reader:
+            for i in range(len(graph), (record.DirectoryPointer - 1) // 2):
+                graph.append(())
+            graph.add_record(record)
+        return graph
+
+    @classmethod
+    def from_arrays(cls, model):
+        """graph of an :py:class:`~pyiges.IGESReader.IGESArrayModel`, only the
+        parameters of the entity types in ParameterLayouts are looked at"""
+        graph = cls()
+        directory, parameters = model.directory, model.parameters
+        fields = [directory[name].tolist() for name in ('EntityType', 'Structure', 'LineFontPattern', 'Level',
+                                                         'View', 'TransfrmMat', 'LabelDispAssoc', 'Color',
+                                                         'FormNumber')]
+        offsets = parameters.offsets.tolist()
+        for i, (EntityType, *pointers) in enumerate(zip(*fields)):
+            Parameters = parameters.values[offsets[i]:offsets[i + 1]].tolist() \
+                if EntityType in ParameterLayouts else ()
+            graph.append(references(EntityType, Parameters, *pointers))
+        return graph
+
+    def _row(self, offsets, targets, entry):
+        return targets[offsets[entry]:offsets[entry + 1]]
+
+    def _entry(self, DirectoryPointer):
+        entry, odd = divmod(DirectoryPointer - 1, 2)
+        if odd or not 0 <= entry < len(self):
+            raise IndexError("No directory entry", DirectoryPointer)
+        return entry
+
+    def _reversed(self):
+        """offsets and sources of the rows of who refers to each entity"""
+        if self._reverse is None:
+            entries = len(self)
+            counts = array.array('q', [0]) * (entries + 1)
+            for target in self.targets:
+                if 0 <= target < entries:
+                    counts[target + 1] += 1
+            for entry in range(0, entries):
+                counts[entry + 1] += counts[entry]
+            sources = array.array('q', [0]) * counts[entries]
+            filled = array.array('q', counts)
+            for source in range(0, entries):
+                for target in self.targets[self.offsets[source]:self.offsets[source + 1]]:
+                    if 0 <= target < entries:
+                        sources[filled[target]] = source
+                        filled[target] += 1
+            self._reverse = counts, sources
+        return self._reverse
+
+    def references(self, DirectoryPointer):
+        """directory pointers the entity refers to, in parameter order"""
+        entries = len(self)
+        return [2 * target + 1 for target in self._row(self.offsets, self.targets, self._entry(DirectoryPointer))
+                if 0 <= target < entries]
+
+    def referenced_by(self, DirectoryPointer):
+        """directory pointers of the entities that refer to the entity"""
+        offsets, sources = self._reversed()
+        return [2 * source + 1 for source in self._row(offsets, sources, self._entry(DirectoryPointer))]
+
+    def _closure(self, offsets, targets, DirectoryPointers):
+        entries = len(self)
+        found = set(map(self._entry, DirectoryPointers))
+        stack = list(found)
+        while stack:
+            for target in self._row(offsets, targets, stack.pop()):
+                if 0 <= target < entries and target not in found:
+                    found.add(target)
+                    stack.append(target)
+        return {2 * entry + 1 for entry in found}
+
+    def dependencies(self, *DirectoryPointers):
+        """directory pointers of the entities and of everything they need,
+        directly or through other entities"""
+        return self._closure(self.offsets, self.targets, DirectoryPointers)
+
+    def dependents(self, *DirectoryPointers):
+        """directory pointers of the entities and of everything that needs
+        them, directly or through other entities"""
+        return self._closure(*self._reversed(), DirectoryPointers)
+
+    def dangling(self):
+        """directory pointers of the entities with a reference to no entity,
+        an even pointer or one past the last entity"""
+        entries = len(self)
+        return [2 * source + 1 for source in range(0, entries)
+                if not all(0 <= target < entries for target in self._row(self.offsets, self.targets, source))]
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESMerge
+   :platform: Agnostic, Windows
+   :synopsis: Join IGES files into one file
+
+The files are copied one after another, each read once from start to end.
+The entities of a file keep their order and their directory pointers move
+up by the directory records of the files before it, their parameter lines
+are numbered on from the lines before them. Nothing is decoded except the
+parameters that may hold pointers: those of every entity type but the
+ones :py:func:`pyiges.IGESGraph.plain_parameter_count` gives a number
+for, and those of any entity with more parameters than that number, which
+end in back pointer lists. The parameter lines of every other entity are
+copied with only their directory pointer changed. An entity whose pointers
+are not known (see :py:func:`pyiges.IGESGraph.pointer_positions`) is
+refused.
+Files with records of one length are copied a chunk of entries at a time
+with numpy when it is installed, the changed fields are written as columns,
+so the memory a merge takes does not grow with the files.
+
+The global section is the one of the first file with the largest
+coordinate value and line weight and the finest resolution of all of them,
+the files have to be in the same units.
+
+From the command line: ``python -m pyiges.IGESMerge target source ...``
+
+.. requires copy, shutil, sys, tempfile (numpy for copying blocks of records)
+
+.. Created on Sun Oct 18 21:14:52 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+import copy
+import shutil
+import sys
+import tempfile
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import pyiges.IGESCompile as IGESCompile
+from pyiges.IGESExtract import FirstFields, SecondFields, relocate_parameters, relocate_record
+from pyiges.IGESGraph import NegativePointerFields, ParameterLayouts, PositivePointerFields, plain_parameter_count
+from pyiges.IGESReader import IGESReader, _Block, _directory_columns, _int, _integer_columns
+
+
+# entries of a file copied at a time by _copy_file_arrays
+_Chunk = 1 << 15
+
+
+class _Rebase:
+    """renumbering of the directory pointers of one file, see relocate_record"""
+    def __init__(self, base, entries):
+        self.base = base
+        self.end = 2 * entries
+
+    def get(self, DirectoryPointer, default=None):
+        if DirectoryPointer % 2 and 0 < DirectoryPointer < self.end:
+            return DirectoryPointer + self.base
+        return default
+
+
+def reconcile(GlobalSections):
+    """global section for the merged file, a copy of the first one with the
+    largest MaxCoordValue, WidthMaxLineWeightUnits and
+    MaxNumberLineWeightGrads and the smallest MaxUserResolution of them all
+
+    :param GlobalSections: :py:class:`~pyiges.IGESCore.IGESGlobal` of each file
+    :raises ValueError: when the units or model space scales differ
+    """
+    GlobalSections = list(GlobalSections)
+    merged = copy.deepcopy(GlobalSections[0])
+    for GlobalSection in GlobalSections[1:]:
+        units, merged_units = GlobalSection.Units, merged.Units
+        # the name only tells the units apart when the flag is 3 (named in the name), "IN" and "INCH" are both 1
+        if units.UnitsFlag != merged_units.UnitsFlag or \
+                units.UnitsFlag == 3 and units.UnitsName != merged_units.UnitsName:
+            raise ValueError("Files are in different units", (merged_units.UnitsFlag, merged_units.UnitsName),
+                             (units.UnitsFlag, units.UnitsName))
+        if GlobalSection.ModelSpaceScale != merged.ModelSpaceScale:
+            raise ValueError("Files have different model space scales", merged.ModelSpaceScale,
+                             GlobalSection.ModelSpaceScale)
+        merged.MaxCoordValue = max(merged.MaxCoordValue, GlobalSection.MaxCoordValue)
+        merged.WidthMaxLineWeightUnits = max(merged.WidthMaxLineWeightUnits, GlobalSection.WidthMaxLineWeightUnits)
+        merged.MaxNumberLineWeightGrads = max(merged.MaxNumberLineWeightGrads,
+                                              GlobalSection.MaxNumberLineWeightGrads)
+        merged.MaxUserResolution = min(merged.MaxUserResolution, GlobalSection.MaxUserResolution)
+    return merged
+
+
+def _relocated(reader, text, rebase, DirectoryPointer, EntityType, FormNumber):
+    """encoded parameters of an entity of reader with its pointers rebased,
+    see relocate_parameters
+
+    :raises ValueError: naming the entity, when its pointers are not known
+    """
+    try:
+        return relocate_parameters(text, rebase, reader.ParameterDelimiter, reader.RecordDelimiter,
+                                   FormNumber)
+    except ValueError as error:
+        raise ValueError("Can not move the pointers of entity", reader.filename, DirectoryPointer,
+                         EntityType) from error
+
+
+def _copy_file(reader, GlobalSection, DirectoryBase, ParameterPointer, stream, parameter_section):
+    """write the directory records of the file to stream and its parameter
+    lines to parameter_section, pointers moved up by DirectoryBase and the
+    parameter lines numbered from ParameterPointer
+
+    :return: the entries and parameter lines written
+    """
+    entries = reader.counts.get("D", 0) // 2
+    rebase = _Rebase(DirectoryBase, entries)
+    repack = (reader.ParameterDelimiter, reader.RecordDelimiter) != \
+        (GlobalSection.ParameterDelimiterCharacter, GlobalSection.RecordDelimiter)
+    delimiter = reader.ParameterDelimiter.encode('latin-1')
+
+    directory = reader.records("D")
+    groups = reader.parameter_lines()
+    group = next(groups, None)
+    written, start = 0, ParameterPointer
+    for (DirectoryPointer, first), (_, second) in zip(directory, directory):
+        new = DirectoryPointer + DirectoryBase
+        ParameterLines = ()
+        if group is not None and group[0] == DirectoryPointer:
+            text, EntityType = b"".join(group[1]), _int(first[:8])
+            count = plain_parameter_count(EntityType)
+            if repack or count is None or text.count(delimiter) > count:
+                ParameterLines, _ = IGESCompile.IGESPackParameters(
+                    _relocated(reader, text.decode('latin-1'), rebase, DirectoryPointer, EntityType,
+                               _int(second[32:40])),
+                    GlobalSection, new)
+            else:
+                ParameterLines = ["%-65s%7d" % (line.decode('latin-1'), new) for line in group[1]]
+            group = next(groups, None)
+        elif group is not None and group[0] < DirectoryPointer:
+            raise ValueError("Parameter data is not in directory order", reader.filename, group[0])
+
+        pointer = ParameterPointer if ParameterLines else 0
+        parameter_section.writelines(IGESCompile.iter_records(ParameterLines, "P", ParameterPointer))
+        stream.write(IGESCompile.format_line(
+            [relocate_record(first, FirstFields, rebase, {'ParameterDataPointer': pointer}),
+             relocate_record(second, SecondFields, rebase, {'ParameterLineCount': len(ParameterLines)})],
+            "D", new))
+        ParameterPointer += len(ParameterLines)
+        written += 1
+
+    if written != entries or group is not None:
+        raise ValueError("Directory does not match the terminate record", reader.filename, written, entries)
+    return written, ParameterPointer - start
+
+
+def _integer_text(values, width):
+    """integers as right justified text of width columns, a uint8 array
+    with a row for each value"""
+    remaining = numpy.abs(values)
+    text = numpy.empty((len(values), width), dtype=numpy.uint8)
+    digits = numpy.zeros(len(values), dtype=numpy.int64)
+    for column in range(width - 1, -1, -1):
+        shown = remaining > 0
+        if column == width - 1:
+            shown[:] = True  # 0 is written as "0"
+        digits += shown
+        text[:, column] = numpy.where(shown, remaining % 10 + ord("0"), ord(" "))
+        remaining //= 10
+    negative = numpy.nonzero(values < 0)[0]
+    signs = width - 1 - digits[negative]
+    if remaining.any() or (signs < 0).any():
+        raise ValueError("Number does not fit in its field", width)
+    text[negative, signs] = ord("-")
+    return text
+
+
+# (record, first column, sign) of the directory fields that are pointers when they have that sign
+_PointerColumns = [(0, 8 * FirstFields.index(name), -1 if name in NegativePointerFields else 1)
+                   for name in NegativePointerFields + PositivePointerFields if name in FirstFields] + \
+                  [(1, 8 * SecondFields.index(name), -1 if name in NegativePointerFields else 1)
+                   for name in NegativePointerFields + PositivePointerFields if name in SecondFields]
+
+
+def _section_text(records, section, first):
+    """records (a uint8 array of data columns 1 to 72) as section text, from
+    sequence number first"""
+    text = numpy.empty((len(records), 81), dtype=numpy.uint8)
+    text[:, 0] = ord("\n")
+    text[:, 1:73] = records
+    text[:, 73] = ord(section)
+    text[:, 74:] = _integer_text(numpy.arange(first, first + len(records)), 7)
+    return text
+
+
+def _entries(reader, handle, first, last):
+    """directory records (a uint8 array of the records) and directory (see
+    :py:meth:`~pyiges.IGESReader.IGESReader.read_directory`) of entries first
+    to last of a file with records of one length"""
+    handle.seek(reader.offsets["D"] + 2 * first * reader.RecordLength)
+    data = handle.read(2 * (last - first) * reader.RecordLength)
+    return (numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, reader.RecordLength),
+            _directory_columns(data, reader.RecordLength, first))
+
+
+def _copy_file_arrays(reader, GlobalSection, DirectoryBase, ParameterPointer, stream, parameter_section,
+                      chunk_size=_Chunk):
+    """_copy_file for a file with records of one length, chunk_size entries
+    and their parameter lines at a time, written a block of records at a
+    time. Only the entities whose parameters are packed again are handled
+    one by one. The directory is read once before, a chunk at a time, to
+    check the parameter lines can be found from it
+
+    :return: as _copy_file, or None when the parameter lines of the entities
+        are not one after another in directory order, nothing is written then
+    :raises ValueError: when a parameter line is not of the entity the
+        directory gives it to
+    """
+    RecordLength = reader.RecordLength
+    entries, odd = divmod(reader.offsets["P"] - reader.offsets["D"], 2 * RecordLength)
+    LineCount, partial = divmod(reader.offsets["T"] - reader.offsets["P"], RecordLength)
+    if odd or partial or entries != reader.counts.get("D", 0) // 2:
+        return None
+
+    with open(reader.filename, 'rb') as handle:
+        position = 0
+        for first in range(0, entries, chunk_size):
+            records, directory = _entries(reader, handle, first, min(first + chunk_size, entries))
+            counts, starts = directory['ParameterLineCount'], directory['ParameterDataPointer'] - 1
+            LineStarts = position + numpy.cumsum(counts) - counts
+            if (counts < 0).any() or (starts != LineStarts)[counts > 0].any():
+                return None
+            position += int(counts.sum())
+        if position != LineCount:
+            return None
+
+        rebase = _Rebase(DirectoryBase, entries)
+        limits = None
+        if (reader.ParameterDelimiter, reader.RecordDelimiter) == \
+                (GlobalSection.ParameterDelimiterCharacter, GlobalSection.RecordDelimiter):
+            limits = numpy.full(max(ParameterLayouts) + 1, -1)  # plain parameter count of each entity type
+            for EntityType in ParameterLayouts:
+                count = plain_parameter_count(EntityType)
+                if count is not None:
+                    limits[EntityType] = count
+
+        start, position = ParameterPointer, 0
+        for first in range(0, entries, chunk_size):
+            records, directory = _entries(reader, handle, first, min(first + chunk_size, entries))
+            counts = directory['ParameterLineCount']
+            handle.seek(reader.offsets["P"] + position * RecordLength)
+            lines = numpy.frombuffer(handle.read(int(counts.sum()) * RecordLength),
+                                     dtype=numpy.uint8).reshape(-1, RecordLength)
+            ParameterPointer = _copy_chunk(reader, GlobalSection, rebase, limits, records, directory, lines,
+                                           ParameterPointer, stream, parameter_section)
+            position += len(lines)
+    return entries, ParameterPointer - start
+
+
+def _copy_chunk(reader, GlobalSection, rebase, limits, records, directory, lines, ParameterPointer, stream,
+                parameter_section):
+    """write directory records of some entries and their parameter lines,
+    the lines numbered from ParameterPointer, see _copy_file_arrays
+
+    :param limits: plain parameter count by entity type, -1 for the others,
+        None when every entity is packed again
+    :return: the parameter pointer after the lines written
+    """
+    DirectoryBase, entries = rebase.base, len(directory)
+    DirectoryPointers = directory['DirectoryPointer']
+    counts = directory['ParameterLineCount']
+    starts = numpy.cumsum(counts) - counts
+    if (_integer_columns(lines[:, 64:72].copy().view('<u8').reshape(-1)) !=
+            numpy.repeat(DirectoryPointers, counts)).any():
+        raise ValueError("Parameter data is not in directory order", reader.filename)
+
+    # parameters that may hold pointers (all of them for other delimiters) are packed again
+    repack = counts > 0
+    if limits is not None:
+        EntityTypes = directory['EntityType']
+        known = (EntityTypes >= 0) & (EntityTypes < len(limits))
+        limit = numpy.full(entries, -1)
+        limit[known] = limits[EntityTypes[known]]
+        delimiters = numpy.zeros(entries, dtype=numpy.int64)
+        if repack.any():
+            delimiters[repack] = numpy.add.reduceat(
+                (lines[:, :64] == ord(reader.ParameterDelimiter)).sum(axis=1), starts[repack])
+        repack &= delimiters > limit
+    packed = dict()
+    NewCounts = counts.copy()
+    for row in numpy.nonzero(repack)[0].tolist():
+        text = lines[starts[row]:starts[row] + counts[row], :64].tobytes().decode('latin-1')
+        packed[row], NewCounts[row] = IGESCompile.IGESPackParameters(
+            _relocated(reader, text, rebase, int(DirectoryPointers[row]), int(directory['EntityType'][row]),
+                       int(directory['FormNumber'][row])),
+            GlobalSection, int(DirectoryPointers[row]) + DirectoryBase)
+    NewStarts = ParameterPointer + numpy.cumsum(NewCounts) - NewCounts
+
+    for first in range(0, entries, _Block):
+        rows = slice(first, first + _Block)
+        text = _section_text(records[2 * first:2 * first + 2 * _Block, :72], "D",
+                             int(DirectoryPointers[first]) + DirectoryBase)
+        text[0::2, 9:17] = _integer_text(numpy.where(NewCounts[rows] > 0, NewStarts[rows], 0), 8)
+        text[1::2, 25:33] = _integer_text(NewCounts[rows], 8)
+        for record, column, sign in _PointerColumns:
+            values = sign * directory[FirstFields[column // 8] if record == 0 else SecondFields[column // 8]][rows]
+            pointers = numpy.nonzero(values > 0)[0]
+            values = values[pointers]
+            inside = (values % 2 == 1) & (values < rebase.end)
+            text[record::2][pointers, column + 1:column + 9] = \
+                _integer_text(sign * numpy.where(inside, values + DirectoryBase, 0), 8)
+        stream.write(text.tobytes().decode('latin-1'))
+
+    # the lines of the other entities keep their data columns
+    LineDirectoryPointers = numpy.repeat(DirectoryPointers + DirectoryBase, counts)
+    LineSequences = numpy.repeat(NewStarts - starts, counts) + numpy.arange(0, len(lines))
+    position = 0
+    for row, ParameterLines in list(packed.items()) + [(None, ())]:
+        end = len(lines) if row is None else int(starts[row])
+        for first in range(position, end, 8 * _Block):
+            block = slice(first, min(first + 8 * _Block, end))
+            text = _section_text(lines[block, :72], "P", 0)
+            text[:, 65] = ord(" ")
+            text[:, 66:73] = _integer_text(LineDirectoryPointers[block], 7)
+            text[:, 74:] = _integer_text(LineSequences[block], 7)
+            parameter_section.write(text.tobytes().decode('latin-1'))
+        if row is not None:
+            parameter_section.writelines(IGESCompile.iter_records(ParameterLines, "P", int(NewStarts[row])))
+            position = end + int(counts[row])
+    return int(NewStarts[-1] + NewCounts[-1]) if entries else ParameterPointer
+
+
+def merge(sources, target, chunk_size=_Chunk):
+    """Join the fixed form IGES files sources into one file, written to
+    target. The start section is the one of the first file and the global
+    section the one reconcile gives. The directory section is written as the
+    files are read and the parameter lines are kept in a temporary file
+    until it is complete
+
+    :param target: file name, or a text stream
+    :param int chunk_size: entries of a file read at a time when its records
+        are copied in blocks, this bounds the memory a merge takes
+    :return: list of how much the directory pointers of each file moved up
+    """
+    sources = list(sources)
+    if not sources:
+        raise ValueError("Nothing to merge")
+    GlobalSections = []
+    for source in sources:
+        with IGESReader(source) as reader:
+            GlobalSections.append(reader.GlobalSection)
+    GlobalSection = reconcile(GlobalSections)
+
+    if not hasattr(target, 'write'):
+        with open(target, 'w', newline='\n', encoding='latin-1') as stream:
+            return merge(sources, stream, chunk_size)
+
+    stream = target
+    with IGESReader(sources[0]) as reader:
+        StartRecords = list(reader.records("S"))
+    stream.write("\n".join(IGESCompile.record_template("S")[1:] % (text, number) for number, text in StartRecords))
+    GlobalText = str(GlobalSection)
+    stream.write(GlobalText)
+
+    bases = []
+    DirectoryBase, ParameterPointer = 0, 1
+    with tempfile.TemporaryFile(mode='w+', newline='\n', encoding='latin-1') as parameter_section:
+        for source in sources:
+            with IGESReader(source) as reader:
+                bases.append(DirectoryBase)
+                copied = None
+                if numpy is not None and reader.RecordLength:
+                    copied = _copy_file_arrays(reader, GlobalSection, DirectoryBase, ParameterPointer, stream,
+                                               parameter_section, chunk_size)
+                if copied is None:
+                    copied = _copy_file(reader, GlobalSection, DirectoryBase, ParameterPointer, stream,
+                                        parameter_section)
+                entries, lines = copied
+            DirectoryBase += 2 * entries
+            ParameterPointer += lines
+
+        parameter_section.seek(0)
+        shutil.copyfileobj(parameter_section, stream)
+
+    stream.write("\nS{:7}G{:7}D{:7}P{:7}{:>41}{:7}".format(len(StartRecords), GlobalText.count("\n"), DirectoryBase,
+                                                            ParameterPointer - 1, "T", 1))
+    return bases
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        sys.exit("usage: python -m pyiges.IGESMerge target source ...")
+    merge(sys.argv[2:], sys.argv[1])
@@ -18,6 +18,7 @@ from time import strftime
 
 
 class IGESPointer:
+    __slots__ = ('data', )
     def __init__(self, line = 0):  self.data = line
     def __str__(self): return str(self.data)
 
@@ -38,6 +39,7 @@ class IGESModelUnits:
 
 class IGESParameter:
     """Abstraction class for all parametric values of a iges entity"""
+    __slots__ = ('value', )
     def __init__(self): self.value = 0
     def __str__(self): return str(self.value)
     def getValue(self): return self.value
@@ -45,6 +47,7 @@ class IGESParameter:
 
 class IGESEntityTypeNumber(IGESParameter):
     """Type of geometric entity, should be automaticaly set while constructig the entity"""
+    __slots__ = ()
     def setCircularArc(self):          self.value = 100
     def setCompositeCurve(self):       self.value = 102
     def setConicArc(self):             self.value = 104
@@ -79,14 +82,17 @@ class IGESEntityTypeNumber(IGESParameter):
     def setToroidSurf(self):           self.value = 198
     def setGeneralNoteEntity(self):    self.value = 212
     def setSubfigureInstance(self):    self.value = 308
+    def setSubfigureDefinition(self):  self.value = 308
     def setDrawingEntity(self):        self.value = 404
     def setPropertyEntity(self):       self.value = 406
+    def setSingularSubfigureInstance(self): self.value = 408
     def setViewEntity(self):           self.value = 410
     def setCircularArray(self):        self.value = 414
 
 
 class IGESLineFontPattern(IGESParameter):
     """Line font / apperance. Is automaticaly created while constructig the entity"""
+    __slots__ = ()
     def setNone(self):       self.value = 0
     def setSolid(self):      self.value = 1
     def setDashed(self):     self.value = 2
@@ -97,6 +103,7 @@ class IGESLineFontPattern(IGESParameter):
 
 class IGESColorNumber(IGESParameter):
     """Line color. Is automaticaly created while constructig the entity"""
+    __slots__ = ()
     def setNone(self):      self.value = 0
     def setBlack(self):     self.value = 1
     def setRed(self):       self.value = 2
@@ -108,25 +115,47 @@ class IGESColorNumber(IGESParameter):
     def setWhite(self):     self.value = 8
 
 
-class IGESBlankStatus(IGESParameter):
+class IGESStatusFlag(IGESParameter):
+    """Abstraction class for the two digit flags of a IGESStatusNumber. The
+    value is kept in the status word of the IGESStatusNumber it belongs to,
+    a flag made on its own gets a status number of its own"""
+    __slots__ = ('status', 'scale')
+
+    def __init__(self, status=None, scale=1):
+        self.status = IGESStatusNumber() if status is None else status
+        self.scale = scale
+
+    @property
+    def value(self):
+        return self.status.word // self.scale % 100
+
+    @value.setter
+    def value(self, value):
+        self.status.word += (value - self.value) * self.scale
+
+
+class IGESBlankStatus(IGESStatusFlag):
     """Visibility. Is automaticaly created while constructig the entity.
     Change by accessing IGESStatusNumber of the entity"""
+    __slots__ = ()
     def setVisible(self):   self.value = 0
     def setBlanked(self):   self.value = 1
 
 
-class IGESubordinate(IGESParameter):
+class IGESubordinate(IGESStatusFlag):
     """Dependency of entity. Is automaticaly created while constructig the entity.
     Change by accessing IGESStatusNumber of the entity"""
+    __slots__ = ()
     def setIndependent(self):         self.value = 0
     def setPhysicallyDependent(self): self.value = 1
     def setLogicallyDependent(self):  self.value = 2
     def setPysANDLogDependent(self):  self.value = 3
 
 
-class IGESEntityUseFlag(IGESParameter):
+class IGESEntityUseFlag(IGESStatusFlag):
     """Usage Flag of entity. Is automaticaly created while constructig the entity.
     Change by accessing IGESStatusNumber of the entity"""
+    __slots__ = ()
     def setGeometry(self): self.value = 0
     def setAnnotation(self): self.value = 1
     def setDefinition(self): self.value = 2
@@ -136,22 +165,42 @@ class IGESEntityUseFlag(IGESParameter):
     def setConstructionGeometry(self): self.value = 6
 
 
-class IGESHierachy(IGESParameter):
+class IGESHierachy(IGESStatusFlag):
     """Hierachy Flag of entity. Is automaticaly created while constructig the entity.
     Change by accessing IGESStatusNumber of the entity"""
+    __slots__ = ()
     def setGlobalTopDown(self): self.value = 0
     def setGlobalDefer(self): self.value = 1
     def setUseHieracyProperty(self): self.value = 2
 
 
+def _status_flag(flag, scale):
+    """property giving a flag bound to the digits at scale of the status word,
+    setting it copies the value of another flag or takes an integer"""
+    def get(self):
+        return flag(self, scale)
+
+    def set(self, value):
+        flag(self, scale).value = getattr(value, 'value', value)
+
+    return property(get, set)
+
+
 class IGESStatusNumber:
     """Collection of the status flags of the entity.
-    Takes care of formated output"""
+    Takes care of formated output
+
+    The four flags are packed in one integer word, two decimal digits each,
+    so the word printed with eight digits is the directory status number"""
+    __slots__ = ('word', )
+
     def __init__(self):
-        self.Visablilty = IGESBlankStatus()
-        self.Subordinate = IGESubordinate()
-        self.EntityUseFlag = IGESEntityUseFlag()
-        self.Hierachy = IGESHierachy()
+        self.word = 0
+
+    Visablilty = _status_flag(IGESBlankStatus, 1000000)
+    Subordinate = _status_flag(IGESubordinate, 10000)
+    EntityUseFlag = _status_flag(IGESEntityUseFlag, 100)
+    Hierachy = _status_flag(IGESHierachy, 1)
 
     def __str__(self):
-        return "{:0>2}{:0>2}{:0>2}{:0>2}".format(self.Visablilty.value, self.Subordinate.value, self.EntityUseFlag.value, self.Hierachy.value)
+        return "%08d" % self.word
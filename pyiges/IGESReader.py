@@ -0,0 +1,890 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESReader
+   :platform: Agnostic, Windows
+   :synopsis: Streaming reader of fixed form IGES files
+
+The file is read as bytes, records are decoded as latin-1 so every byte is
+one character and byte offsets are column offsets. Entities are read from
+the parameter section one after another while their directory entries are
+read in step from a second handle on the file, so memory does not grow
+with the file.
+
+.. requires array, concurrent.futures, hashlib, itertools, json, mmap, operator, os, struct, sys
+   (numpy for read_directory, read_parameters and open_arrays)
+
+.. Created on Sun Oct 18 16:20:44 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+import array
+import concurrent.futures
+import hashlib
+import itertools
+import json
+import mmap
+import operator
+import os
+import struct
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from pyiges.IGESCore import IGESGlobal, DirectoryFields, _balanced_chunks
+from pyiges.IGESCompressed import Marker, split_parameters
+
+
+def decode_parameter(Parameter):
+    """value of an encoded parameter: None for a default (empty) parameter,
+    a string for a Hollerith string, an int or a float. Reals may have D or
+    E exponents"""
+    if not Parameter:
+        return None
+    if "H" in Parameter:
+        digits = Parameter.index("H")
+        if Parameter[:digits].isdigit():
+            return Parameter[digits + 1:]
+    if "." in Parameter or "E" in Parameter or "D" in Parameter:
+        return float(Parameter.replace("D", "E"))
+    return int(Parameter)
+
+
+def decode_parameters(Parameters):
+    """values of a list of encoded parameters, see decode_parameter"""
+    return list(map(decode_parameter, Parameters))
+
+
+def decode_text(text, ParameterDelimiter=",", RecordDelimiter=";"):
+    """values of the parameters of parameter data text, the same values as
+    decode_parameters(split_parameters(text, ...)). Text without strings is
+    split and converted in one go"""
+    end = text.find(RecordDelimiter)
+    if end < 0 or "H" in text[:end]:
+        return decode_parameters(split_parameters(text, ParameterDelimiter, RecordDelimiter))
+    return [float(Parameter) if "." in Parameter or "E" in Parameter else int(Parameter) if Parameter.strip() else None
+            for Parameter in text[:end].replace("D", "E").split(ParameterDelimiter)]
+
+
+def _int(field):
+    """integer of a directory field, blank fields are 0"""
+    try:
+        return int(field)
+    except ValueError:
+        return 0
+
+
+# the fields of the two records of a directory entry that are read as integers
+_FirstFields = operator.itemgetter(*(slice(i, i + 8) for i in range(0, 72, 8)))
+_SecondFields = operator.itemgetter(*(slice(i, i + 8) for i in range(8, 40, 8)), slice(64, 72))
+
+
+def _integer_fields(getter, record):
+    """integers of the fields of a directory record, blank fields are 0"""
+    fields = getter(record[:72].ljust(72).replace(b"        ", b"       0"))
+    try:
+        return list(map(int, fields))
+    except ValueError:
+        return list(map(_int, fields))
+
+
+# the 8 column fields of the two records of a directory entry, the letter
+# and sequence number of a record make its last field
+_EntryFields = DirectoryFields[:9] + ('Sequence1', 'EntityType2') + DirectoryFields[9:13] + \
+    ('Reserved1', 'Reserved2') + DirectoryFields[13:] + ('Sequence2',)
+_EntrySequences = [_EntryFields.index('Sequence1'), _EntryFields.index('Sequence2')]
+_Block = 1 << 11
+
+
+def _integer_columns(fields):
+    """Convert 8 column integer fields held as little endian uint64 (first
+    column in the low byte) in place to int64, blank fields are 0.
+
+    Right justified fields are converted 8 digits at a time: the leading
+    blanks become "0" and the digits are combined in pairs, then fours, then
+    all eight. Any other field (signs, left justified, letters) is read by
+    _int.
+
+    :return: fields viewed as int64
+    """
+    u = numpy.uint64
+    padded = fields | u(0x1010101010101010)  # " " is 0x20, "0" is 0x30
+    blanks = fields ^ padded
+    blanks >>= u(4)
+    blanks *= u(0xFF)  # 0xFF in the bytes that were padded
+    # any bit left in wrong marks a field that is not blanks then digits
+    wrong = padded & u(0xF0F0F0F0F0F0F0F0)
+    wrong ^= u(0x3030303030303030)  # bytes 0x30 to 0x3F
+    check = numpy.add(padded, u(0x4646464646464646))
+    check &= u(0x8080808080808080)  # bytes over 0x39
+    wrong |= check
+    numpy.bitwise_xor(fields, u(0x2020202020202020), out=check)
+    check &= blanks  # padded bytes that were not blanks
+    wrong |= check
+    numpy.add(blanks, u(1), out=check)
+    check &= blanks  # blanks after a digit
+    wrong |= check
+    originals = [(index, fields[index].tobytes()) for index in zip(*numpy.nonzero(wrong))]
+
+    values = numpy.subtract(padded, u(0x3030303030303030), out=fields)
+    for shift, scale, mask in ((8, 10, 0x00FF00FF00FF00FF), (16, 100, 0x0000FFFF0000FFFF),
+                               (32, 10000, 0x00000000FFFFFFFF)):
+        numpy.right_shift(values, u(shift), out=check)
+        values *= u(scale)
+        values += check
+        values &= u(mask)
+    values = values.view(numpy.int64)
+    for index, field in originals:
+        values[index] = _int(field)
+    return values
+
+
+def _directory_columns(data, RecordLength, entry=0):
+    """directory fields of the directory records in data as a numpy
+    structured array, after checking the section letter and sequence number
+    of every record
+
+    :param int entry: entry of the section data starts at, its directory
+        pointer is 2 * entry + 1
+    """
+    # the records as 8 column fields, read as uint64 straight from data
+    layout = numpy.dtype({'names': _EntryFields, 'formats': ['<u8'] * len(_EntryFields),
+                          'offsets': [8 * i for i in range(0, 10)] + [RecordLength + 8 * i for i in range(0, 10)],
+                          'itemsize': 2 * RecordLength})
+    records = numpy.frombuffer(data, dtype=layout)
+    entries = len(records)
+
+    # a column for the first sequence number (later the pointer), the fields and the second sequence number
+    names = ('Sequence1',) + DirectoryFields + ('Sequence2',)
+    columns = numpy.empty((entries, len(names)), dtype=numpy.uint64)
+    sequences = [0, len(names) - 1]
+    label = names.index('EntityLabel')
+    labels = numpy.empty(entries, dtype=numpy.uint64)
+    letters = numpy.empty((entries, 2), dtype=bool)
+    for first in range(0, entries, _Block):  # blocks small enough to stay in the cache
+        block, rows = columns[first:first + _Block], records[first:first + _Block]
+        for i, name in enumerate(names):
+            block[:, i] = rows[name]
+        letters[first:first + _Block] = (block[:, sequences] & numpy.uint64(0xFF)) != ord("D")
+        block[:, sequences] |= numpy.uint64(0xFF)
+        block[:, sequences] ^= numpy.uint64(0xDF)  # the letter becomes a blank
+        labels[first:first + _Block] = block[:, label]
+        block[:, label] = numpy.uint64(0x2020202020202020)
+        _integer_columns(block)
+    values = columns.view(numpy.int64)
+
+    start = 2 * entry + 1
+    wrong = letters | (values[:, sequences] != numpy.arange(start, start + 2 * entries).reshape(entries, 2))
+    if wrong.any():
+        row, record = map(int, numpy.argwhere(wrong)[0])
+        raise ValueError("Directory record is out of sequence", start + 2 * row + record,
+                         records[row][_EntrySequences[record]].tobytes().decode('latin-1'))
+    values[:, 0] = numpy.arange(start, start + 2 * entries, 2)
+    values[:, label] = labels.view(numpy.int64)
+
+    dtype = numpy.dtype({'names': ('DirectoryPointer',) + DirectoryFields,
+                         'formats': [numpy.int64] * label + ['S8'] + [numpy.int64] * (len(names) - label - 2),
+                         'offsets': [8 * i for i in range(0, len(names) - 1)], 'itemsize': 8 * len(names)})
+    directory = values.view(dtype).reshape(entries)
+    directory['EntityLabel'] = numpy.char.strip(directory['EntityLabel'])
+    return directory
+
+
+class IGESEntityRecord:
+    """An entity as read from a file, its directory fields (see
+    :py:data:`pyiges.IGESCore.DirectoryFields`) as integers, EntityLabel as a
+    string, and its parameters without the leading entity type
+
+    :param int DirectoryPointer: sequence number of its first directory record
+    :param Parameters: decoded parameters, None when only the directory was read
+    """
+    __slots__ = DirectoryFields + ('DirectoryPointer', 'Parameters')
+
+    def __init__(self, DirectoryPointer, first, second, Parameters=None):
+        self.DirectoryPointer = DirectoryPointer
+        (self.EntityType, self.ParameterDataPointer, self.Structure, self.LineFontPattern,
+         self.Level, self.View, self.TransfrmMat, self.LabelDispAssoc,
+         self.StatusNumber) = _integer_fields(_FirstFields, first)
+        (self.LineWeightNum, self.Color, self.ParameterLineCount,
+         self.FormNumber, self.EntitySubScript) = _integer_fields(_SecondFields, second)
+        self.EntityLabel = second[56:64].decode('latin-1').strip()
+        self.Parameters = Parameters
+
+    def __repr__(self):
+        return "<IGESEntityRecord {} type {} form {}>".format(self.DirectoryPointer, self.EntityType,
+                                                              self.FormNumber)
+
+
+class IGESParameterArrays:
+    """Parameters of many entities as flat numpy arrays, the parameters of
+    entity i (without the leading entity type) are at offsets[i] to
+    offsets[i + 1]
+
+    Attributes:
+        DirectoryPointers: int64 directory pointer of each entity
+        offsets: int64, one more than there are entities
+        values: float64 value of each parameter, integers are exact up to
+            2 ** 53, strings and defaults are NaN
+        kinds: int8 kind of each parameter, Default, Integer, Real or String
+        strings: Hollerith strings by their index in values
+    """
+    Default, Integer, Real, String = 0, 1, 2, 3
+    _Kinds = {type(None): Default, int: Integer, float: Real, str: String}
+
+    def __init__(self, DirectoryPointers, offsets, values, kinds, strings):
+        self.DirectoryPointers = DirectoryPointers
+        self.offsets = offsets
+        self.values = values
+        self.kinds = kinds
+        self.strings = strings
+
+    def __len__(self):
+        return len(self.DirectoryPointers)
+
+    def entity(self, i):
+        """parameters of entity i as IGESEntityRecord.Parameters holds them"""
+        first, last = int(self.offsets[i]), int(self.offsets[i + 1])
+        decode = {self.Default: lambda value, index: None,
+                  self.Integer: lambda value, index: int(value),
+                  self.Real: lambda value, index: value,
+                  self.String: lambda value, index: self.strings[index]}
+        return [decode[kind](value, index) for index, kind, value in
+                zip(range(first, last), self.kinds[first:last].tolist(), self.values[first:last].tolist())]
+
+    @classmethod
+    def from_lists(cls, DirectoryPointers, Parameters):
+        """arrays of lists of decoded parameters"""
+        counts = list(map(len, Parameters))
+        flat = list(itertools.chain.from_iterable(Parameters))
+        kinds = numpy.array([cls._Kinds[type(value)] for value in flat], dtype=numpy.int8)
+        if kinds.size and kinds.max() <= cls.Real and kinds.min() >= cls.Integer:
+            values = numpy.array(flat, dtype=numpy.float64)
+            strings = dict()
+        else:
+            values = numpy.array([value if kind in (cls.Integer, cls.Real) else numpy.nan
+                                  for value, kind in zip(flat, kinds.tolist())], dtype=numpy.float64)
+            strings = {index: value for index, value in enumerate(flat) if type(value) is str}
+        offsets = numpy.zeros(len(counts) + 1, dtype=numpy.int64)
+        numpy.cumsum(counts, out=offsets[1:])
+        return cls(numpy.array(DirectoryPointers, dtype=numpy.int64), offsets, values, kinds, strings)
+
+    @classmethod
+    def concatenate(cls, parts):
+        """arrays of the entities of all parts, in order"""
+        parts = list(parts)
+        bases = numpy.cumsum([0] + [len(part.values) for part in parts])
+        offsets = [parts[0].offsets[:1] if parts else numpy.zeros(1, dtype=numpy.int64)]
+        strings = dict()
+        for base, part in zip(bases.tolist(), parts):
+            offsets.append(part.offsets[1:] + base)
+            strings.update((index + base, value) for index, value in part.strings.items())
+        return cls(numpy.concatenate([part.DirectoryPointers for part in parts] or [numpy.zeros(0, numpy.int64)]),
+                   numpy.concatenate(offsets),
+                   numpy.concatenate([part.values for part in parts] or [numpy.zeros(0)]),
+                   numpy.concatenate([part.kinds for part in parts] or [numpy.zeros(0, numpy.int8)]),
+                   strings)
+
+
+def _decode_parameter_range(filename, DirectoryPointers, starts, ends, ParameterDelimiter, RecordDelimiter):
+    """IGESParameterArrays of the entities whose parameter lines are at
+    starts to ends of filename, run in the workers of read_parameters"""
+    Parameters = list()
+    with open(filename, 'rb') as handle:
+        low = min(starts, default=0)
+        handle.seek(low)
+        data = handle.read(max(ends, default=0) - low)
+    for start, end in zip(starts, ends):
+        if start == end:
+            Parameters.append([])
+            continue
+        text = b"".join(line[:64] for line in data[start - low:end - low].splitlines()).decode('latin-1')
+        Parameters.append(decode_text(text, ParameterDelimiter, RecordDelimiter)[1:])
+    return IGESParameterArrays.from_lists(DirectoryPointers, Parameters)
+
+
+class IGESIndex:
+    """Byte offsets of every directory entry of a file and of the parameter
+    lines it points to, so an entity is read without reading the others.
+    Entry i is the entity with directory pointer 2 * i + 1.
+
+    With records of one length the offsets follow from the sequence numbers,
+    only the parameter pointer and line count of each entry are read.
+    Otherwise the directory and parameter sections are scanned once.
+
+    The index can be saved next to the file (filename + Suffix) and loaded
+    again as long as the size and modification time of the file are the same.
+
+    Attributes:
+        Directory: offset of the first record of each directory entry
+        ParameterStart: offset of the first parameter record of each entity
+        ParameterEnd: offset after its last parameter record, the same as
+            ParameterStart when the entity has no parameter lines
+    """
+    Suffix = ".idx"
+    Magic = b"PYIGESIX"
+    Version = 1
+    _Header = struct.Struct("<8sIcQQQ")  # magic, version, byte order, file size, file mtime, entries
+
+    def __init__(self, Directory, ParameterStart, ParameterEnd, stamp):
+        self.Directory = Directory
+        self.ParameterStart = ParameterStart
+        self.ParameterEnd = ParameterEnd
+        self._stamp = stamp
+
+    def __len__(self):
+        return len(self.Directory)
+
+    @staticmethod
+    def _file_stamp(filename):
+        status = os.stat(filename)
+        return status.st_size, status.st_mtime_ns
+
+    @classmethod
+    def build(cls, reader):
+        """index the file of an IGESReader"""
+        stamp = cls._file_stamp(reader.filename)
+        entries = (reader.offsets["P"] - reader.offsets["D"]) // reader.RecordLength // 2 \
+            if reader.RecordLength else None
+        with open(reader.filename, 'rb') as handle:
+            if entries is not None and entries > 0:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return cls(*cls._fixed(reader, mapped, entries), stamp)
+            return cls(*cls._scan(reader, handle), stamp)
+
+    @staticmethod
+    def _fixed(reader, mapped, entries):
+        """offsets of a file with records of one length"""
+        RecordLength = reader.RecordLength
+        Directory = array.array('q', range(reader.offsets["D"], reader.offsets["D"] + 2 * RecordLength * entries,
+                                           2 * RecordLength))
+        ParameterStart, ParameterEnd = array.array('q'), array.array('q')
+        offset = reader.offsets["P"] - RecordLength
+        for DirectoryOffset in Directory:
+            pointer = _int(mapped[DirectoryOffset + 8:DirectoryOffset + 16])
+            count = _int(mapped[DirectoryOffset + RecordLength + 24:DirectoryOffset + RecordLength + 32])
+            start = offset + pointer * RecordLength if pointer else reader.offsets["T"]
+            ParameterStart.append(start)
+            ParameterEnd.append(start + count * RecordLength if pointer else start)
+        return Directory, ParameterStart, ParameterEnd
+
+    @staticmethod
+    def _scan(reader, handle):
+        """offsets of any file, from one pass over its directory and parameter records"""
+        Directory = array.array('q')
+        handle.seek(reader.offsets["D"])
+        offset = reader.offsets["D"]
+        for number, line in enumerate(reader._lines(handle, b"D")):
+            if not number % 2:
+                Directory.append(offset)
+            offset += len(line)
+
+        ParameterStart = array.array('q', [reader.offsets["T"]]) * len(Directory)
+        ParameterEnd = array.array('q', ParameterStart)
+        handle.seek(reader.offsets["P"])
+        offset = reader.offsets["P"]
+        for pointer, lines in itertools.groupby(reader._lines(handle, b"P"), lambda line: line[65:72]):
+            entry = (int(pointer) - 1) // 2
+            ParameterStart[entry] = offset
+            offset += sum(map(len, lines))
+            ParameterEnd[entry] = offset
+        return Directory, ParameterStart, ParameterEnd
+
+    def save(self, filename):
+        """write the index to filename"""
+        with open(filename, 'wb') as myFile:
+            myFile.write(self._Header.pack(self.Magic, self.Version, sys.byteorder[0].encode(),
+                                           self._stamp[0], self._stamp[1], len(self)))
+            for column in (self.Directory, self.ParameterStart, self.ParameterEnd):
+                column.tofile(myFile)
+
+    @classmethod
+    def load(cls, filename, indexed):
+        """index saved in filename for the file indexed, None when there is
+        no index or it was made for another version of the file"""
+        try:
+            with open(filename, 'rb') as myFile:
+                header = myFile.read(cls._Header.size)
+                if len(header) != cls._Header.size:
+                    return None
+                magic, version, byteorder, size, mtime, entries = cls._Header.unpack(header)
+                if (magic, version, byteorder) != (cls.Magic, cls.Version, sys.byteorder[0].encode()) or \
+                        (size, mtime) != cls._file_stamp(indexed):
+                    return None
+                columns = list()
+                for i in range(0, 3):
+                    column = array.array('q')
+                    column.fromfile(myFile, entries)
+                    columns.append(column)
+        except (OSError, EOFError):
+            return None
+        return cls(*columns, (size, mtime))
+
+
+class IGESArrayModel:
+    """Directory and parameters of a whole file as numpy arrays, as
+    :py:meth:`IGESReader.read_directory` and
+    :py:meth:`IGESReader.read_parameters` return them.
+
+    The arrays can be saved next to the file (filename + Suffix), keyed by
+    the SHA-256 of the file and the Version of the decoding. A saved model
+    is memory mapped when it is loaded, the arrays are read from the disk as
+    they are used.
+
+    Attributes:
+        directory: structured array of the directory entries
+        parameters: :py:class:`IGESParameterArrays`
+        digest: SHA-256 of the file the arrays were read from, None when
+            the model is not saved
+    """
+    Suffix = ".arrays"
+    Magic = b"PYIGESAM"
+    Version = 1  # of the decoding, saved models of other versions are read again
+    _Header = struct.Struct("<8sIc32sQ")  # magic, version, byte order, file digest, bytes of the table
+    _Align = 64  # arrays start on multiples of this
+
+    def __init__(self, directory, parameters, digest):
+        self.directory = directory
+        self.parameters = parameters
+        self.digest = digest
+
+    def __len__(self):
+        return len(self.directory)
+
+    @staticmethod
+    def file_digest(filename):
+        """SHA-256 of the content of filename"""
+        digest = hashlib.sha256()
+        with open(filename, 'rb') as myFile:
+            for chunk in iter(lambda: myFile.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.digest()
+
+    def _columns(self):
+        """(name, array) of everything saved, the strings as their indices,
+        the offsets of their latin-1 bytes and the bytes"""
+        strings = sorted(self.parameters.strings.items())
+        encoded = [value.encode('latin-1') for index, value in strings]
+        StringOffsets = numpy.zeros(len(encoded) + 1, dtype=numpy.int64)
+        numpy.cumsum(list(map(len, encoded)), out=StringOffsets[1:])
+        return [("directory", self.directory),
+                ("DirectoryPointers", self.parameters.DirectoryPointers),
+                ("offsets", self.parameters.offsets),
+                ("values", self.parameters.values),
+                ("kinds", self.parameters.kinds),
+                ("StringIndices", numpy.array([index for index, value in strings], dtype=numpy.int64)),
+                ("StringOffsets", StringOffsets),
+                ("StringBytes", numpy.frombuffer(b"".join(encoded), dtype=numpy.uint8))]
+
+    @classmethod
+    def _aligned(cls, size):
+        return -(-size // cls._Align) * cls._Align
+
+    def save(self, filename):
+        """write the arrays to filename, through a temporary file so a
+        reader never sees half a model"""
+        table, offset = list(), 0
+        columns = self._columns()
+        for name, column in columns:
+            table.append([name, numpy.lib.format.dtype_to_descr(column.dtype), list(column.shape), offset])
+            offset += self._aligned(column.nbytes)
+        text = json.dumps(table).encode()
+        start = self._aligned(self._Header.size + len(text))
+
+        temporary = os.fspath(filename) + ".tmp"
+        try:
+            with open(temporary, 'wb') as myFile:
+                myFile.write(self._Header.pack(self.Magic, self.Version, sys.byteorder[0].encode(), self.digest,
+                                               len(text)))
+                myFile.write(text)
+                for (name, column), (name, descr, shape, offset) in zip(columns, table):
+                    myFile.seek(start + offset)
+                    myFile.write(numpy.ascontiguousarray(column).tobytes())
+                myFile.truncate(start + sum(self._aligned(column.nbytes) for name, column in columns))
+            os.replace(temporary, filename)
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+    @classmethod
+    def load(cls, filename, digest):
+        """model saved in filename, memory mapped, None when there is none
+        or it was made from other content or by another version"""
+        try:
+            with open(filename, 'rb') as myFile:
+                header = myFile.read(cls._Header.size)
+                if len(header) != cls._Header.size:
+                    return None
+                magic, version, byteorder, saved, length = cls._Header.unpack(header)
+                if (magic, version, byteorder, saved) != (cls.Magic, cls.Version, sys.byteorder[0].encode(), digest):
+                    return None
+                table = json.loads(myFile.read(length).decode())
+                mapped = mmap.mmap(myFile.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        start = cls._aligned(cls._Header.size + length)
+        arrays = dict()
+        for name, descr, shape, offset in table:
+            dtype = numpy.lib.format.descr_to_dtype(descr)
+            count = int(numpy.prod(shape))
+            if start + offset + count * dtype.itemsize > len(mapped):
+                return None
+            arrays[name] = numpy.frombuffer(mapped, dtype=dtype, count=count, offset=start + offset).reshape(shape) \
+                if count else numpy.zeros(shape, dtype=dtype)
+
+        StringBytes, StringOffsets = arrays["StringBytes"], arrays["StringOffsets"].tolist()
+        strings = {index: StringBytes[first:last].tobytes().decode('latin-1') for index, first, last in
+                   zip(arrays["StringIndices"].tolist(), StringOffsets, StringOffsets[1:])}
+        parameters = IGESParameterArrays(arrays["DirectoryPointers"], arrays["offsets"], arrays["values"],
+                                         arrays["kinds"], strings)
+        return cls(arrays["directory"], parameters, digest)
+
+
+class IGESReader:
+    """Read a fixed form IGES file
+
+    The start and global sections are read when the reader is made. The
+    other sections are streamed by :py:meth:`records`, :py:meth:`directory`
+    and :py:meth:`entities` (also iter(reader)), which may be used many times.
+    Single entities are read by :py:meth:`get_entity` through an
+    :py:class:`IGESIndex`.
+
+    :param filename: file to read, it has to be seekable
+
+    Attributes:
+        StartSection: text of the start section
+        GlobalSection: :py:class:`~pyiges.IGESCore.IGESGlobal` with the values of the file
+        Global: decoded global parameters in file order
+        counts: records of each section as given by the terminate record
+        offsets: byte offset of the first record of each section
+        RecordLength: bytes in a record with its line end, None when they differ
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self._index = None
+        self._file = open(filename, 'rb')
+        try:
+            self._read_head()
+            self._locate_sections()
+        except Exception:
+            self._file.close()
+            raise
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __iter__(self):
+        return self.entities()
+
+    def open_index(self, persist=True):
+        """index of the file for get_entity. With persist a saved index next
+        to the file is used when it is up to date, otherwise the index is
+        built and saved there. When it can not be saved (a read only
+        directory, say) the index is only kept in memory
+
+        :return: :py:class:`IGESIndex`
+        """
+        sidecar = os.fspath(self.filename) + IGESIndex.Suffix
+        index = IGESIndex.load(sidecar, self.filename) if persist else None
+        if index is None:
+            index = IGESIndex.build(self)
+            if persist:
+                try:
+                    index.save(sidecar)
+                except OSError:
+                    pass
+        self._index = index
+        return index
+
+    def open_arrays(self, persist=True, workers=None):
+        """directory and parameters of the whole file as numpy arrays. With
+        persist the model saved next to the file is memory mapped when it
+        was made from the same content (by SHA-256) by this version of the
+        reader, otherwise the file is read and the model saved there. The
+        file is only hashed with persist, and a model that can not be saved
+        is returned all the same
+
+        :param int workers: processes decoding parameters, see read_parameters
+        :return: :py:class:`IGESArrayModel`
+        """
+        if numpy is None:
+            raise ImportError("open_arrays needs numpy")
+        digest = IGESArrayModel.file_digest(self.filename) if persist else None
+        sidecar = os.fspath(self.filename) + IGESArrayModel.Suffix
+        model = IGESArrayModel.load(sidecar, digest) if persist else None
+        if model is None:
+            model = IGESArrayModel(self.read_directory(), self.read_parameters(workers), digest)
+            if persist:
+                try:
+                    model.save(sidecar)
+                except OSError:
+                    pass
+        return model
+
+    def entry_text(self, DirectoryPointer):
+        """the two directory records (bytes) and the parameter text (columns
+        1 to 64 of its lines, None without lines) of one entity. Files with
+        records of one length are read straight at the offsets the pointers
+        give, other files are indexed (in memory) first if open_index was not
+        called"""
+        if self._index is None and not self.RecordLength:
+            self.open_index(persist=False)
+        entries = len(self._index) if self._index is not None else \
+            (self.offsets["P"] - self.offsets["D"]) // (2 * self.RecordLength)
+        entry, odd = divmod(DirectoryPointer - 1, 2)
+        if odd or not 0 <= entry < entries:
+            raise IndexError("No directory entry", DirectoryPointer)
+
+        if self._index is not None:
+            self._file.seek(self._index.Directory[entry])
+            first, second = self._file.readline(), self._file.readline()
+            start, end = self._index.ParameterStart[entry], self._index.ParameterEnd[entry]
+        else:
+            self._file.seek(self.offsets["D"] + 2 * entry * self.RecordLength)
+            first, second = self._file.readline(), self._file.readline()
+            pointer = _int(first[8:16])
+            start = self.offsets["P"] + (pointer - 1) * self.RecordLength
+            end = start + _int(second[24:32]) * self.RecordLength if pointer > 0 else start
+        if start == end:
+            return first, second, None
+        self._file.seek(start)
+        lines = self._file.read(end - start).splitlines()
+        if int(lines[0][65:72]) != DirectoryPointer:
+            raise ValueError("Parameter lines do not belong to the entity, is the index stale?", DirectoryPointer)
+        return first, second, b"".join(line[:64] for line in lines).decode('latin-1')
+
+    def get_entity(self, DirectoryPointer):
+        """read and decode only the entity with this directory pointer, see
+        entry_text
+
+        :return: :py:class:`IGESEntityRecord`
+        """
+        first, second, text = self.entry_text(DirectoryPointer)
+        if text is None:
+            return IGESEntityRecord(DirectoryPointer, first, second, [])
+        return IGESEntityRecord(DirectoryPointer, first, second,
+                                decode_text(text, self.ParameterDelimiter, self.RecordDelimiter)[1:])
+
+    def read_directory(self):
+        """Parse the whole directory section at once into numpy columns. The
+        records are viewed as a structured array of 8 column fields and
+        converted block by block, the section letter and sequence number of
+        every record are checked on the way
+
+        :return: numpy structured array with a DirectoryPointer and the
+            :py:data:`~pyiges.IGESCore.DirectoryFields` of each entry, all
+            int64 but EntityLabel which is bytes (S8)
+        """
+        if numpy is None:
+            raise ImportError("read_directory needs numpy")
+        with open(self.filename, 'rb') as handle:
+            handle.seek(self.offsets["D"])
+            if self.RecordLength:
+                data = handle.read(self.offsets["P"] - self.offsets["D"])
+                width = self.RecordLength
+            else:
+                data = b"".join(line.rstrip(b"\r\n").ljust(80) for line in self._lines(handle, b"D"))
+                width = 80
+        if len(data) % (2 * width):
+            raise ValueError("Directory section has an odd number of records", self.filename)
+        return _directory_columns(data, width)
+
+    def read_parameters(self, workers=None, chunks=None):
+        """Decode the parameters of every entity into numpy arrays. The
+        parameter section is split on entity boundaries into ranges of about
+        the same number of bytes, which are decoded in a pool of worker
+        processes when workers is given (on Windows the program needs the
+        usual ``if __name__ == "__main__":`` guard)
+
+        :param int workers: processes decoding ranges, None decodes here
+        :param int chunks: ranges, 4 per worker by default
+        :return: :py:class:`IGESParameterArrays` in directory order
+        """
+        if numpy is None:
+            raise ImportError("read_parameters needs numpy")
+        index = self._index if self._index is not None else self.open_index(persist=False)
+        sizes = [end - start for start, end in zip(index.ParameterStart, index.ParameterEnd)]
+        chunks = chunks or (4 * workers if workers else max(1, sum(sizes) >> 22))
+        ranges = _balanced_chunks(sizes, chunks)
+        arguments = ([self.filename] * len(ranges),
+                     [range(2 * first + 1, 2 * last + 1, 2) for first, last in ranges],
+                     [index.ParameterStart[first:last] for first, last in ranges],
+                     [index.ParameterEnd[first:last] for first, last in ranges],
+                     [self.ParameterDelimiter] * len(ranges), [self.RecordDelimiter] * len(ranges))
+        if not workers:
+            return IGESParameterArrays.concatenate(map(_decode_parameter_range, *arguments))
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            return IGESParameterArrays.concatenate(executor.map(_decode_parameter_range, *arguments))
+
+    def _read_head(self):
+        """read the start and global sections, they are small"""
+        start, global_lines = list(), list()
+        self.offsets = {"S": 0}
+        offset = 0
+        self.RecordLength = None
+        self._file.seek(0)
+        for line in self._file:
+            if not start and line.rstrip(b"\r\n") == Marker.encode():
+                raise ValueError("pyIGES compressed file, expand it first (see pyiges.IGESCompressed)",
+                                 self.filename)
+            section = line[72:73]
+            if section == b"S":
+                start.append(line[:72])
+            elif section == b"G":
+                self.offsets.setdefault("G", offset)
+                global_lines.append(line[:72])
+            elif section == b"C":
+                raise ValueError("Compressed ASCII files are not read", self.filename)
+            else:
+                break
+            if self.RecordLength != len(line):
+                self.RecordLength = len(line) if self.RecordLength is None else 0
+            offset += len(line)
+        self.RecordLength = self.RecordLength or None
+
+        if not global_lines:
+            raise ValueError("No global section, not a fixed form IGES file", self.filename)
+        self.StartSection = b"".join(start).decode('latin-1').rstrip()
+        text = b"".join(global_lines).decode('latin-1')
+
+        self.ParameterDelimiter, self.RecordDelimiter = ",", ";"
+        if text.startswith("1H"):
+            self.ParameterDelimiter = text[2]
+        first = text.find(self.ParameterDelimiter)
+        if text[first + 1:first + 3] == "1H":
+            self.RecordDelimiter = text[first + 3]
+        self.Global = decode_parameters(split_parameters(text, self.ParameterDelimiter, self.RecordDelimiter))
+        self.GlobalSection = self._global_section(self.Global)
+        self.offsets["D"] = offset
+
+    def _global_section(self, values):
+        """IGESGlobal holding the global parameters of the file, missing and
+        default parameters keep the values of a new IGESGlobal"""
+        GlobalSection = IGESGlobal()
+        names = ['ParameterDelimiterCharacter', 'RecordDelimiter',
+                 'ProductIdentificationFromSender', 'FileName', 'NativeSystemID',
+                 'PreprocessorVersion', 'IntegerBits', 'SPMagnitude', 'SPSignificance', 'DPMagnitude',
+                 'DPSignificance', 'ProductIdentificationForReceiver', 'ModelSpaceScale', 'UnitsFlag', 'UnitsName',
+                 'MaxNumberLineWeightGrads', 'WidthMaxLineWeightUnits', 'DateTimeFileGeneration',
+                 'MaxUserResolution', 'MaxCoordValue', 'NameOfAuthor', 'AuthorOrg', 'VersionFlag',
+                 'DraftStandardFlag', 'DateTimeCreated', 'AppProtocol']
+        for name, value in zip(names, values):
+            if value is not None:
+                setattr(GlobalSection.Units if name.startswith('Units') else GlobalSection, name, value)
+        GlobalSection.ParameterDelimiterCharacter = self.ParameterDelimiter
+        GlobalSection.RecordDelimiter = self.RecordDelimiter
+        return GlobalSection
+
+    def _locate_sections(self):
+        """find the parameter and terminate sections. With records of one
+        length they are where the counts of the terminate record put them,
+        otherwise the directory section is scanned"""
+        size = os.fstat(self._file.fileno()).st_size
+        self._file.seek(max(0, size - 4 * 82))
+        tail = [line for line in self._file.read().splitlines() if line[72:73] == b"T"]
+        if not tail:
+            raise ValueError("No terminate record", self.filename)
+        terminate = tail[-1]
+        self.counts = {terminate[i:i + 1].decode('latin-1'): _int(terminate[i + 1:i + 8]) for i in range(0, 32, 8)}
+
+        if self.RecordLength is not None:
+            ParameterOffset = self.offsets["D"] + self.counts.get("D", 0) * self.RecordLength
+            TerminateOffset = ParameterOffset + self.counts.get("P", 0) * self.RecordLength
+            if self._section_at(ParameterOffset) == b"P" and self._section_at(TerminateOffset) == b"T" and \
+                    self._section_at(ParameterOffset - self.RecordLength) == b"D":
+                self.offsets["P"], self.offsets["T"] = ParameterOffset, TerminateOffset
+                return
+
+        self.RecordLength = None
+        self._file.seek(self.offsets["D"])
+        offset = self.offsets["D"]
+        for line in self._file:
+            section = line[72:73]
+            if section in (b"P", b"T") and section.decode() not in self.offsets:
+                self.offsets[section.decode()] = offset
+            if section == b"T":
+                break
+            offset += len(line)
+        self.offsets.setdefault("P", offset)
+        self.offsets.setdefault("T", offset)
+
+    def _section_at(self, offset):
+        self._file.seek(offset)
+        return self._file.read(80)[72:73]
+
+    def _lines(self, handle, section):
+        """lines of a section from the current position of handle"""
+        return itertools.takewhile(lambda line: line[72:73] == section, handle)
+
+    def records(self, section):
+        """(sequence number, data columns) of every record of a section, for
+        the parameter section the data columns are 1 to 64
+
+        :param str section: "S", "G", "D", "P" or "T"
+        """
+        with open(self.filename, 'rb') as handle:
+            handle.seek(self.offsets[section])
+            width = 64 if section == "P" else 72
+            for line in self._lines(handle, section.encode()):
+                yield int(line[73:80]), line[:width].decode('latin-1')
+
+    def directory(self):
+        """every directory entry in order, as IGESEntityRecord without parameters"""
+        with open(self.filename, 'rb') as handle:
+            handle.seek(self.offsets["D"])
+            lines = self._lines(handle, b"D")
+            DirectoryPointer = 1
+            for first in lines:
+                yield IGESEntityRecord(DirectoryPointer, first, next(lines))
+                DirectoryPointer += 2
+
+    def _parameter_lines(self, handle):
+        handle.seek(self.offsets["P"])
+        for pointer, lines in itertools.groupby(self._lines(handle, b"P"), lambda line: line[65:72]):
+            yield int(pointer), [line[:64] for line in lines]
+
+    def _parameter_groups(self, handle):
+        """(directory pointer, data columns) of the parameter lines of each entity"""
+        for pointer, lines in self._parameter_lines(handle):
+            yield pointer, b"".join(lines).decode('latin-1')
+
+    def parameter_lines(self):
+        """(directory pointer, data columns 1 to 64 of each line as bytes) of
+        the parameter lines of each entity, in file order, nothing decoded"""
+        with open(self.filename, 'rb') as handle:
+            yield from self._parameter_lines(handle)
+
+    def entities(self):
+        """every entity with its parameters, in parameter section order
+        (normally the directory order). An entity is decoded only when it is
+        reached, nothing is kept once it is yielded"""
+        with open(self.filename, 'rb') as parameters, open(self.filename, 'rb') as directory:
+            directory.seek(self.offsets["D"])
+            lines = self._lines(directory, b"D")
+            expected = 1
+            for DirectoryPointer, text in self._parameter_groups(parameters):
+                if DirectoryPointer < expected:
+                    if self.RecordLength is None:
+                        raise ValueError("Parameter data is not in directory order", DirectoryPointer)
+                    directory.seek(self.offsets["D"] + (DirectoryPointer - 1) * self.RecordLength)
+                    lines = self._lines(directory, b"D")
+                    expected = DirectoryPointer
+                for i in range(expected, DirectoryPointer, 2):  # entries without parameters
+                    next(lines), next(lines)
+                first, second = next(lines), next(lines)
+                expected = DirectoryPointer + 2
+
+                Parameters = decode_text(text, self.ParameterDelimiter, self.RecordDelimiter)
+                yield IGESEntityRecord(DirectoryPointer, first, second, Parameters[1:])
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESAsync
+   :platform: Agnostic, Windows
+   :synopsis: Main GUI program
+
+.. requires asyncio, io, os, tempfile (unittest)
+
+.. Created on Sun Oct 18 10:41:12 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+# External Libraries / Modules
+import asyncio
+import os
+import tempfile
+import unittest
+
+# Internal Modules
+from pyiges.IGESAsync import AsyncIGEStorage
+from pyiges.IGESGeomLib import IGESGeomLine, IGESPoint
+from pyiges.tests_IGESCore import empty_system, make_system, save_text, scene, transformed_arcs, shared_transform_text
+
+
+async def async_scene():
+    """the test scene as an async generator that awaits between entities"""
+    for IGESObject in scene():
+        await asyncio.sleep(0)
+        yield IGESObject
+
+
+class Test_AsyncIGEStorage(unittest.TestCase):
+    def test_async_iterator(self):
+        async def build():
+            async with AsyncIGEStorage(empty_system(), chunk_size=2, max_pending=1) as system:
+                self.assertEqual(await system.commit(async_scene()), 7)
+            return system.storage
+        self.assertEqual(save_text(asyncio.run(build())), save_text(make_system()))
+
+    def test_single_and_iterable(self):
+        async def build():
+            system = AsyncIGEStorage(empty_system(), chunk_size=3)
+            entities = scene()
+            await system.commit(next(entities))
+            await system.commit(entities)
+            await system.drain()
+            system.close()
+            return system.storage
+        self.assertEqual(save_text(asyncio.run(build())), save_text(make_system()))
+
+    def test_deferred(self):
+        async def build():
+            async with AsyncIGEStorage(empty_system(deferred=True)) as system:
+                await system.commit(async_scene())
+            return system.storage
+        self.assertEqual(save_text(asyncio.run(build())), save_text(make_system()))
+
+    def test_concurrent_producers(self):
+        async def build():
+            async with AsyncIGEStorage(empty_system(), chunk_size=2) as system:
+                await asyncio.gather(system.commit(async_scene()), system.commit(async_scene()))
+            return system.storage
+
+        storage = asyncio.run(build())
+        text = save_text(storage)
+        self.assertEqual(storage.DirectorySection._linecount, 29)
+        records = text.split("\n")
+        DirectoryRecords = [record for record in records if record[72] == "D"]
+        ParameterRecords = [record for record in records if record[72] == "P"]
+        for first in range(0, len(DirectoryRecords), 2):
+            ParameterPointer = int(DirectoryRecords[first][8:16])
+            self.assertEqual(int(ParameterRecords[ParameterPointer - 1][64:72]), first + 1,
+                             msg='parameter back pointer differs from the directory entry')
+
+    def test_dedup(self):
+        async def build():
+            async with AsyncIGEStorage(empty_system(dedup=True), chunk_size=3) as system:
+                await system.commit(transformed_arcs(5))
+            return system.storage
+        self.assertEqual(save_text(asyncio.run(build())), shared_transform_text(5))
+
+    def test_physically_dependent(self):
+        def lines():
+            for i in range(0, 2):
+                line = IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1))
+                line.StatusNumber.Subordinate.setPhysicallyDependent()
+                yield line
+
+        async def build():
+            async with AsyncIGEStorage(empty_system(dedup=True)) as system:
+                committed = list(lines())
+                await system.commit(committed)
+            return system.storage, committed
+        storage, committed = asyncio.run(build())
+        self.assertEqual([line.DirectoryDataPointer.data for line in committed], [1, 3])
+        self.assertEqual(storage.dedup_stats()['hits'], 0)
+
+    def test_save_async(self):
+        handle, filename = tempfile.mkstemp(suffix='.igs')
+        os.close(handle)
+
+        async def build():
+            async with AsyncIGEStorage(empty_system()) as system:
+                await system.commit(async_scene())
+                await system.save_async(filename)
+        try:
+            asyncio.run(build())
+            with open(filename) as igs_file:
+                self.assertEqual(igs_file.read(), save_text(make_system()))
+        finally:
+            os.remove(filename)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESBlock
+   :platform: Agnostic, Windows
+   :synopsis: Main GUI program
+
+.. requires (unittest)
+
+.. Created on Sun Oct 18 21:58:44 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+# External Libraries / Modules
+import unittest
+
+# Internal Modules
+from pyiges.IGESBlock import IGESBlock
+from pyiges.IGESGeomLib import IGESGeomLine, IGESPoint, IGESPropertyEntity, IGESViewEntity
+from pyiges.tests_IGESCore import empty_system, save_text, scene
+from pyiges.tests_IGESGraph import linked_entities, linked_system
+
+
+class Test_IGESBlock(unittest.TestCase):
+    def setUp(self):
+        self.block = IGESBlock.compile(linked_entities())
+
+    def test_compile(self):
+        self.assertEqual(len(self.block), 11)
+        self.assertEqual(sorted(self.block.relocations), [1, 7, 8, 10])  # 122, 102, 308 and 408
+        self.assertEqual(self.block.relocations[7][1], [2, 3])
+        self.assertEqual(self.block.references[10], [19, 17])
+
+    def test_splice_empty(self):
+        system = empty_system()
+        pointers = system.splice(self.block)
+        self.assertEqual([pointer.data for pointer in pointers], list(range(1, 22, 2)))
+        self.assertEqual(save_text(system), save_text(linked_system()))
+
+    def test_splice(self):
+        expected = empty_system(references=True)
+        expected.commit_many(scene())
+        expected.commit_many(linked_entities())
+        expected.commit_many(linked_entities())
+        graph = expected.reference_graph()
+        for kwargs in (dict(), dict(directory_table=True), dict(spool=True), dict(workers=2)):
+            system = empty_system(references=True, **kwargs)
+            system.commit_many(scene())
+            self.assertEqual(system.splice(self.block)[0].data, 15)
+            system.splice(self.block)
+            self.assertEqual(save_text(system), save_text(expected), msg=kwargs)
+            spliced = system.reference_graph()
+            self.assertEqual((spliced.offsets, spliced.targets), (graph.offsets, graph.targets), msg=kwargs)
+
+    def test_errors(self):
+        system = empty_system()
+        system.GlobalSection.ParameterDelimiterCharacter = "/"
+        self.assertRaises(ValueError, system.splice, self.block)
+        self.assertRaises(ValueError, empty_system(deferred=True).splice, self.block)
+
+        outside = IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 0, 0))
+        outside.TransfrmMat = 7
+        self.assertRaises(ValueError, IGESBlock.compile, [outside])
+
+    def test_back_pointers(self):
+        def entities(pointer=None):
+            prop = IGESPropertyEntity([2, 0.5, 1], 15)
+            yield prop
+            line = IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 0, 0))
+            line.AddParameters([0, 1, pointer or prop.DirectoryDataPointer.data])
+            yield line
+        block = IGESBlock.compile(entities())
+        self.assertEqual(block.relocations[1][1], [9])
+        system = empty_system()
+        system.commit_many(scene())
+        self.assertEqual([pointer.data for pointer in system.splice(block)], [15, 17])
+        rows, lines = block.place(14, 1, system.GlobalSection)
+        self.assertTrue(lines[-1].startswith("110,0,0,0,1,0,0,0,1,15;"))  # the property at 15
+        self.assertRaises(ValueError, IGESBlock.compile, entities(pointer=99))
+
+    def test_unknown(self):
+        view = IGESViewEntity([1, 1.0, 0, 0, 0, 0, 0, 0])
+        view.FormNumber = 1  # perspective views are not laid out
+        self.assertRaisesRegex(ValueError, "entity", IGESBlock.compile, [view])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESCompile
+   :platform: Agnostic, Windows
+   :synopsis: Main GUI program
+
+.. requires decimal (unittest)
+
+.. Created on Sat Oct 17 11:40:02 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+# External Libraries / Modules
+import decimal
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Internal Modules
+from pyiges.IGESCompile import IGESParameterEncoder, IGESUnaligned, IGESUnalignedArray
+from pyiges.IGESCore import IGESGlobal
+
+
+class Test_IGESParameterEncoder(unittest.TestCase):
+    def test_significance(self):
+        encode = IGESParameterEncoder("significance", 6).encode
+        self.assertEqual([encode(item) for item in (0.1, 1.0, 100.0, 1 / 3.0, 1e-7, -2.5e20)],
+                         ["0.1", "1.", "100.", "0.333333", "1.E-07", "-2.5E+20"])
+
+    def test_shortest_round_trip(self):
+        encode = IGESParameterEncoder("shortest").encode
+        for item in (0.1 + 0.2, 1 / 3.0, 1e-300, 5e-324, 1.7976931348623157e308, -0.0, 2.0 ** 60):
+            self.assertEqual(float(encode(item)), item, msg='shortest format must read back exactly')
+            self.assertTrue("." in encode(item), msg='reals always carry a decimal point')
+
+    def test_types(self):
+        encode = IGESParameterEncoder().encode
+        self.assertEqual([encode(item) for item in (5, -3, True, "PERSON")], ["5", "-3", "1", "6HPERSON"])
+        self.assertRaises(NotImplementedError, encode, [1, 2])
+        self.assertRaises(ValueError, encode, float("inf"))
+
+    def test_leaves_decimal_context(self):
+        before = decimal.getcontext().prec
+        IGESUnaligned([1.23456789012345, 2.0], IGESGlobal(), "P", 1)
+        self.assertEqual(decimal.getcontext().prec, before)
+
+    def test_global_significance(self):
+        IGESGlobalSection = IGESGlobal()
+        IGESGlobalSection.DPSignificance = 4
+        lines, count = IGESUnaligned([110, 1.23456789], IGESGlobalSection, "P", 1)
+        self.assertEqual(lines[0][:12].rstrip(), "110,1.235;")
+        IGESGlobalSection.RealFormat = "shortest"
+        lines, count = IGESUnaligned([110, 1.23456789], IGESGlobalSection, "P", 1)
+        self.assertEqual(lines[0][:16].rstrip(), "110,1.23456789;")
+
+
+class Test_IGESUnalignedArray(unittest.TestCase):
+    def random_parameters(self, count):
+        return [random.choice([random.randint(-10 ** 9, 10 ** 9),
+                               random.uniform(-1, 1) * 10 ** random.randint(-30, 30),
+                               float(random.randint(-100, 100)), 0, 1])
+                for i in range(0, count)]
+
+    def test_matches_scalar(self):
+        random.seed(3)
+        IGESGlobalSection = IGESGlobal()
+        for real_format in IGESParameterEncoder.RealFormats:
+            IGESGlobalSection.RealFormat = real_format
+            for i in range(0, 200):
+                data = self.random_parameters(random.randint(1, 60))
+                self.assertEqual(IGESUnalignedArray(data, IGESGlobalSection, 2 * i + 1),
+                                 IGESUnaligned(data, IGESGlobalSection, 'P', 2 * i + 1))
+
+    def test_long_strings_fall_back(self):
+        data = [212, 1, "A LONG NOTE THAT WILL NOT FIT ON HALF OF A PARAMETER LINE", 0.5]
+        self.assertEqual(IGESUnalignedArray(data, IGESGlobal(), 25), IGESUnaligned(data, IGESGlobal(), 'P', 25))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_array(self):
+        data = numpy.linspace(-5, 5, 301)
+        self.assertEqual(IGESUnalignedArray(data, IGESGlobal(), 7),
+                         IGESUnaligned([float(item) for item in data], IGESGlobal(), 'P', 7))
+
+
+if __name__ == '__main__':
+    unittest.main()
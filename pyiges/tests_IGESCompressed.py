@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESCompressed
+   :platform: Agnostic, Windows
+   :synopsis: Main GUI program
+
+.. requires io, os, tempfile (unittest)
+
+.. Created on Sun Oct 18 15:02:51 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+# External Libraries / Modules
+import io
+import os
+import tempfile
+import unittest
+
+# Internal Modules
+from pyiges.IGESCompressed import Marker, compress, expand, convert, split_parameters
+from pyiges.IGESGeomLib import IGESPropertyEntity
+from pyiges.IGESReader import IGESReader
+from pyiges.tests_IGESCore import empty_system, make_system, save_text, scene
+
+
+def compressed_text(system):
+    stream = io.StringIO()
+    system.save(stream, form="compressed")
+    return stream.getvalue()
+
+
+def expanded_text(text):
+    stream = io.StringIO()
+    expand(io.StringIO(text), stream)
+    return stream.getvalue()
+
+
+def strings_entities():
+    """the test scene and entities with strings holding delimiters and blanks"""
+    yield from scene()
+    yield IGESPropertyEntity([3, "A,B;C", " ends in blanks  ", 2.5], 15)
+
+
+def strings_system(**kwargs):
+    system = empty_system(**kwargs)
+    system.commit_many(strings_entities())
+    return system
+
+
+class Test_split_parameters(unittest.TestCase):
+    def test_numbers(self):
+        self.assertEqual(split_parameters("110, 0.,1.5E-07 ,;junk"), ["110", "0.", "1.5E-07", ""])
+
+    def test_strings(self):
+        self.assertEqual(split_parameters("406,3HA;B,2H  ,1;"), ["406", "3HA;B", "2H  ", "1"])
+
+    def test_no_record_delimiter(self):
+        self.assertRaises(ValueError, split_parameters, "110,0.,1.")
+        self.assertRaises(ValueError, split_parameters, "406,3HA,B")
+
+
+class Test_compressed(unittest.TestCase):
+    def test_round_trip(self):
+        for system in (make_system, strings_system):
+            fixed = save_text(system())
+            self.assertEqual(expanded_text(compressed_text(system())), fixed)
+
+    def test_long_strings(self):
+        def system():
+            system = empty_system()
+            system.commit_many([IGESPropertyEntity([2, "x" * 150, 1], 15), IGESPropertyEntity(["z" * 200], 15),
+                                IGESPropertyEntity([3, "A", 2, "y" * 70, 1], 15)])
+            return system
+        packed, compressed = io.StringIO(), compressed_text(system())
+        compress(io.StringIO(save_text(system())), packed)
+        self.assertEqual(packed.getvalue(), compressed)
+        self.assertIn(",150H" + "x" * 150 + ",1;", compressed)
+        self.assertEqual(expanded_text(compressed), save_text(system()))
+
+    def test_compress_fixed_file(self):
+        compressed = io.StringIO()
+        compress(io.StringIO(save_text(strings_system())), compressed)
+        for kwargs in ({}, {'directory_table': True}, {'spool': True}):
+            self.assertEqual(compressed.getvalue(), compressed_text(strings_system(**kwargs)), msg=kwargs)
+
+    def test_form(self):
+        text = compressed_text(make_system(directory_table=True))
+        self.assertEqual(text.split("\n")[:2], [Marker, str(make_system().StartSection)])
+        self.assertNotIn("C", [record[72:73] for record in text.split("\n")])
+        self.assertLess(len(text), len(save_text(make_system())))
+        self.assertEqual(expanded_text(text), save_text(make_system()))
+
+    def test_not_compressed(self):
+        fixed = save_text(make_system())
+        self.assertRaises(ValueError, expanded_text, fixed)
+        flagged = fixed[:72] + "C" + fixed[73:]  # the compressed ASCII form of the specification
+        self.assertRaisesRegex(ValueError, "specification", expanded_text, flagged)
+
+    def test_reader_refuses(self):
+        handle, filename = tempfile.mkstemp(suffix=".igc")
+        try:
+            with os.fdopen(handle, 'w', newline='\n') as myFile:
+                myFile.write(compressed_text(make_system()))
+            self.assertRaisesRegex(ValueError, "expand", IGESReader, filename)
+        finally:
+            os.remove(filename)
+
+    def test_unknown_form(self):
+        self.assertRaises(ValueError, make_system().write, io.StringIO(), "packed")
+
+    def test_convert(self):
+        folder = tempfile.mkdtemp()
+        fixed, compressed, back = (os.path.join(folder, name) for name in ("a.igs", "a.igc", "b.igs"))
+        try:
+            strings_system().save(fixed)
+            self.assertEqual(convert(fixed, compressed), "compressed")
+            self.assertEqual(convert(compressed, back), "fixed")
+            with open(fixed) as original, open(back) as converted:
+                self.assertEqual(original.read(), converted.read())
+        finally:
+            for filename in (fixed, compressed, back):
+                if os.path.exists(filename):
+                    os.remove(filename)
+            os.rmdir(folder)
+
+
+if __name__ == '__main__':
+    unittest.main()
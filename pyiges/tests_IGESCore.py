@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESCore
+   :platform: Agnostic, Windows
+   :synopsis: Main GUI program
+
+.. requires bz2, gzip, io, lzma, os, tempfile (unittest)
+
+.. Created on Sat Oct 17 09:12:40 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+# External Libraries / Modules
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Internal Modules
+from pyiges.IGESCore import (IGEStorage, IGESItemData, IGESParameterList, IGESDirectory, IGESDirectoryTable,
+                             register_directory_layout, _balanced_chunks, _DirectoryLines, _DirectoryRecords)
+from pyiges.IGESGeomLib import (IGESPoint, IGESGeomLine, IGESGeomPolyline, IGESExtrude,
+                                IGESGeomArc, IGESGeomTransform,
+                                IGESPropertyEntity, IGESViewEntity, IGESDrawingEntity)
+
+
+def empty_system(**kwargs):
+    """storage with a fixed time stamp so outputs can be compared"""
+    system = IGEStorage(**kwargs)
+    system.StartSection.Prolog = " "
+    system.GlobalSection.DateTimeFileGeneration = "20130101.000000"
+    system.GlobalSection.DateTimeCreated = "20130101.000000"
+    return system
+
+
+def scene():
+    """generator of a small scene, the extrude refers back to the polyline"""
+    polyline = IGESGeomPolyline()
+    for i in range(0, 40):
+        polyline.AddPoint(IGESPoint(i * 0.25, i / 3.0, 10))
+    yield polyline
+    yield IGESExtrude(polyline, IGESPoint(0, 0, 15))
+    for i in range(0, 5):
+        yield IGESGeomLine(IGESPoint(-2, -5, i), IGESPoint(22, -5, i))
+
+
+def make_system(**kwargs):
+    system = empty_system(**kwargs)
+    for IGESObject in scene():
+        system.Commit(IGESObject)
+    return system
+
+
+def save_text(system):
+    stream = io.StringIO()
+    system.save(stream)
+    return stream.getvalue()
+
+
+class Test_IGEStorage(unittest.TestCase):
+    def test_spool_matches_memory(self):
+        self.assertEqual(save_text(make_system(spool=True)), save_text(make_system()),
+                         msg='spooled storage output differs from in memory storage')
+
+    def test_save_to_binary_stream(self):
+        stream = io.BytesIO()
+        make_system(spool=True).save(stream)
+        self.assertEqual(stream.getvalue().decode('ascii'), save_text(make_system()))
+
+    def test_save_to_file(self):
+        handle, filename = tempfile.mkstemp(suffix='.igs')
+        os.close(handle)
+        try:
+            make_system().save(filename)
+            with open(filename) as igs_file:
+                text = igs_file.read()
+        finally:
+            os.remove(filename)
+        self.assertEqual(text, save_text(make_system()))
+        self.assertTrue(all(len(line) == 80 for line in text.split("\n")), msg='all records are 80 columns')
+
+    def test_save_mapped(self):
+        handle, filename = tempfile.mkstemp(suffix='.igs')
+        os.close(handle)
+        try:
+            for kwargs in ({}, {'spool': True}, {'directory_table': True}):
+                for threads in (None, 2):
+                    system = make_system(**kwargs)
+                    system.write_mapped(filename, threads, chunk_size=3)
+                    with open(filename) as igs_file:
+                        self.assertEqual(igs_file.read(), save_text(make_system()))
+        finally:
+            os.remove(filename)
+
+    def test_save_compressed(self):
+        folder = tempfile.mkdtemp()
+        try:
+            for suffix, module in ((".igs.gz", gzip), (".igs.bz2", bz2), (".igs.xz", lzma)):
+                filename = os.path.join(folder, "scene" + suffix)
+                make_system().save(filename, compresslevel=1)
+                with module.open(filename, 'rt', newline='') as igs_file:
+                    self.assertEqual(igs_file.read(), save_text(make_system()), msg=suffix)
+                os.remove(filename)
+        finally:
+            os.rmdir(folder)
+
+    def test_save_compressed_stream(self):
+        stream = io.BytesIO()
+        make_system().save(stream, compression="gzip")
+        self.assertFalse(stream.closed)
+        self.assertEqual(gzip.decompress(stream.getvalue()).decode('ascii'), save_text(make_system()))
+
+    def test_save_arguments(self):
+        system = make_system()
+        self.assertRaises(ValueError, system.save, io.BytesIO(), compression="zstd")
+        self.assertRaises(ValueError, system.save, io.StringIO(), compression="gzip")
+        self.assertRaises(ValueError, system.save, io.StringIO(), form="free")
+        self.assertRaisesRegex(ValueError, "compressed", system.save, "scene.igs", mapped=True, compression="gzip")
+        self.assertRaisesRegex(ValueError, "form", system.save, "scene.igs", mapped=True, form="compressed")
+        self.assertFalse(os.path.exists("scene.igs"))
+
+    def test_str_matches_save(self):
+        self.assertEqual(str(make_system(spool=True)).replace("\n", ""),
+                         save_text(make_system()).replace("\n", ""))
+
+
+class Test_IGESItemData(unittest.TestCase):
+    def test_status_number(self):
+        line = IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1))
+        line.StatusNumber.Visablilty.setBlanked()
+        line.StatusNumber.EntityUseFlag.setDefinition()
+        line.StatusNumber.Hierachy.setUseHieracyProperty()
+        self.assertEqual(str(line.StatusNumber), "01000202")
+        self.assertEqual(line.StatusNumber.EntityUseFlag.value, 2)
+        line.StatusNumber.EntityUseFlag.setGeometry()
+        line.StatusNumber.Subordinate = 3
+        self.assertEqual(str(line.StatusNumber), "01030002")
+        self.assertEqual(line.CompileDirectory()[0][64:72], "01030002")
+
+    def test_compact(self):
+        line = IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1))
+        self.assertFalse(hasattr(line, '__dict__'), msg='entities should not have a __dict__')
+        with self.assertRaises(AttributeError):
+            line.Colour = 2
+
+    def test_compiled_lines_released(self):
+        system = make_system()
+        for IGESObject in scene():
+            system.Commit(IGESObject)
+            self.assertEqual(IGESObject.CompiledParameter, ())
+            self.assertEqual(IGESObject.CompiledDirectory, ())
+
+
+class Test_register_directory_layout(unittest.TestCase):
+    def test_property_layout(self):
+        prop = IGESPropertyEntity([2, 0.5, 1], 15)
+        prop.ParameterDataPointer.data = 21
+        prop.ParameterLineCount = 1
+        prop.Level = 3
+        prop.Color.setRed()
+        self.assertEqual(prop.CompileDirectory(),
+                         ["     406      21" + " " * 16 + "       3" + " " * 24 + "00000000",
+                          "     406" + " " * 16 + "       1      15" + " " * 32])
+
+    def test_register(self):
+        entity = IGESItemData()
+        entity.EntityType.value = 9999
+        entity.Level = 4
+        entity.Color.setRed()
+        default = entity.CompileDirectory()
+        register_directory_layout(9999, blank=('Level', 'Color'))
+        self.addCleanup(_DirectoryLines.pop, 9999)
+        self.addCleanup(_DirectoryRecords.pop, 9999)
+        lines = entity.CompileDirectory()
+        self.assertEqual(lines[0], default[0][:32] + " " * 8 + default[0][40:])
+        self.assertEqual(lines[1], default[1][:16] + " " * 8 + default[1][24:])
+
+        table = IGESDirectoryTable()
+        table.AddEntities([entity])
+        self.assertEqual(str(table), "\n" + lines[0] + "D      1\n" + lines[1] + "D      2")
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            register_directory_layout(9998, blank=('Colour', ))
+
+
+class Test_IGESDirectoryTable(unittest.TestCase):
+    def entities(self):
+        system = make_system()
+        entities = list()
+        for IGESObject in [IGESPropertyEntity([2, 0.5, 1], 15), IGESViewEntity([1, 1.0, 0, 0]),
+                           IGESDrawingEntity([0, 0], 0)] + list(scene()):
+            IGESObject.Level = 3
+            IGESObject.TransfrmMat = 7
+            IGESObject.EntityLabel = "LONG LABEL"
+            IGESObject.StatusNumber.EntityUseFlag.setDefinition()
+            system.Commit(IGESObject)
+            entities.append(IGESObject)
+        return entities
+
+    def test_matches_lines(self):
+        directory, table = IGESDirectory(), IGESDirectoryTable()
+        entities = self.entities()
+        directory.AddEntities(entities)
+        table.AddEntities(entities)
+        self.assertEqual(str(table), str(directory))
+        self.assertEqual(table._linecount, directory._linecount)
+
+        directory_text, table_text = io.StringIO(), io.StringIO()
+        directory.WriteSection(directory_text)
+        table.WriteSection(table_text, chunk_size=3)
+        self.assertEqual(table_text.getvalue(), directory_text.getvalue())
+
+    def test_add_lines(self):
+        directory, table = IGESDirectory(), IGESDirectoryTable()
+        directory.AddEntities(self.entities())
+        table.AddLines(directory._data)
+        self.assertEqual(str(table), str(directory))
+        self.assertEqual(table._linecount, directory._linecount)
+        self.assertRaises(ValueError, table.AddLines, directory._data[:1])
+
+    def test_float_fields(self):
+        directory, table = IGESDirectory(), IGESDirectoryTable()
+        entities = self.entities()
+        for IGESObject in entities:
+            IGESObject.LineWeightNum = 2.0
+        directory.AddEntities(entities)
+        table.AddEntities(entities)
+        table.update(table.select(EntityType=110), Level=3.0)
+        table.update(Color=0.0)
+        self.assertEqual(str(table), str(directory).replace("     2.0", "       2"))
+
+    def test_storage(self):
+        self.assertEqual(save_text(make_system(directory_table=True)), save_text(make_system()))
+        self.assertEqual(save_text(make_system(directory_table=True, deferred=True)), save_text(make_system()))
+
+    def test_update(self):
+        table = IGESDirectoryTable()
+        table.AddEntities(self.entities())
+        lines = table.select(EntityType=110)
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(table.select(EntityType=110, FormNumber=1), [])
+        table.update(lines, Level=5)
+        self.assertEqual([table.columns['Level'][row] for row in lines], [5] * 5)
+        self.assertEqual(table.columns['Level'][0], 3)
+        table.update(Color=2)
+        self.assertEqual(set(table.columns['Color']), set([2]))
+
+    def test_renumber(self):
+        table = IGESDirectoryTable()
+        table.AddEntities(self.entities())
+        table.update(None, LineFontPattern=-9, Color=4)
+        table.renumber(lambda pointer: pointer + 100)
+        self.assertEqual(set(table.columns['TransfrmMat']), set([107]))
+        self.assertEqual(set(table.columns['LineFontPattern']), set([-109]))
+        self.assertEqual(set(table.columns['Color']), set([4]))
+        self.assertEqual(table.columns['View'][0], 0)
+        pointers = list(table.columns['ParameterDataPointer'])
+        table.shift_parameters(10)
+        self.assertEqual(list(table.columns['ParameterDataPointer']), [pointer + 10 for pointer in pointers])
+
+
+class Test_commit_many(unittest.TestCase):
+    def test_matches_commit(self):
+        for chunk_size in (1, 2, 1024):
+            system = empty_system()
+            self.assertEqual(system.commit_many(scene(), chunk_size), 7)
+            self.assertEqual(save_text(system), save_text(make_system()), msg='chunk size {}'.format(chunk_size))
+
+    def test_after_commit(self):
+        system = empty_system()
+        objects = scene()
+        system.Commit(next(objects))
+        system.commit_many(objects)
+        self.assertEqual(save_text(system), save_text(make_system()))
+
+
+class Test_deferred(unittest.TestCase):
+    def test_matches_commit(self):
+        self.assertEqual(save_text(make_system(deferred=True)), save_text(make_system()))
+        self.assertEqual(save_text(make_system(deferred=True, spool=True)), save_text(make_system()))
+
+    def test_edit_after_commit(self):
+        system = empty_system(deferred=True)
+        polyline = IGESGeomPolyline()
+        polyline.AddPoint(IGESPoint(0, 0, 0))
+        system.Commit(polyline)
+        line = IGESGeomLine(IGESPoint(-2, -5, 0), IGESPoint(22, -5, 0))
+        system.Commit(line)
+        save_text(system)
+
+        for i in range(1, 40):
+            polyline.AddPoint(IGESPoint(i * 0.25, i / 3.0, 10))
+        line.Color.setRed()
+
+        expected = empty_system()
+        expected_polyline = IGESGeomPolyline()
+        for i in range(0, 40):
+            expected_polyline.AddPoint(IGESPoint(i * 0.25, i / 3.0, 10) if i else IGESPoint(0, 0, 0))
+        expected.Commit(expected_polyline)
+        expected_line = IGESGeomLine(IGESPoint(-2, -5, 0), IGESPoint(22, -5, 0))
+        expected_line.Color.setRed()
+        expected.Commit(expected_line)
+        self.assertEqual(save_text(system), save_text(expected))
+
+    def test_only_dirty_recompiled(self):
+        system = make_system(deferred=True)
+        save_text(system)
+        polyline, extrude = system._entities[:2]
+        extrude_lines = extrude.CompiledParameter
+        polyline.AddPoint(IGESPoint(1, 2, 3))
+        self.assertTrue(polyline.IsDirty())
+        self.assertFalse(extrude.IsDirty())
+        save_text(system)
+        self.assertIs(extrude.CompiledParameter, extrude_lines, msg='unchanged entity was recompiled')
+        self.assertFalse(polyline.IsDirty())
+
+    def test_type_change_is_dirty(self):
+        system = make_system(deferred=True)
+        save_text(system)
+        line = system._entities[-1]
+        line.ParameterData[0] = float(line.ParameterData[0])
+        line.ParameterData[1] = int(line.ParameterData[1])
+        self.assertTrue(line.IsDirty())
+
+    def test_reassigned_is_dirty(self):
+        system = make_system(deferred=True)
+        save_text(system)
+        line = system._entities[-1]
+        line.ParameterData = list(line.ParameterData)
+        self.assertTrue(line.IsDirty())
+        self.assertIsInstance(line.ParameterData, IGESParameterList)
+        self.assertNotIn(tuple(line.GetParameters()), line.CompiledState, msg='parameters kept for IsDirty')
+
+    def test_global_change_recompiles(self):
+        system = make_system(deferred=True)
+        save_text(system)
+        system.GlobalSection.RealFormat = "shortest"
+        expected = empty_system()
+        expected.GlobalSection.RealFormat = "shortest"
+        expected.commit_many(scene())
+        self.assertEqual(save_text(system), save_text(expected))
+
+
+def transformed_arcs(count):
+    """arcs that each commit their own copy of the same transform"""
+    for i in range(0, count):
+        transform = IGESGeomTransform([1, 0, 0, 5, 0, 1, 0, 6, 0, 0, 1, 7], 1)
+        yield transform
+        arc = IGESGeomArc(0, IGESPoint(i, 0), IGESPoint(i + 1, 0), IGESPoint(i - 1, 0))
+        arc.TransfrmMat = transform.DirectoryDataPointer.data
+        yield arc
+
+
+def shared_transform_text(count):
+    """file of the transformed arcs sharing one transform"""
+    system = empty_system()
+    transform = IGESGeomTransform([1, 0, 0, 5, 0, 1, 0, 6, 0, 0, 1, 7], 1)
+    system.Commit(transform)
+    for i in range(0, count):
+        arc = IGESGeomArc(0, IGESPoint(i, 0), IGESPoint(i + 1, 0), IGESPoint(i - 1, 0))
+        arc.TransfrmMat = transform.DirectoryDataPointer.data
+        system.Commit(arc)
+    return save_text(system)
+
+
+class Test_dedup(unittest.TestCase):
+
+    def test_shared_transform(self):
+        system = empty_system(dedup=True)
+        pointers = [system.Commit(IGESObject).data for IGESObject in transformed_arcs(5)]
+        self.assertEqual(pointers[0::2], [1] * 5)
+        self.assertEqual(pointers[1::2], [3, 5, 7, 9, 11])
+        self.assertEqual(save_text(system), shared_transform_text(5))
+        self.assertEqual(system.dedup_stats(), {'hits': 4, 'misses': 6, 'evicted': 0, 'entries': 6})
+
+    def test_commit_many_and_workers(self):
+        for kwargs in ({}, {'workers': 2}):
+            system = empty_system(dedup=True, **kwargs)
+            system.commit_many(transformed_arcs(5))
+            self.assertEqual(save_text(system), shared_transform_text(5))
+
+    def test_types_differ(self):
+        system = empty_system(dedup=True)
+        system.Commit(IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1)))
+        system.Commit(IGESGeomLine(IGESPoint(0., 0, 0), IGESPoint(1, 1, 1)))
+        red = IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1))
+        red.Color.setRed()
+        system.Commit(red)
+        self.assertEqual(system.dedup_stats()['hits'], 0)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_values(self):
+        system = empty_system(dedup=True)
+        system.Commit(IGESGeomLine(IGESPoint(0., 0., 0.), IGESPoint(1, 1, 1)))
+        system.Commit(IGESGeomLine(IGESPoint(numpy.float64(0), numpy.float32(0), 0.),
+                                   IGESPoint(numpy.int64(1), 1, numpy.int32(1))))
+        self.assertEqual(system.dedup_stats()['hits'], 1)
+
+    def test_physically_dependent(self):
+        system = empty_system(dedup=True)
+        for i in range(0, 2):
+            line = IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1))
+            line.StatusNumber.Subordinate.setPhysicallyDependent()
+            self.assertEqual(system.Commit(line).data, 2 * i + 1)
+        system.Commit(IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1)))
+        self.assertEqual(system.dedup_stats(), {'hits': 0, 'misses': 1, 'evicted': 0, 'entries': 1})
+
+    def test_bounded(self):
+        system = empty_system(dedup=2)
+        for i in range(0, 10):
+            system.Commit(IGESGeomLine(IGESPoint(i, 0, 0), IGESPoint(1, 1, 1)))
+        system.Commit(IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1)))
+        self.assertEqual(system.dedup_stats(), {'hits': 0, 'misses': 11, 'evicted': 9, 'entries': 2})
+        self.assertEqual(system.Commit(IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 1, 1))).data, 21)
+
+    def test_not_deferred(self):
+        with self.assertRaises(ValueError):
+            IGEStorage(dedup=True, deferred=True)
+
+
+class Test_parallel(unittest.TestCase):
+    def test_matches_serial(self):
+        system = make_system(workers=2)
+        self.assertEqual(len(system._pending), 7, msg='entities wait for the parallel compile')
+        self.assertEqual(save_text(system), save_text(make_system()))
+
+    def test_commit_many(self):
+        system = empty_system(workers=2, spool=True)
+        system.commit_many(scene())
+        self.assertEqual(save_text(system), save_text(make_system()))
+
+    def test_deferred(self):
+        system = make_system(deferred=True, workers=2)
+        self.assertEqual(save_text(system), save_text(make_system()))
+        system._entities[0].AddPoint(IGESPoint(1, 2, 3))
+        serial = make_system(deferred=True)
+        serial._entities[0].AddPoint(IGESPoint(1, 2, 3))
+        self.assertEqual(save_text(system), save_text(serial))
+
+    def test_balanced_chunks(self):
+        chunks = _balanced_chunks([10, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 10], 3)
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], 12)
+        self.assertTrue(all(first < last for first, last in chunks))
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(chunks, chunks[1:])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESExtract
+   :platform: Agnostic, Windows
+   :synopsis: Main GUI program
+
+.. requires io, os (unittest)
+
+.. Created on Sun Oct 18 20:52:40 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+# External Libraries / Modules
+import io
+import os
+import unittest
+
+# Internal Modules
+from pyiges.IGESExtract import closure, extract, select
+from pyiges.IGESGeomLib import IGESGeomLine, IGESPoint, IGESPropertyEntity, IGESViewEntity
+from pyiges.IGESGraph import IGESReferenceGraph
+from pyiges.IGESReader import IGESReader
+from pyiges.tests_IGESCore import empty_system, save_text
+from pyiges.tests_IGESGraph import linked_system
+from pyiges.tests_IGESReader import saved
+
+
+class Test_extract(unittest.TestCase):
+    def setUp(self):
+        self.text = save_text(linked_system())
+        self.filename = saved(self.text)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def extracted(self, **kwargs):
+        """the renumbering and the entities of the extracted file"""
+        stream = io.StringIO()
+        renumber = extract(self.filename, stream, **kwargs)
+        filename = saved(stream.getvalue())
+        try:
+            with IGESReader(filename) as reader:
+                return renumber, list(reader), IGESReferenceGraph.from_reader(reader)
+        finally:
+            os.remove(filename)
+
+    def test_select(self):
+        with IGESReader(self.filename) as reader:
+            self.assertEqual(select(reader, EntityTypes={110}), {5, 7, 9, 11, 13})
+            self.assertEqual(select(reader, EntityTypes={110}, FormNumbers={1}), set())
+            self.assertEqual(select(reader, EntityTypes={408}, DirectoryPointers=[3]), {3, 21})
+            self.assertEqual(closure(reader, [15]), {15, 5, 7})
+            self.assertRaises(IndexError, closure, reader, [23])
+
+    def test_everything(self):
+        stream = io.StringIO()
+        extract(self.filename, stream, DirectoryPointers=range(1, 22, 2))
+        self.assertEqual(stream.getvalue(), self.text)
+
+    def test_dependencies(self):
+        renumber, records, graph = self.extracted(EntityTypes={408})
+        self.assertEqual(renumber, {1: 1, 3: 3, 5: 5, 7: 7, 15: 9, 17: 11, 19: 13, 21: 15})
+        self.assertEqual([record.EntityType for record in records], [106, 122, 110, 110, 102, 308, 124, 408])
+        self.assertEqual(graph.references(15), [13, 11])
+        self.assertEqual(graph.references(11), [9, 3])
+        self.assertEqual(graph.dependencies(15), set(renumber.values()))
+        self.assertEqual(graph.dangling(), [])
+        self.assertEqual(records[-1].TransfrmMat, 13)
+        self.assertEqual([record.ParameterDataPointer for record in records], [1, 15, 16, 17, 18, 19, 20, 21])
+
+    def test_without_dependencies(self):
+        renumber, records, graph = self.extracted(EntityTypes={102, 110}, dependencies=False)
+        self.assertEqual(renumber, {5: 1, 7: 3, 9: 5, 11: 7, 13: 9, 15: 11})
+        self.assertEqual(graph.references(11), [1, 3])
+        renumber, records, graph = self.extracted(EntityTypes={308}, dependencies=False)
+        self.assertEqual(records[0].Parameters[3:], [0, 0])  # its entities were not copied
+
+
+def property_system():
+    """a line 1, a property 3 and a line 5 with the property in its back
+    pointer list"""
+    system = empty_system()
+    system.Commit(IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 0, 0)))
+    prop = IGESPropertyEntity([2, 0.5, 1], 15)
+    system.Commit(prop)
+    line = IGESGeomLine(IGESPoint(0, 0, 1), IGESPoint(1, 0, 1))
+    line.AddParameters([0, 1, prop.DirectoryDataPointer.data])
+    system.Commit(line)
+    return system
+
+
+class Test_back_pointers(unittest.TestCase):
+    def extracted(self, system, **kwargs):
+        filename = saved(save_text(system))
+        stream = io.StringIO()
+        try:
+            extract(filename, stream, **kwargs)
+        finally:
+            os.remove(filename)
+        filename = saved(stream.getvalue())
+        try:
+            with IGESReader(filename) as reader:
+                return list(reader)
+        finally:
+            os.remove(filename)
+
+    def test_renumbered(self):
+        records = self.extracted(property_system(), DirectoryPointers=[5])
+        self.assertEqual([record.EntityType for record in records], [406, 110])  # the property comes too
+        self.assertEqual(records[1].Parameters[6:], [0, 1, 1])
+        records = self.extracted(property_system(), EntityTypes={110})
+        self.assertEqual(records[2].Parameters[6:], [0, 1, 3])
+        records = self.extracted(property_system(), DirectoryPointers=[5], dependencies=False)
+        self.assertEqual(records[0].Parameters[6:], [0, 1, 0])  # the property was not copied
+
+    def test_unknown(self):
+        system = property_system()
+        view = IGESViewEntity([1, 1.0, 0, 0, 0, 0, 0, 0])
+        view.FormNumber = 1  # perspective views are not laid out
+        system.Commit(view)
+        self.assertRaisesRegex(ValueError, "entity", self.extracted, system, EntityTypes={410})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,9 +17,16 @@
 import unittest
 
 # Internal Modules
-from pyiges.IGESGeomLib import IGESPoint, IGESGeomPoint, IGESGeomCircle
+from pyiges.IGESGeomLib import (IGESPoint, IGESGeomPoint, IGESGeomCircle, IGESSplineCurve,
+                                IGESGeomLine, IGESGroup, IGESSingularSubfigureInstance,
+                                IGESGeomTransform, instance)
 import pyiges
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class Test_IGESGeomPoint(unittest.TestCase):
     def test_using_IGESPoint(self):
@@ -44,5 +51,70 @@ class Test_IGESGeomCircle(unittest.TestCase):
         circle = IGESGeomCircle(IGESPoint(0, 0, 0), IGESPoint(5, 5, 0))
         self.assertEqual(circle.ParameterData, [0, 0, 0, 5, 5, 5, 5], msg='IGESGeomCircle convert from [IGESPoint, IGESPoint] list fail')
 
+
+class Test_IGESSplineCurve(unittest.TestCase):
+    def test_addSegments(self):
+        polynominals = [[float(12 * i + j) for j in range(0, 12)] for i in range(0, 4)]
+        one_at_a_time = IGESSplineCurve(3, 1, 3)
+        for breakpoint, polynominal in enumerate(polynominals):
+            one_at_a_time.addSegment(breakpoint, polynominal)
+        all_at_once = IGESSplineCurve(3, 1, 3)
+        all_at_once.addSegments(range(0, 4), sum(polynominals, []))
+        self.assertEqual(all_at_once.ParameterData, one_at_a_time.ParameterData)
+
+
+class Test_instance(unittest.TestCase):
+    def setUp(self):
+        line = IGESGeomLine(IGESPoint(0, 0, 0), IGESPoint(1, 0, 0))
+        line.DirectoryDataPointer.data = 1
+        self.group = IGESGroup("part", line)
+        self.group.DirectoryDataPointer.data = 3
+
+    def test_group(self):
+        self.assertEqual(self.group.EntityType.getValue(), 308)
+        self.assertEqual(self.group.ParameterData, [0, "part", 1, 1])
+
+    def test_instance(self):
+        placed = IGESSingularSubfigureInstance(self.group, [1, 2, 3], 2.0)
+        self.assertEqual(placed.EntityType.getValue(), 408)
+        self.assertEqual(placed.ParameterData, [3, 1, 2, 3, 2.0])
+
+    def place(self, transforms):
+        entities = list()
+        for IGESObject in instance(self.group, transforms):
+            IGESObject.DirectoryDataPointer.data = 2 * len(entities) + 5
+            entities.append(IGESObject)
+        return entities
+
+    def test_translation_only(self):
+        entities = self.place([[1, 0, 0, 5, 0, 1, 0, 6, 0, 0, 1, 7]] * 3)
+        self.assertEqual(len(entities), 3)
+        self.assertEqual(entities[0].ParameterData, [3, 5, 6, 7, 1.0])
+        self.assertEqual(entities[0].TransfrmMat, 0)
+
+    def test_rotation(self):
+        entities = self.place([[[0, -1, 0, 5], [1, 0, 0, 6], [0, 0, 1, 7]]])
+        self.assertEqual([type(IGESObject) for IGESObject in entities],
+                         [IGESGeomTransform, IGESSingularSubfigureInstance])
+        self.assertEqual(entities[0].ParameterData, [0, -1, 0, 5, 1, 0, 0, 6, 0, 0, 1, 7])
+        self.assertEqual(entities[1].ParameterData, [3, 0, 0, 0, 1.0])
+        self.assertEqual(entities[1].TransfrmMat, 5)
+
+    def test_row_vectors(self):
+        columns = self.place([[[0, -1, 0, 5], [1, 0, 0, 6], [0, 0, 1, 7]]])
+        rows = self.place([[[0, 1, 0], [-1, 0, 0], [0, 0, 1], [5, 6, 7]]])
+        self.assertEqual(columns[0].ParameterData, rows[0].ParameterData)
+
+    def test_bad_placement(self):
+        self.assertRaises(TypeError, self.place, [[1, 2, 3]])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self):
+        transforms = numpy.tile(numpy.hstack([numpy.eye(3), [[5], [6], [7]]]), (4, 1, 1))
+        entities = self.place(transforms)
+        self.assertEqual(len(entities), 4)
+        self.assertEqual(entities[3].ParameterData, [3, 5.0, 6.0, 7.0, 1.0])
+
+
 if __name__ == '__main__':
     unittest.main()
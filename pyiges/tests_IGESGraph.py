@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESGraph
+   :platform: Agnostic, Windows
+   :synopsis: Main GUI program
+
+.. requires os (unittest)
+
+.. Created on Sun Oct 18 20:31:12 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+# External Libraries / Modules
+import os
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Internal Modules
+from pyiges.IGESGeomLib import (IGESGeomCompositeCurve, IGESGroup, instance, IGESPoint, IGESGeomPoint,
+                                IGESGeomArc, IGESGeomTorus, IGESGeomSphere, IGESGeomPlane, IGESCircularArray,
+                                IGESPropertyEntity, IGESViewEntity, IGESDrawingEntity, IGESRationalBSplineSurface,
+                                IGESSplineCurve, IGESTestSplineSurf, IGESVector)
+from pyiges.IGESCore import IGESItemData
+from pyiges.IGESGraph import IGESReferenceGraph, pointer_positions, record_references, references
+from pyiges.IGESReader import IGESReader
+from pyiges.tests_IGESCore import empty_system, save_text, scene
+from pyiges.tests_IGESReader import saved
+
+
+def linked_entities():
+    """the test scene (polyline 1, extrude 3 of it, lines 5 to 13), a
+    composite curve 15 of two lines, a subfigure 17 of the composite curve
+    and the extrude, and a rotated instance of it: transform 19, instance 21"""
+    entities = list()
+    for IGESObject in scene():  # committed one by one, the extrude needs the pointer of the polyline
+        yield IGESObject
+        entities.append(IGESObject)
+    composite = IGESGeomCompositeCurve(entities[2], entities[3])
+    yield composite
+    group = IGESGroup("part", composite, entities[1])
+    yield group
+    yield from instance(group, [[0, -1, 0, 5, 1, 0, 0, 0, 0, 0, 1, 0]])
+
+
+def linked_system(**kwargs):
+    system = empty_system(references=True, **kwargs)
+    system.commit_many(linked_entities())
+    return system
+
+
+class Test_references(unittest.TestCase):
+    def test_directory(self):
+        self.assertEqual(references(110, [0.] * 6, Level=-7, TransfrmMat=9, Color=3), [7, 9])
+
+    def test_parameters(self):
+        self.assertEqual(references(102, [2, 5, 7]), [5, 7])
+        self.assertEqual(references(144, [1, 1, 1, 3, 9, 11]), [1, 3, 9])
+        self.assertEqual(references(308, [0, "part", 2, 3, 5]), [3, 5])
+        self.assertEqual(references(408, [float('nan'), 1., 2., 3., 1.]), [])  # defaulted
+        self.assertEqual(references(110, [1, 3, 5, 7, 9, 11]), [])
+
+    def test_forms(self):
+        self.assertEqual(references(402, [2, 5, 7], FormNumber=1), [5, 7])
+        self.assertEqual(references(402, [1, 2, 3, 5, 7], FormNumber=9), [3, 5, 7])
+        self.assertEqual(references(402, [1, 1, 9, 1, 0, -3, 1, 7], FormNumber=4), [9, 7, 3])  # color negated
+        self.assertEqual(references(402, [1, 9, 0., 0., 0., 11, 2, 13], FormNumber=5), [9, 11, 13])
+        self.assertEqual(references(404, [1, 11, 0., 0., 1, 13]), [11, 13])
+        self.assertEqual(references(404, [1, 11, 0., 0., 90., 1, 13], FormNumber=1), [11, 13])
+        self.assertEqual(references(410, [1, 1., 3, 5, 7, 9, 11, 13]), [3, 5, 7, 9, 11, 13])
+        self.assertEqual(references(141, [1, 1, 3, 2, 5, 1, 1, 7, 9, 1, 0]), [3, 5, 7, 9])
+        self.assertEqual(references(143, [0, 3, 2, 5, 7]), [3, 5, 7])
+        self.assertEqual(references(212, [1, 3, 1., 1., -5, 0., 0., 0, 0., 0., 0., "abc"]), [5])
+
+    def test_back_pointers(self):
+        self.assertEqual(references(110, [0.] * 6 + [1, 15, 1, 17]), [15, 17])
+        self.assertEqual(references(110, [0.] * 6 + [0, 0]), [])
+        self.assertEqual(references(102, [1, 5, 0, 2, 7, 0]), [5, 7])
+        self.assertEqual(pointer_positions(102, [1, 5, 0, 2, 7, 0]), ([1, 4], []))
+        self.assertEqual(references(110, [0.] * 6 + [3, 1]), [])  # not back pointer lists, left out
+        self.assertRaises(ValueError, pointer_positions, 110, [0.] * 6 + [3, 1])
+        self.assertRaises(ValueError, pointer_positions, 110, [0.] * 6 + [0, 0, 1.])
+
+    def test_offset_curve(self):
+        """the 14 parameters of an offset curve, then its back pointer lists, read back from a file"""
+        system = empty_system()
+        arc = IGESGeomArc(0, IGESPoint(0, 0), IGESPoint(1, 0), IGESPoint(-1, 0))
+        prop = IGESPropertyEntity([2, 0.5, 1], 15)
+        system.commit_many([arc, prop])
+        offset = IGESItemData()
+        offset.EntityType.value = 130
+        offset.AddParameters([arc.DirectoryDataPointer.data, 1, 0, 0, 1, 0.5, 0., 0.5, 1., 0., 0., 1., 0.25, 0.75,
+                              0, 1, prop.DirectoryDataPointer.data])
+        system.Commit(offset)
+        filename = saved(save_text(system))
+        try:
+            with IGESReader(filename) as reader:
+                record = reader.get_entity(5)
+        finally:
+            os.remove(filename)
+        self.assertEqual(pointer_positions(130, record.Parameters), ([0, 16], []))  # no distance function
+        self.assertEqual(record_references(record), [1, 3])
+
+    def test_unknown(self):
+        self.assertEqual(references(5001, [3, 5]), [])
+        self.assertRaises(ValueError, pointer_positions, 5001, [3, 5])
+        self.assertRaises(ValueError, pointer_positions, 402, [1, 3], 21)
+        self.assertRaises(ValueError, pointer_positions, 410, [1, 1.], 1)
+
+    def test_library(self):
+        """the entities the library writes are laid out, without anything after them"""
+        point = IGESPoint(1, 2, 3)
+        spline = IGESSplineCurve(3, 2, 3)
+        spline.addSegments([0., 1.], [0.5] * 24)
+        entities = [IGESGeomPoint(point), IGESGeomArc(0, point, point, point),
+                    IGESGeomTorus(2, 1, point, IGESVector(0, 0, 1)), IGESGeomSphere(1, point),
+                    IGESPropertyEntity([2, 0.5, 1], 15), IGESViewEntity([1, 1.0, 0, 0, 0, 0, 0, 0]),
+                    IGESDrawingEntity([0, 0], 0), IGESRationalBSplineSurface(point, point, point, point),
+                    IGESTestSplineSurf(), spline] + list(linked_entities())
+        entities.append(IGESGeomPlane(entities[-3]))
+        entities.append(IGESCircularArray(entities[-4], 4, point, 1., 0., 1.))
+        for IGESObject in entities:
+            Parameters = IGESObject.GetParameters()
+            pointer_positions(Parameters[0], Parameters[1:], IGESObject.FormNumber)
+
+
+class Test_IGESReferenceGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = linked_system().reference_graph()
+
+    def test_rows(self):
+        self.assertEqual(len(self.graph), 11)
+        self.assertEqual(self.graph.references(3), [1])
+        self.assertEqual(self.graph.references(15), [5, 7])
+        self.assertEqual(self.graph.references(21), [19, 17])
+        self.assertEqual(self.graph.referenced_by(1), [3])
+        self.assertEqual(self.graph.referenced_by(15), [17])
+        self.assertEqual(self.graph.referenced_by(21), [])
+        self.assertRaises(IndexError, self.graph.references, 23)
+        self.assertRaises(IndexError, self.graph.referenced_by, 2)
+
+    def test_closures(self):
+        self.assertEqual(self.graph.dependencies(21), {21, 19, 17, 15, 5, 7, 3, 1})
+        self.assertEqual(self.graph.dependencies(9, 15), {9, 15, 5, 7})
+        self.assertEqual(self.graph.dependents(1), {1, 3, 17, 21})
+        self.assertEqual(self.graph.dependents(11), {11})
+
+    def test_dangling(self):
+        graph = IGESReferenceGraph()
+        graph.append([3])
+        graph.append([4, 1])
+        graph.append([99])
+        self.assertEqual(graph.dangling(), [3, 5])
+        self.assertEqual(graph.references(3), [1])
+        self.assertEqual(graph.dependents(1), {1, 3})
+
+    def test_storages(self):
+        for kwargs in (dict(deferred=True), dict(workers=2), dict(directory_table=True)):
+            graph = linked_system(**kwargs).reference_graph()
+            self.assertEqual((graph.offsets, graph.targets), (self.graph.offsets, self.graph.targets), msg=kwargs)
+        self.assertRaises(ValueError, empty_system().reference_graph)
+
+    def test_read(self):
+        filename = saved(save_text(linked_system()))
+        try:
+            with IGESReader(filename) as reader:
+                graphs = [IGESReferenceGraph.from_reader(reader)]
+                if numpy is not None:
+                    graphs.append(IGESReferenceGraph.from_arrays(reader.open_arrays(persist=False)))
+        finally:
+            os.remove(filename)
+        for graph in graphs:
+            self.assertEqual((graph.offsets, graph.targets), (self.graph.offsets, self.graph.targets))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESMerge
+   :platform: Agnostic, Windows
+   :synopsis: Main GUI program
+
+.. requires functools, io, os (unittest)
+
+.. Created on Sun Oct 18 21:31:06 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+# External Libraries / Modules
+import functools
+import io
+import os
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Internal Modules
+from pyiges.IGESGeomLib import IGESViewEntity
+from pyiges.IGESGraph import IGESReferenceGraph
+from pyiges.IGESMerge import _copy_file, _copy_file_arrays, merge, reconcile
+from pyiges.IGESReader import IGESReader
+from pyiges.tests_IGESCore import empty_system, save_text
+from pyiges.tests_IGESExtract import property_system
+from pyiges.tests_IGESGraph import linked_entities, linked_system
+from pyiges.tests_IGESReader import saved
+
+
+class Test_merge(unittest.TestCase):
+    def setUp(self):
+        self.text = save_text(linked_system())
+        self.filenames = [saved(self.text)]
+
+    def tearDown(self):
+        for filename in self.filenames:
+            os.remove(filename)
+
+    def merged(self, *texts):
+        """the directory pointer bases, entities, graph and global section of the merged file"""
+        self.filenames.extend(saved(text) for text in texts)
+        stream = io.StringIO()
+        bases = merge(self.filenames, stream)
+        filename = saved(stream.getvalue())
+        try:
+            with IGESReader(filename) as reader:
+                return bases, list(reader), IGESReferenceGraph.from_reader(reader), reader.GlobalSection
+        finally:
+            os.remove(filename)
+
+    def test_one(self):
+        stream = io.StringIO()
+        self.assertEqual(merge(self.filenames, stream), [0])
+        self.assertEqual(stream.getvalue(), self.text)
+
+    def test_rebased(self):
+        bases, records, graph, GlobalSection = self.merged(self.text, self.text)
+        self.assertEqual(bases, [0, 22, 44])
+        self.assertEqual(len(records), 33)
+        with IGESReader(self.filenames[0]) as reader:
+            single = list(reader)
+        for i, record in enumerate(records):
+            self.assertEqual(record.EntityType, single[i % 11].EntityType)
+            self.assertEqual(record.DirectoryPointer, 2 * i + 1)
+        self.assertEqual(records[-1].TransfrmMat, 19 + 44)
+        self.assertEqual(graph.references(21 + 22), [19 + 22, 17 + 22])
+        self.assertEqual(graph.dependencies(15 + 44), {15 + 44, 5 + 44, 7 + 44})
+        self.assertEqual(graph.dangling(), [])
+        self.assertEqual([record.Parameters for record in records[11:22] if record.EntityType == 110],
+                         [record.Parameters for record in single if record.EntityType == 110])
+        self.assertEqual(records[12].Parameters, [23, 0., 0., 25])  # the tabulated cylinder of the polyline 23
+
+    def test_delimiters(self):
+        system = empty_system()
+        system.GlobalSection.ParameterDelimiterCharacter = "/"
+        system.commit_many(linked_entities())
+        bases, records, graph, GlobalSection = self.merged(save_text(system))
+        self.assertEqual(GlobalSection.ParameterDelimiterCharacter, ",")
+        self.assertEqual([record.Parameters for record in records[:11] if record.EntityType == 106],
+                         [record.Parameters for record in records[11:] if record.EntityType == 106])
+        self.assertEqual(graph.references(21 + 22), [19 + 22, 17 + 22])
+
+    def test_back_pointers(self):
+        os.remove(self.filenames.pop())  # only the files with the property
+        text = save_text(property_system())
+        bases, records, graph, GlobalSection = self.merged(text, text)
+        self.assertEqual(bases, [0, 6])
+        self.assertEqual([record.Parameters[6:] for record in records if record.EntityType == 110],
+                         [[], [0, 1, 3], [], [0, 1, 9]])
+        self.assertEqual(graph.references(11), [9])
+
+    def test_unknown(self):
+        system = property_system()
+        view = IGESViewEntity([1, 1.0, 0, 0, 0, 0, 0, 0])
+        view.FormNumber = 1  # perspective views are not laid out
+        system.Commit(view)
+        self.assertRaisesRegex(ValueError, "entity", self.merged, save_text(system))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_blocks(self):
+        system = empty_system()
+        system.GlobalSection.ParameterDelimiterCharacter = "/"
+        system.commit_many(linked_entities())
+        self.filenames.append(saved(save_text(system)))
+        self.filenames.append(saved(save_text(property_system())))
+        with IGESReader(self.filenames[0]) as reader:
+            GlobalSection = reader.GlobalSection
+        for filename in self.filenames:
+            outputs = []
+            with IGESReader(filename) as reader:
+                for copy_file in (_copy_file, _copy_file_arrays, functools.partial(_copy_file_arrays, chunk_size=2)):
+                    directory, parameters = io.StringIO(), io.StringIO()
+                    counts = copy_file(reader, GlobalSection, 22, 25, directory, parameters)
+                    outputs.append((counts, directory.getvalue(), parameters.getvalue()))
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertEqual(outputs[0], outputs[2])
+            self.assertIn(outputs[0][0][0], (11, 3))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_chunks(self):
+        self.filenames.append(saved(save_text(property_system())))
+        self.filenames.append(saved(self.text))
+        merged = io.StringIO()
+        merge(self.filenames, merged)
+        for chunk_size in (1, 2, 4):
+            stream = io.StringIO()
+            self.assertEqual(merge(self.filenames, stream, chunk_size), [0, 22, 28])
+            self.assertEqual(stream.getvalue(), merged.getvalue(), msg=chunk_size)
+
+    def test_reconcile(self):
+        first, second = empty_system().GlobalSection, empty_system().GlobalSection
+        second.MaxCoordValue, second.MaxUserResolution = 5000., 0.01
+        merged = reconcile([first, second])
+        self.assertEqual((merged.MaxCoordValue, merged.MaxUserResolution), (5000., 0.0001))
+        self.assertEqual(first.MaxCoordValue, 1000.)
+        first.Units.UnitsFlag, first.Units.UnitsName = 1, "INCH"
+        second.Units.UnitsFlag, second.Units.UnitsName = 1, "IN"
+        self.assertEqual(reconcile([first, second]).Units.UnitsName, "INCH")
+        second.Units.UnitsFlag, second.Units.UnitsName = 2, "MM"
+        self.assertRaises(ValueError, reconcile, [first, second])
+        first.Units.UnitsFlag, first.Units.UnitsName = 3, "FT"
+        second.Units.UnitsFlag, second.Units.UnitsName = 3, "FT"
+        reconcile([first, second])
+        second.Units.UnitsName = "YD"
+        self.assertRaises(ValueError, reconcile, [first, second])
+        self.assertRaises(ValueError, merge, [], io.StringIO())
+
+
+if __name__ == '__main__':
+    unittest.main()
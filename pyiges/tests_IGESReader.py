@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. module:: IGES.IGESReader
+   :platform: Agnostic, Windows
+   :synopsis: Main GUI program
+
+.. requires glob, os, struct, tempfile (unittest)
+
+.. Created on Sun Oct 18 17:05:19 2026
+.. codeauthor::  Rod Persky <rodney.persky {removethis} AT gmail _DOT_ com>
+.. Licensed under the Academic Free License ("AFL") v. 3.0
+.. Source at https://github.com/Rod-Persky/pyIGES
+"""
+
+# External Libraries / Modules
+import glob
+import os
+import struct
+import tempfile
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Internal Modules
+from pyiges.IGESCore import DirectoryFields
+from pyiges.IGESReader import IGESReader, IGESIndex, IGESArrayModel, IGESParameterArrays, decode_parameter, decode_text
+from pyiges.IGESCompressed import split_parameters
+from pyiges.tests_IGESCore import empty_system, save_text
+from pyiges.tests_IGESCompressed import strings_entities, strings_system
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'docs', 'examples', 'benchmarks')
+
+
+def saved(text, newline="\n"):
+    """name of a temporary file holding text, the caller removes it"""
+    handle, filename = tempfile.mkstemp(suffix='.igs')
+    with os.fdopen(handle, 'w', newline=newline) as myFile:
+        myFile.write(text)
+    return filename
+
+
+class Test_decode(unittest.TestCase):
+    def test_decode_parameter(self):
+        self.assertEqual([decode_parameter(Parameter) for Parameter in ("", "7", "-3", "1.", "1.5D-3", "2E2", "3HA,B")],
+                         [None, 7, -3, 1.0, 1.5e-3, 200.0, "A,B"])
+
+    def test_decode_text(self):
+        for text in ("110,1.,,-2,0.5D1;", "406,3HA;B,2H  ,1.;", "212,1,,4H1,2;;"):
+            self.assertEqual(decode_text(text), [decode_parameter(Parameter) for Parameter in split_parameters(text)])
+
+
+class Test_IGESReader(unittest.TestCase):
+    def setUp(self):
+        self.system = empty_system()
+        self.entities = list(strings_entities())
+        self.system.commit_many(self.entities)
+        self.filename = saved(save_text(self.system))
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_global(self):
+        with IGESReader(self.filename) as reader:
+            self.assertEqual(reader.GlobalSection.FileName, self.system.GlobalSection.FileName)
+            self.assertEqual(reader.GlobalSection.Units.UnitsName, "MM")
+            self.assertEqual(reader.Global[:2], [",", ";"])
+            self.assertEqual(reader.RecordLength, 81)
+
+    def test_entities(self):
+        with IGESReader(self.filename) as reader:
+            entities = list(reader)
+        self.assertEqual(len(entities), len(self.entities))
+        for entity, IGESObject in zip(entities, self.entities):
+            self.assertEqual(entity.DirectoryPointer, IGESObject.DirectoryDataPointer.data)
+            self.assertEqual(entity.EntityType, IGESObject.EntityType.getValue())
+            self.assertEqual(len(entity.Parameters), len(IGESObject.ParameterData))
+            for read, written in zip(entity.Parameters, IGESObject.ParameterData):
+                if isinstance(written, float):
+                    self.assertAlmostEqual(read, written, places=12)  # reals are written to 15 digits
+                else:
+                    self.assertEqual(read, written)
+        self.assertEqual(entities[-1].Parameters, [3, "A,B;C", " ends in blanks  ", 2.5])
+
+    def test_directory(self):
+        with IGESReader(self.filename) as reader:
+            directory = list(reader.directory())
+            entities = list(reader)
+        self.assertEqual([(entry.EntityType, entry.ParameterDataPointer, entry.ParameterLineCount, entry.StatusNumber)
+                          for entry in directory],
+                         [(entity.EntityType, entity.ParameterDataPointer, entity.ParameterLineCount, entity.StatusNumber)
+                          for entity in entities])
+
+    def test_line_ends(self):
+        other = saved(save_text(self.system) + "\n\x1a", newline="\r\n")
+        try:
+            with IGESReader(self.filename) as reader, IGESReader(other) as crlf:
+                self.assertEqual(crlf.RecordLength, 82)
+                self.assertEqual([entity.Parameters for entity in crlf], [entity.Parameters for entity in reader])
+        finally:
+            os.remove(other)
+
+    @unittest.skipUnless(os.path.isdir(BENCHMARKS), "benchmark files are not available")
+    def test_benchmarks(self):
+        for filename in glob.glob(os.path.join(BENCHMARKS, '*', '*.igs')):
+            with IGESReader(filename) as reader:
+                entities = list(reader)
+                self.assertEqual(len(entities), len(list(reader.directory())), msg=filename)
+                self.assertTrue(all(entity.Parameters is not None for entity in entities))
+
+
+class Test_IGESIndex(unittest.TestCase):
+    def setUp(self):
+        self.filename = saved(save_text(strings_system()))
+        self.sidecar = self.filename + IGESIndex.Suffix
+
+    def tearDown(self):
+        for filename in (self.filename, self.sidecar):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_get_entity(self):
+        other = saved(save_text(strings_system()), newline="\r\n")
+        try:
+            for filename in (self.filename, other):
+                with IGESReader(filename) as reader:
+                    for entity in reversed(list(reader)):
+                        self.assertEqual(reader.get_entity(entity.DirectoryPointer).Parameters, entity.Parameters)
+                    self.assertRaises(IndexError, reader.get_entity, 2)
+                    self.assertRaises(IndexError, reader.get_entity, 2 * len(reader.open_index(persist=False)) + 1)
+        finally:
+            os.remove(other)
+
+    def test_scan_matches_fixed(self):
+        with IGESReader(self.filename) as reader, open(self.filename, 'rb') as handle:
+            index = IGESIndex.build(reader)
+            scanned = IGESIndex(*IGESIndex._scan(reader, handle), None)
+        for column in ('Directory', 'ParameterStart', 'ParameterEnd'):
+            self.assertEqual(getattr(scanned, column), getattr(index, column))
+
+    def test_persist(self):
+        with IGESReader(self.filename) as reader:
+            index = reader.open_index()
+        self.assertTrue(os.path.exists(self.sidecar))
+        loaded = IGESIndex.load(self.sidecar, self.filename)
+        self.assertEqual(loaded.ParameterStart, index.ParameterStart)
+
+        with open(self.filename, 'a') as myFile:  # the file changes, the index is stale
+            myFile.write("\n")
+        self.assertIsNone(IGESIndex.load(self.sidecar, self.filename))
+        with IGESReader(self.filename) as reader:
+            reader.open_index()
+            self.assertEqual(reader.get_entity(1).EntityType, 106)
+        self.assertIsNotNone(IGESIndex.load(self.sidecar, self.filename))
+
+    def test_not_saved(self):
+        os.mkdir(self.sidecar)  # the index can not be written there
+        try:
+            with IGESReader(self.filename) as reader:
+                self.assertEqual(len(reader.open_index()), len(list(reader.directory())))
+                self.assertEqual(reader.get_entity(1).EntityType, 106)
+        finally:
+            os.rmdir(self.sidecar)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class Test_read_directory(unittest.TestCase):
+    def setUp(self):
+        self.text = save_text(strings_system())
+
+    def read(self, text, newline="\n"):
+        filename = saved(text, newline)
+        try:
+            with IGESReader(filename) as reader:
+                return reader.read_directory(), list(reader.directory())
+        finally:
+            os.remove(filename)
+
+    def assertMatches(self, directory, entries):
+        self.assertEqual(directory['DirectoryPointer'].tolist(), [entry.DirectoryPointer for entry in entries])
+        for name in DirectoryFields:
+            read = directory[name].tolist()
+            if name == 'EntityLabel':
+                read = [label.decode('latin-1') for label in read]
+            self.assertEqual(read, [getattr(entry, name) for entry in entries], msg=name)
+
+    def test_matches_directory(self):
+        for newline in ("\n", "\r\n"):
+            self.assertMatches(*self.read(self.text, newline))
+
+    def test_odd_fields(self):
+        lines = self.text.split("\n")
+        first = lines.index(next(line for line in lines if line[72:73] == "D"))
+        fields = ["-3".rjust(8), "5".ljust(8), "", "x".rjust(8), "LABEL".rjust(8)]
+        lines[first] = lines[first][:16] + fields[0] + fields[1] + lines[first][32:]
+        lines[first + 1] = lines[first + 1][:8] + fields[2].ljust(8) + fields[3] + lines[first + 1][24:56] + \
+            fields[4] + lines[first + 1][64:]
+        directory, entries = self.read("\n".join(lines))
+        self.assertMatches(directory, entries)
+        self.assertEqual(directory[0]['Structure'], -3)
+        self.assertEqual(directory[0]['EntityLabel'], b"LABEL")
+
+    def test_sequence(self):
+        lines = self.text.split("\n")
+        first = lines.index(next(line for line in lines if line[72:73] == "D"))
+        lines[first + 3] = lines[first + 3][:73] + "%7d" % 5
+        filename = saved("\n".join(lines))
+        try:
+            with IGESReader(filename) as reader:
+                self.assertRaises(ValueError, reader.read_directory)
+        finally:
+            os.remove(filename)
+
+    @unittest.skipUnless(os.path.isdir(BENCHMARKS), "benchmark files are not available")
+    def test_benchmarks(self):
+        for filename in glob.glob(os.path.join(BENCHMARKS, '*', '*.igs')):
+            with IGESReader(filename) as reader:
+                self.assertMatches(reader.read_directory(), list(reader.directory()))
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class Test_read_parameters(unittest.TestCase):
+    def setUp(self):
+        self.filename = saved(save_text(strings_system()))
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_matches_entities(self):
+        with IGESReader(self.filename) as reader:
+            entities = list(reader)
+            arrays = reader.read_parameters(chunks=3)
+        self.assertEqual(arrays.DirectoryPointers.tolist(), [entity.DirectoryPointer for entity in entities])
+        self.assertEqual([arrays.entity(i) for i in range(0, len(arrays))], [entity.Parameters for entity in entities])
+        self.assertEqual(arrays.kinds[arrays.offsets[-2] + 1], IGESParameterArrays.String)
+
+    def test_workers(self):
+        with IGESReader(self.filename) as reader:
+            serial = reader.read_parameters()
+            parallel = reader.read_parameters(workers=2)
+        for column in ('DirectoryPointers', 'offsets', 'kinds'):
+            self.assertEqual(getattr(parallel, column).tolist(), getattr(serial, column).tolist())
+        numpy.testing.assert_array_equal(parallel.values, serial.values)
+        self.assertEqual(parallel.strings, serial.strings)
+
+    def test_fortran_exponents(self):
+        text = save_text(strings_system())
+        with IGESReader(self.filename) as reader:
+            entity = next(iter(reader))
+        record = text.split("\n")[sum(reader.counts[section] for section in "SGD")]
+        written = record[:64].rstrip().replace(",0.25,", ",2.5D-1,").replace(",10,", ",1.D1,", 1)
+        other = saved(text.replace(record, written.ljust(64) + record[64:]))
+        try:
+            with IGESReader(other) as reader:
+                arrays = reader.read_parameters()
+        finally:
+            os.remove(other)
+        self.assertEqual(arrays.entity(0)[:6], [2, 40, 0.0, 0.0, 10.0, 0.25])
+        self.assertEqual(arrays.entity(0)[6:], entity.Parameters[6:])
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class Test_IGESArrayModel(unittest.TestCase):
+    def setUp(self):
+        self.filename = saved(save_text(strings_system()))
+        self.sidecar = self.filename + IGESArrayModel.Suffix
+
+    def tearDown(self):
+        for filename in (self.filename, self.sidecar):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def assertSameModel(self, model, other):
+        self.assertEqual(model.directory.tolist(), other.directory.tolist())
+        for column in ('DirectoryPointers', 'offsets', 'kinds'):
+            self.assertEqual(getattr(model.parameters, column).tolist(), getattr(other.parameters, column).tolist())
+        numpy.testing.assert_array_equal(model.parameters.values, other.parameters.values)
+        self.assertEqual(model.parameters.strings, other.parameters.strings)
+
+    def test_persist(self):
+        with IGESReader(self.filename) as reader:
+            reader.open_arrays(persist=False)
+            self.assertFalse(os.path.exists(self.sidecar))
+            model = reader.open_arrays()
+            self.assertTrue(os.path.exists(self.sidecar))
+            loaded = IGESArrayModel.load(self.sidecar, model.digest)
+            self.assertFalse(loaded.parameters.values.flags.writeable)  # mapped read only
+            self.assertSameModel(loaded, model)
+            self.assertSameModel(reader.open_arrays(), model)
+            self.assertEqual(loaded.parameters.entity(len(loaded) - 1), [3, "A,B;C", " ends in blanks  ", 2.5])
+
+    def test_not_persisted(self):
+        with IGESReader(self.filename) as reader:
+            self.assertIsNone(reader.open_arrays(persist=False).digest, msg='hashed without persist')
+            os.mkdir(self.sidecar)  # the model can not be written there
+            try:
+                self.assertSameModel(reader.open_arrays(), reader.open_arrays(persist=False))
+            finally:
+                os.rmdir(self.sidecar)
+        self.assertFalse(os.path.exists(self.sidecar + ".tmp"))
+
+    def test_stale(self):
+        with IGESReader(self.filename) as reader:
+            model = reader.open_arrays()
+        with open(self.filename, 'r+b') as myFile:  # other content of the same size
+            text = myFile.read()
+            myFile.seek(0)
+            myFile.write(text.replace(b"0.25,", b"0.75,", 1))
+        digest = IGESArrayModel.file_digest(self.filename)
+        self.assertIsNone(IGESArrayModel.load(self.sidecar, digest))
+        with IGESReader(self.filename) as reader:
+            rebuilt = reader.open_arrays()
+        self.assertNotEqual(rebuilt.digest, model.digest)
+        self.assertEqual(rebuilt.parameters.entity(0)[5], 0.75)
+        self.assertIsNotNone(IGESArrayModel.load(self.sidecar, digest))
+
+    def test_version(self):
+        with IGESReader(self.filename) as reader:
+            model = reader.open_arrays()
+        with open(self.sidecar, 'r+b') as myFile:
+            myFile.seek(len(IGESArrayModel.Magic))
+            myFile.write(struct.pack("<I", IGESArrayModel.Version + 1))
+        self.assertIsNone(IGESArrayModel.load(self.sidecar, model.digest))
+
+
+if __name__ == '__main__':
+    unittest.main()